@@ -1,10 +1,13 @@
 from typing import Dict, List, Union, Optional, Any, TypeVar, Callable
-from flask import Flask, jsonify, request, Response, current_app, send_from_directory
+from flask import Flask, jsonify, request, Response, current_app, send_from_directory, stream_with_context, g, has_request_context
+from flask.json.provider import DefaultJSONProvider
+from flask.logging import default_handler
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session as FlaskSession
 from flask_cors import CORS
 from flask_bcrypt import Bcrypt
 from flask_migrate import Migrate
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import os
 import uuid
 import jwt
@@ -12,13 +15,45 @@ from functools import wraps
 import json
 import re
 import base64
+import hashlib
+import secrets
 from werkzeug.security import generate_password_hash, check_password_hash
 import random
-import google.generativeai as genai
-from google.generativeai import types as genai_types
 import requests
 from dotenv import load_dotenv
-from sqlalchemy import or_, and_
+from sqlalchemy import or_, and_, event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+from collections import OrderedDict
+from itertools import chain, islice
+import threading
+import time
+import heapq
+import logging
+import logging.handlers
+import queue
+import sys
+import atexit
+import bisect
+import tempfile
+import sqlite3
+import zlib
+import csv
+import io
+from collections import Counter
+from contextlib import contextmanager, suppress
+from concurrent.futures import Future
+
+try:
+    import brotli
+except ImportError:  # Optional: responses are then only gzip-compressed
+    brotli = None
+try:
+    import orjson
+except ImportError:  # Optional: JSON is then encoded by the standard library
+    orjson = None
 
 # Load environment variables from .env file
 load_dotenv()  # This loads the .env file into os.environ
@@ -44,20 +79,519 @@ app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get(
     'sqlite:///' + os.path.join(os.path.abspath(os.path.dirname(__file__)), 'app.db')
 )
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-db = SQLAlchemy(app)
+
+# Connection pool per process (forked workers start with an empty one, see
+# reset_after_fork). Size it to the threads that may query at once.
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': int(os.environ.get('DB_POOL_SIZE', '10')),
+    'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', '10')),
+    'pool_timeout': float(os.environ.get('DB_POOL_TIMEOUT', '30'))
+}
+if app.config['SQLALCHEMY_DATABASE_URI'] in ('sqlite://', 'sqlite:///:memory:'):
+    # In-memory SQLite keeps one connection per thread; there is no pool to size
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {}
+elif not app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+    app.config['SQLALCHEMY_ENGINE_OPTIONS']['pool_pre_ping'] = True
+
+# SQLite pragmas applied to every new connection; SQLITE_TUNING=false keeps
+# SQLite's defaults. WAL lets readers run alongside the single writer, and
+# busy_timeout makes writers queue for the lock instead of failing at once.
+app.config['SQLITE_TUNING'] = os.environ.get('SQLITE_TUNING', 'true').lower() != 'false'
+app.config['SQLITE_PRAGMAS'] = {
+    'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', '10000')),
+    'journal_mode': os.environ.get('SQLITE_JOURNAL_MODE', 'WAL'),
+    # Durable across application crashes; only an OS crash or power loss
+    # can roll back the last transactions
+    'synchronous': os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL'),
+    'cache_size': -int(os.environ.get('SQLITE_CACHE_KB', '65536')),
+    'mmap_size': int(os.environ.get('SQLITE_MMAP_BYTES', str(256 * 1024 * 1024))),
+    'temp_store': 'MEMORY'
+}
+
+@event.listens_for(Engine, 'connect')
+def apply_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    if not isinstance(dbapi_connection, sqlite3.Connection) or not app.config['SQLITE_TUNING']:
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma, value in app.config['SQLITE_PRAGMAS'].items():
+            cursor.execute(f'PRAGMA {pragma} = {value}')
+    finally:
+        cursor.close()
+
+# Group commit (opt-in): POST /api/eye-gaze, /api/messages and /api/files
+# hand their inserts to a per-process writer thread that commits them
+# together, once GROUP_COMMIT_MAX_ROWS are queued or GROUP_COMMIT_WINDOW_MS
+# after the first one arrived. A longer window means fewer commits but
+# slower responses; the request still only returns once its row is committed.
+app.config['GROUP_COMMIT'] = os.environ.get('GROUP_COMMIT', 'false').lower() == 'true'
+app.config['GROUP_COMMIT_WINDOW_MS'] = float(os.environ.get('GROUP_COMMIT_WINDOW_MS', '5'))
+app.config['GROUP_COMMIT_MAX_ROWS'] = int(os.environ.get('GROUP_COMMIT_MAX_ROWS', '100'))
+app.config['GROUP_COMMIT_TIMEOUT'] = float(os.environ.get('GROUP_COMMIT_TIMEOUT', '30'))
+
+# Read replicas: DATABASE_REPLICA_URLS (comma-separated) adds one bind per
+# replica. Reads made while serving GET/HEAD requests go to a replica;
+# writes and everything outside a request go to the primary. After a write,
+# the client reads from the primary for REPLICA_STICKY_SECONDS so it sees its
+# own changes despite replication lag.
+app.config['DATABASE_REPLICA_URLS'] = [url.strip() for url in os.environ.get('DATABASE_REPLICA_URLS', '').split(',') if url.strip()]
+app.config['REPLICA_STICKY_SECONDS'] = float(os.environ.get('REPLICA_STICKY_SECONDS', '10'))
+REPLICA_BIND_KEYS = [f'replica{i}' for i in range(len(app.config['DATABASE_REPLICA_URLS']))]
+app.config['SQLALCHEMY_BINDS'] = dict(zip(REPLICA_BIND_KEYS, app.config['DATABASE_REPLICA_URLS']))
+READ_METHODS = ('GET', 'HEAD')
+READ_PRIMARY_COOKIE = 'read_primary_until'
+
+# user id -> time.time() until which the user's reads go to the primary; the
+# cookie covers other worker processes, this covers clients without cookies
+primary_readers: Dict[str, float] = {}
+
+def reads_from_primary() -> bool:
+    """Whether the current request must read from the primary to see the caller's own writes."""
+    now = time.time()
+    with suppress(ValueError):
+        if float(request.cookies.get(READ_PRIMARY_COOKIE, 0)) > now:
+            return True
+    user_id = g.get('current_user_id')
+    return user_id is not None and primary_readers.get(user_id, 0) > now
+
+def reads_from_replica() -> bool:
+    """Whether the current request's reads are routed to a replica."""
+    return bool(REPLICA_BIND_KEYS) and request.method in READ_METHODS and not reads_from_primary()
+
+class RoutingSession(FlaskSession):
+    """
+    Session that sends reads made while serving GET/HEAD requests to a
+    replica. Flushes and ORM insert/update/delete statements go to the
+    primary, and so does everything after them in the same session, so a
+    handler never reads around its own writes.
+    """
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, bind: Any = None, **kwargs: Any) -> Any:
+        if bind is None and REPLICA_BIND_KEYS and not self.info.get('pinned_primary'):
+            if self._flushing or isinstance(clause, UpdateBase):
+                self.info['pinned_primary'] = True
+            elif has_request_context() and reads_from_replica():
+                return self._db.engines[random.choice(REPLICA_BIND_KEYS)]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+db = SQLAlchemy(app, session_options={'class_': RoutingSession})
+
+@app.after_request
+def stick_to_primary(response: Response) -> Response:
+    if REPLICA_BIND_KEYS and request.method not in READ_METHODS + ('OPTIONS',) and response.status_code < 400:
+        window = app.config['REPLICA_STICKY_SECONDS']
+        until = time.time() + window
+        if g.get('current_user_id'):
+            primary_readers[g.current_user_id] = until
+        response.set_cookie(READ_PRIMARY_COOKIE, f'{until:.3f}', max_age=int(window) + 1, httponly=True, samesite='Lax')
+    return response
+
 bcrypt = Bcrypt(app)
 migrate = Migrate(app, db)
 
 # Enable CORS with proper configuration
-CORS(app, resources={r"/*": {
+CORS_SETTINGS = {
     "origins": "http://localhost:5173",
     "supports_credentials": True,
-    "allow_headers": ["Authorization", "Content-Type", "authorization", "content-type"],
-    "methods": ["GET", "POST", "PUT", "DELETE"]
-}})
+    "allow_headers": ["Authorization", "Content-Type", "authorization", "content-type", "X-Profile"],
+    "methods": ["GET", "POST", "PUT", "DELETE"],
+    "expose_headers": ["X-Total-Count", "X-Page", "X-Per-Page", "X-Next-Cursor", "X-Request-ID", "X-Profile-Id"]
+}
+CORS(app, resources={r"/*": CORS_SETTINGS})
 
 # Custom type for route return
-RouteReturn = Union[Response, tuple[Response, int]]
+RouteReturn = Union[Response, tuple[Response, int], tuple[Response, int, Dict[str, str]]]
+
+# Attributes every LogRecord has; anything else was passed through `extra`
+LOG_RECORD_ATTRIBUTES = frozenset(logging.makeLogRecord({}).__dict__) | {'message', 'asctime', 'request_id'}
+
+class JsonLogFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including `extra` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.utcfromtimestamp(record.created).isoformat(timespec='milliseconds') + 'Z',
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        if getattr(record, 'request_id', None):
+            entry['requestId'] = record.request_id
+        for key, value in record.__dict__.items():
+            if key not in LOG_RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+class RequestLogHandler(logging.handlers.QueueHandler):
+    """
+    Hand records to the background writer with as little work as possible on
+    the request thread: the request id is attached and the message and any
+    traceback are rendered (so nothing request-scoped crosses threads), but
+    JSON formatting and I/O happen on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Outside a Flask request (asgi.py) an id may come in through `extra`
+        if has_request_context():
+            record.request_id = g.get('request_id')
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+def configure_logging(flask_app: Flask, stream: Any = None) -> logging.handlers.QueueListener:
+    """
+    Route the app's logs through a queue to a background thread writing JSON
+    lines, so a slow stdout or disk never stalls a request. The level comes
+    from LOG_LEVEL (default INFO); disabled levels cost a single level check.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonLogFormatter())
+    listener = logging.handlers.QueueListener(log_queue, output)
+    listener.start()
+    atexit.register(listener.stop)
+
+    flask_app.logger.removeHandler(default_handler)
+    for handler in list(flask_app.logger.handlers):
+        if isinstance(handler, RequestLogHandler):
+            flask_app.logger.removeHandler(handler)
+    flask_app.logger.addHandler(RequestLogHandler(log_queue))
+    flask_app.logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+    flask_app.logger.propagate = False
+    return listener
+
+log_listener = configure_logging(app)
+
+def reset_after_fork() -> None:
+    """
+    Make a forked worker process safe to serve requests (gunicorn with
+    preload_app, multiprocessing). Pooled connections inherited from the
+    parent must not be shared between processes, so the pool is dropped
+    without closing the parent's connections, and the log and group commit
+    writer threads, which do not survive fork, are replaced.
+    """
+    global log_listener, group_writer
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+    atexit.unregister(log_listener.stop)
+    log_listener = configure_logging(app)
+    # The parent's writer thread is gone too; the next write starts a new one
+    group_writer = None
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=reset_after_fork)
+
+@app.before_request
+def assign_request_id() -> None:
+    # Reuse an id from a proxy so log lines can be correlated across services
+    g.request_id = request.headers.get('X-Request-ID') or uuid.uuid4().hex
+
+@app.after_request
+def expose_request_id(response: Response) -> Response:
+    if 'request_id' in g:
+        response.headers['X-Request-ID'] = g.request_id
+    return response
+
+# Metrics are on unless METRICS_ENABLED=false; METRICS_TOKEN, if set, guards /metrics
+app.config['METRICS_ENABLED'] = os.environ.get('METRICS_ENABLED', 'true').lower() != 'false'
+app.config['METRICS_TOKEN'] = os.environ.get('METRICS_TOKEN')
+
+def metric_label(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+class Metric:
+    """
+    A labelled counter or histogram rendered in the Prometheus text format.
+
+    Values are kept per process; with several workers each one exposes its own.
+    """
+
+    def __init__(self, name: str, help_text: str, labels: tuple, buckets: Optional[tuple] = None) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.buckets = buckets
+        self._values: Dict[tuple, Any] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: Any, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def observe(self, value: float, *label_values: Any) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(label_values)
+            if series is None:
+                # Per-bucket counts (plus +Inf), sum
+                series = self._values[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def render(self) -> List[str]:
+        kind = 'counter' if self.buckets is None else 'histogram'
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} {kind}']
+        with self._lock:
+            values = [(key, value if self.buckets is None else ([*value[0]], value[1]))
+                      for key, value in self._values.items()]
+        for label_values, value in sorted(values, key=lambda item: tuple(map(str, item[0]))):
+            labels = ','.join(f'{name}="{metric_label(label)}"' for name, label in zip(self.labels, label_values))
+            if self.buckets is None:
+                lines.append(f'{self.name}{{{labels}}} {value}')
+                continue
+            counts, total = value
+            prefix = labels + ',' if labels else ''
+            cumulative = 0
+            for bound, count in zip((*self.buckets, '+Inf'), counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+            lines.append(f'{self.name}_sum{{{labels}}} {total}')
+            lines.append(f'{self.name}_count{{{labels}}} {cumulative}')
+        return lines
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (128, 512, 2048, 8192, 32768, 131072, 524288, 2097152, 8388608)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 500)
+
+REQUEST_SECONDS = Metric('http_request_duration_seconds', 'Request latency by route.',
+                         ('method', 'route', 'status'), LATENCY_BUCKETS)
+REQUEST_BYTES = Metric('http_request_size_bytes', 'Request body size by route.',
+                       ('method', 'route'), SIZE_BUCKETS)
+RESPONSE_BYTES = Metric('http_response_size_bytes', 'Response body size by route; streamed bodies are not counted.',
+                        ('method', 'route'), SIZE_BUCKETS)
+REQUEST_STATEMENTS = Metric('db_statements_per_request', 'SQL statements issued per request.',
+                            ('method', 'route'), STATEMENT_BUCKETS)
+DB_STATEMENTS = Metric('db_statements_total', 'SQL statements executed, by route.', ('route',))
+DB_STATEMENT_SECONDS = Metric('db_statement_seconds_total', 'Time spent executing SQL, by route.', ('route',))
+OUTBOUND_SECONDS = Metric('outbound_request_duration_seconds', 'Latency of calls to external services.',
+                          ('service', 'outcome'), LATENCY_BUCKETS)
+GROUP_COMMIT_ROWS = Metric('group_commit_batch_rows', 'Writes committed together by the group commit writer.',
+                           (), (1, 2, 5, 10, 20, 50, 100, 200, 500))
+METRICS = (REQUEST_SECONDS, REQUEST_BYTES, RESPONSE_BYTES, REQUEST_STATEMENTS,
+           DB_STATEMENTS, DB_STATEMENT_SECONDS, OUTBOUND_SECONDS, GROUP_COMMIT_ROWS)
+
+def metrics_route() -> str:
+    # The rule template, not the path, so IDs don't create a series each
+    return request.url_rule.rule if request.url_rule is not None else '<unmatched>'
+
+@contextmanager
+def track_outbound(service: str) -> Any:
+    """Time a call to an external service, e.g. `with track_outbound('gemini'): ...`."""
+    start = time.perf_counter()
+    outcome = 'error'
+    try:
+        yield
+        outcome = 'ok'
+    finally:
+        OUTBOUND_SECONDS.observe(time.perf_counter() - start, service, outcome)
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def start_statement_timer(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    if app.config['METRICS_ENABLED'] or (has_request_context() and 'profile' in g):
+        conn.info.setdefault('statement_started', []).append(time.perf_counter())
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def record_statement(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    started = conn.info.get('statement_started')
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    if not has_request_context():
+        DB_STATEMENTS.inc('<background>')
+        DB_STATEMENT_SECONDS.inc('<background>', amount=elapsed)
+        return
+    # Tallied per request and published once in record_request_metrics
+    stats = g.get('db_stats')
+    if stats is not None:
+        stats[0] += 1
+        stats[1] += elapsed
+    profile = g.get('profile')
+    if profile is not None:
+        profile.record_statement(statement, elapsed)
+
+@event.listens_for(Engine, 'handle_error')
+def discard_statement_timer(exception_context: Any) -> None:
+    connection = exception_context.connection
+    if connection is not None and connection.info.get('statement_started'):
+        connection.info['statement_started'].pop()
+
+@app.before_request
+def start_request_metrics() -> None:
+    if app.config['METRICS_ENABLED']:
+        g.request_started = time.perf_counter()
+        # Statement count, statement seconds
+        g.db_stats = [0, 0.0]
+
+@app.after_request
+def record_request_metrics(response: Response) -> Response:
+    started = g.get('request_started')
+    if started is None:
+        return response
+    method = request.method
+    route = metrics_route()
+    stats = g.db_stats
+    REQUEST_BYTES.observe(request.content_length or 0, method, route)
+
+    def observe() -> None:
+        REQUEST_SECONDS.observe(time.perf_counter() - started, method, route, response.status_code)
+        REQUEST_STATEMENTS.observe(stats[0], method, route)
+        if stats[0]:
+            DB_STATEMENTS.inc(route, amount=stats[0])
+            DB_STATEMENT_SECONDS.inc(route, amount=stats[1])
+
+    if response.is_streamed:
+        # Only finished once the server has sent the whole body
+        response.call_on_close(observe)
+    else:
+        RESPONSE_BYTES.observe(response.calculate_content_length() or 0, method, route)
+        observe()
+    return response
+
+@app.route('/metrics', methods=['GET'])
+def metrics() -> RouteReturn:
+    """Expose request, database and outbound call metrics in the Prometheus text format."""
+    token = app.config['METRICS_TOKEN']
+    if token and request.headers.get('Authorization') != f'Bearer {token}':
+        return jsonify({'error': 'Invalid token'}), 401
+    lines = [line for metric in METRICS for line in metric.render()]
+    return Response('\n'.join(lines) + '\n', mimetype='text/plain; version=0.0.4')
+
+# Profiling is per request: admins listed in PROFILER_ADMINS (user IDs) can
+# send X-Profile: 1, and PROFILER_SAMPLE_RATE profiles a fraction of traffic
+app.config['PROFILER_ADMINS'] = set(filter(None, os.environ.get('PROFILER_ADMINS', '').split(',')))
+app.config['PROFILER_SAMPLE_RATE'] = float(os.environ.get('PROFILER_SAMPLE_RATE', '0'))
+app.config['PROFILER_INTERVAL'] = float(os.environ.get('PROFILER_INTERVAL_MS', '5')) / 1000
+app.config['PROFILER_DIR'] = os.environ.get('PROFILER_DIR', os.path.join(tempfile.gettempdir(), 'team-dashboard-profiles'))
+app.config['PROFILER_KEEP'] = int(os.environ.get('PROFILER_KEEP', '50'))
+
+class RequestProfiler:
+    """
+    Sample one request thread's Python stack on a background thread and
+    collect the SQL it runs, then write both as collapsed stacks (one
+    `frame;frame;... count` line per distinct stack), the input format of
+    flamegraph.pl and speedscope.
+
+    Counts are weighted in microseconds and SQL statements appear under a
+    synthetic `SQL` root with their measured time, so database time is
+    comparable to Python time.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.thread_id = threading.get_ident()
+        self.stacks: Counter = Counter()
+        self.statements: List[tuple] = []
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._run, name='request-profiler', daemon=True)
+        self.started = time.perf_counter()
+
+    def start(self) -> None:
+        self._sampler.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})')
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def record_statement(self, statement: str, elapsed: float) -> None:
+        self.statements.append((' '.join(statement.split())[:200], elapsed))
+
+    def stop(self) -> float:
+        self._stop.set()
+        self._sampler.join()
+        return time.perf_counter() - self.started
+
+    def collapsed(self) -> str:
+        # Weights are microseconds: samples times the interval, or SQL time
+        interval_us = round(self.interval * 1e6)
+        stacks = Counter({stack: count * interval_us for stack, count in self.stacks.items()})
+        for statement, elapsed in self.statements:
+            stacks['SQL;' + statement.replace(';', ',')] += max(1, round(elapsed * 1e6))
+        return ''.join(f'{stack} {count}\n' for stack, count in stacks.most_common())
+
+def profile_requested() -> bool:
+    if request.headers.get('X-Profile') == '1' and app.config['PROFILER_ADMINS']:
+        header = request.headers.get('Authorization', '')
+        try:
+            data = jwt.decode(header.split()[-1], app.config['SECRET_KEY'], algorithms=['HS256'])
+        except (IndexError, jwt.InvalidTokenError):
+            return False
+        return data.get('scope') is None and data.get('user_id') in app.config['PROFILER_ADMINS']
+    rate = app.config['PROFILER_SAMPLE_RATE']
+    return rate > 0 and random.random() < rate
+
+def save_profile(profile: RequestProfiler, meta: Dict[str, Any]) -> None:
+    """Write a capture as <id>.collapsed plus <id>.json, keeping the newest PROFILER_KEEP."""
+    directory = app.config['PROFILER_DIR']
+    os.makedirs(directory, exist_ok=True)
+    capture_id = meta['id']
+    with open(os.path.join(directory, f'{capture_id}.collapsed'), 'w') as f:
+        f.write(profile.collapsed())
+    with open(os.path.join(directory, f'{capture_id}.json'), 'w') as f:
+        json.dump(meta, f)
+    captures = sorted(name for name in os.listdir(directory) if name.endswith('.json'))
+    for name in captures[:-app.config['PROFILER_KEEP']]:
+        for suffix in ('.json', '.collapsed'):
+            with suppress(FileNotFoundError):
+                os.remove(os.path.join(directory, name[:-5] + suffix))
+
+@app.before_request
+def start_profiler() -> None:
+    if profile_requested():
+        g.profile = RequestProfiler(app.config['PROFILER_INTERVAL'])
+        g.profile.start()
+
+@app.after_request
+def finish_profiler(response: Response) -> Response:
+    profile = g.pop('profile', None)
+    if profile is None:
+        return response
+    # Sortable by time, unique per request
+    capture_id = f"{datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')}-{uuid.uuid4().hex[:6]}"
+    meta = {
+        'id': capture_id,
+        'method': request.method,
+        'path': request.path,
+        'route': metrics_route(),
+        'requestId': g.get('request_id'),
+        'capturedAt': datetime.utcnow().isoformat()
+    }
+
+    def finish() -> None:
+        meta['durationMs'] = round(profile.stop() * 1000, 3)
+        meta['status'] = response.status_code
+        meta['samples'] = sum(profile.stacks.values())
+        meta['sqlStatements'] = len(profile.statements)
+        meta['sqlMs'] = round(sum(elapsed for _, elapsed in profile.statements) * 1000, 3)
+        meta['slowestSql'] = [
+            {'statement': statement, 'ms': round(elapsed * 1000, 3)}
+            for statement, elapsed in sorted(profile.statements, key=lambda item: -item[1])[:10]
+        ]
+        try:
+            save_profile(profile, meta)
+        except OSError as e:
+            app.logger.error(f"Error saving profile {capture_id}: {e}")
+
+    response.headers['X-Profile-Id'] = capture_id
+    if response.is_streamed:
+        response.call_on_close(finish)
+    else:
+        finish()
+    return response
 
 # Helper function for JSON columns
 def json_column_to_list(data):
@@ -199,6 +733,8 @@ class User(db.Model):
     password_hash: str = db.Column(db.String(128), nullable=False)
     is_online: bool = db.Column(db.Boolean, default=False)
     avatar: Optional[str] = db.Column(db.String(200))
+    # Embedded in calendar feed tokens; replacing it revokes every issued feed URL
+    calendar_feed_secret: Optional[str] = db.Column(db.String(64), nullable=True)
 
     def set_password(self, password: str) -> None:
         self.password_hash = bcrypt.generate_password_hash(password).decode('utf-8')
@@ -251,15 +787,30 @@ class Message(db.Model):
 class Meeting(db.Model):
     id: int = db.Column(db.Integer, primary_key=True)
     title: str = db.Column(db.String(100), nullable=False)
-    date: str = db.Column(db.String(50), nullable=False)
-    start_time: str = db.Column(db.String(20), nullable=False)
-    end_time: str = db.Column(db.String(20), nullable=False)
+    starts_at: datetime = db.Column(db.DateTime, nullable=False)
+    ends_at: datetime = db.Column(db.DateTime, nullable=False)
     room: str = db.Column(db.String(50), nullable=False)
     organizer_id: str = db.Column(db.String(50), db.ForeignKey('user.id'), nullable=False)
     organizer = db.relationship('User', backref='organized_meetings')
     attendees: List[str] = db.Column(db.Text, default='[]')
     notes: str = db.Column(db.Text, default='')
     created_at: datetime = db.Column(db.DateTime, default=datetime.utcnow)
+    # RRULE subset (see RecurrenceRule); NULL for one-off meetings. For a
+    # series, starts_at/ends_at are the first occurrence.
+    recurrence: Optional[str] = db.Column(db.Text, nullable=True)
+    # End of the last occurrence, SERIES_OPEN_END if unbounded, NULL for one-offs
+    recurrence_ends_at: Optional[datetime] = db.Column(db.DateTime, nullable=True)
+    # Indexed copy of `attendees`, kept in sync by sync_meeting_attendees
+    attendee_rows = db.relationship('MeetingAttendee', cascade='all, delete-orphan')
+    exceptions = db.relationship('MeetingException', cascade='all, delete-orphan')
+
+    # Overlap checks range-scan starts_at within a room / organizer
+    __table_args__ = (
+        db.Index('ix_meeting_starts_at', 'starts_at'),
+        db.Index('ix_meeting_room_starts_at', 'room', 'starts_at'),
+        db.Index('ix_meeting_organizer_starts_at', 'organizer_id', 'starts_at'),
+        db.Index('ix_meeting_recurrence_ends_at', 'recurrence_ends_at'),
+    )
 
     @property
     def attendees_list(self) -> List[str]:
@@ -269,16 +820,460 @@ class Meeting(db.Model):
         return {
             'id': self.id,
             'title': self.title,
-            'date': self.date,
-            'startTime': self.start_time,
-            'endTime': self.end_time,
+            'date': self.starts_at.date().isoformat(),
+            'startTime': self.starts_at.strftime('%H:%M'),
+            'endTime': self.ends_at.strftime('%H:%M'),
+            'startsAt': self.starts_at.isoformat(),
+            'endsAt': self.ends_at.isoformat(),
             'room': self.room,
             'organizer': self.organizer.to_dict(),
             'attendees': self.attendees_list,
             'notes': self.notes,
+            'recurrence': self.recurrence,
             'createdAt': self.created_at.isoformat()
         }
 
+class MeetingAttendee(db.Model):
+    meeting_id: int = db.Column(db.Integer, db.ForeignKey('meeting.id', ondelete='CASCADE'), primary_key=True)
+    attendee: str = db.Column(db.String(100), primary_key=True)
+
+    __table_args__ = (
+        db.Index('ix_meeting_attendee_attendee_meeting', 'attendee', 'meeting_id'),
+    )
+
+class MeetingException(db.Model):
+    """
+    A cancelled or changed occurrence of a recurring meeting, keyed by the
+    start the rule gave it. Only occurrences that differ from the series are
+    stored; overrides left NULL inherit from the series.
+    """
+    id: int = db.Column(db.Integer, primary_key=True)
+    meeting_id: int = db.Column(db.Integer, db.ForeignKey('meeting.id', ondelete='CASCADE'), nullable=False)
+    original_start: datetime = db.Column(db.DateTime, nullable=False)
+    cancelled: bool = db.Column(db.Boolean, default=False, nullable=False)
+    starts_at: Optional[datetime] = db.Column(db.DateTime, nullable=True)
+    ends_at: Optional[datetime] = db.Column(db.DateTime, nullable=True)
+    title: Optional[str] = db.Column(db.String(100), nullable=True)
+    room: Optional[str] = db.Column(db.String(50), nullable=True)
+    notes: Optional[str] = db.Column(db.Text, nullable=True)
+
+    __table_args__ = (
+        db.UniqueConstraint('meeting_id', 'original_start', name='uq_meeting_exception_occurrence'),
+        db.Index('ix_meeting_exception_starts_at', 'starts_at'),
+    )
+
+@event.listens_for(Meeting.attendees, 'set')
+def sync_meeting_attendees(target: Meeting, value: Any, oldvalue: Any, initiator: Any) -> None:
+    """Mirror the JSON attendees column into meeting_attendee rows whenever it is assigned."""
+    attendees = list(dict.fromkeys(str(attendee)[:100] for attendee in json_column_to_list(value)))
+    existing = {row.attendee: row for row in target.attendee_rows}
+    target.attendee_rows = [existing.get(attendee) or MeetingAttendee(attendee=attendee) for attendee in attendees]
+
+# Longest meeting accepted; bounds the starts_at range scanned by overlap checks
+MEETING_MAX_DURATION = timedelta(hours=24)
+# recurrence_ends_at of a series with neither COUNT nor UNTIL
+SERIES_OPEN_END = datetime(9999, 12, 31)
+
+class RecurrenceRule:
+    """
+    The subset of RFC 5545 RRULE used for meetings, e.g.
+    "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,TH;COUNT=10".
+
+    FREQ is DAILY, WEEKLY or MONTHLY; INTERVAL, COUNT, UNTIL and BYDAY are
+    optional. BYDAY applies to WEEKLY rules, and to DAILY rules with an
+    interval of 1 (treated as weekly on those days). MONTHLY repeats on the
+    first occurrence's day of month, skipping months without that day.
+    """
+
+    WEEKDAYS = ['MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU']
+
+    def __init__(self, text: str) -> None:
+        parts = {}
+        for part in filter(None, str(text).strip().upper().split(';')):
+            key, sep, value = part.partition('=')
+            if not sep or key in parts:
+                raise ValueError(f'Malformed recurrence part: {part}')
+            parts[key] = value
+        unknown = set(parts) - {'FREQ', 'INTERVAL', 'COUNT', 'UNTIL', 'BYDAY'}
+        if unknown:
+            raise ValueError(f'Unsupported recurrence parts: {", ".join(sorted(unknown))}')
+
+        self.freq = parts.get('FREQ')
+        if self.freq not in ('DAILY', 'WEEKLY', 'MONTHLY'):
+            raise ValueError('FREQ must be DAILY, WEEKLY or MONTHLY')
+        self.interval = int(parts.get('INTERVAL', 1))
+        self.count = int(parts['COUNT']) if 'COUNT' in parts else None
+        self.until = None
+        if 'UNTIL' in parts:
+            until = parts['UNTIL'].rstrip('Z')
+            self.until = datetime.strptime(until, '%Y%m%dT%H%M%S' if 'T' in until else '%Y%m%d')
+            if 'T' not in until:
+                self.until += timedelta(days=1) - timedelta(microseconds=1)
+        self.byday = None
+        if 'BYDAY' in parts:
+            try:
+                self.byday = sorted({self.WEEKDAYS.index(day) for day in parts['BYDAY'].split(',')})
+            except ValueError:
+                raise ValueError(f'Invalid BYDAY: {parts["BYDAY"]}')
+        if self.interval < 1 or (self.count is not None and self.count < 1):
+            raise ValueError('INTERVAL and COUNT must be positive')
+        if self.byday is not None and (self.freq == 'MONTHLY' or (self.freq == 'DAILY' and self.interval != 1)):
+            raise ValueError('BYDAY is only supported for WEEKLY and single-interval DAILY rules')
+        if self.freq == 'DAILY' and self.byday is not None:
+            self.freq = 'WEEKLY'
+
+    def __str__(self) -> str:
+        parts = [f'FREQ={self.freq}']
+        if self.interval != 1:
+            parts.append(f'INTERVAL={self.interval}')
+        if self.byday is not None:
+            parts.append('BYDAY=' + ','.join(self.WEEKDAYS[day] for day in self.byday))
+        if self.count is not None:
+            parts.append(f'COUNT={self.count}')
+        if self.until is not None:
+            parts.append('UNTIL=' + self.until.strftime('%Y%m%dT%H%M%S'))
+        return ';'.join(parts)
+
+    def occurrences(self, first: datetime, after: Optional[datetime] = None,
+                    before: Optional[datetime] = None) -> Any:
+        """
+        Lazily yield occurrence starts in [after, before), in order.
+
+        Daily and weekly rules jump straight to `after` rather than stepping
+        through the whole series, so a window far into a long series costs
+        the same as the first one.
+        """
+        after = max(after or first, first)
+        if self.freq == 'MONTHLY':
+            generated = self._monthly(first)
+        else:
+            generated = self._weekly(first, after) if self.freq == 'WEEKLY' else self._daily(first, after)
+        for index, start in generated:
+            if (self.count is not None and index >= self.count) or (self.until is not None and start > self.until):
+                return
+            if before is not None and start >= before:
+                return
+            if start >= after:
+                yield start
+
+    def _daily(self, first: datetime, after: datetime) -> Any:
+        period = timedelta(days=self.interval)
+        index = max(0, (after - first) // period)
+        while True:
+            yield index, first + index * period
+            index += 1
+
+    def _weekly(self, first: datetime, after: datetime) -> Any:
+        days = self.byday if self.byday is not None else [first.weekday()]
+        week_start = first - timedelta(days=first.weekday())
+        in_first_block = [day for day in days if day >= first.weekday()]
+        period = timedelta(weeks=self.interval)
+        block = max(0, (after - week_start) // period)
+        # Occurrences before `block`: the partial first block, then full blocks
+        index = 0 if block == 0 else len(in_first_block) + (block - 1) * len(days)
+        while True:
+            for day in (in_first_block if block == 0 else days):
+                yield index, week_start + block * period + timedelta(days=day)
+                index += 1
+            block += 1
+
+    def _monthly(self, first: datetime) -> Any:
+        index = 0
+        month = 0
+        while True:
+            year, month_of_year = divmod(first.month - 1 + month * self.interval, 12)
+            try:
+                start = first.replace(year=first.year + year, month=month_of_year + 1)
+            except ValueError:
+                start = None
+            if start is not None:
+                yield index, start
+                index += 1
+            elif first.year + year > 9998:
+                return
+            month += 1
+
+    def series_end(self, first: datetime, duration: timedelta) -> datetime:
+        """End of the last occurrence, or SERIES_OPEN_END for an unbounded rule."""
+        if self.count is None and self.until is None:
+            return SERIES_OPEN_END
+        last = first
+        if self.freq == 'MONTHLY':
+            for last in self.occurrences(first):
+                pass
+            return last + duration
+
+        # Jump to just before the bound instead of walking every occurrence
+        bound = self.until if self.until is not None else SERIES_OPEN_END
+        if self.count is not None:
+            bound = min(bound, self._nth(first, self.count - 1))
+        span = timedelta(days=self.interval) if self.freq == 'DAILY' else timedelta(weeks=self.interval)
+        for last in self.occurrences(first, max(first, bound - span), bound + timedelta(microseconds=1)):
+            pass
+        return last + duration
+
+    def _nth(self, first: datetime, index: int) -> datetime:
+        """Start of the occurrence at `index` (0-based) of a DAILY or WEEKLY rule, ignoring COUNT/UNTIL."""
+        if self.freq == 'DAILY':
+            return first + index * timedelta(days=self.interval)
+        days = self.byday if self.byday is not None else [first.weekday()]
+        week_start = first - timedelta(days=first.weekday())
+        in_first_block = [day for day in days if day >= first.weekday()]
+        if index < len(in_first_block):
+            return week_start + timedelta(days=in_first_block[index])
+        block, position = divmod(index - len(in_first_block), len(days))
+        return week_start + (block + 1) * timedelta(weeks=self.interval) + timedelta(days=days[position])
+
+def set_meeting_recurrence(meeting: Meeting, recurrence: Optional[str]) -> None:
+    """
+    Validate and store a recurrence rule, recomputing recurrence_ends_at.
+
+    Raises:
+        ValueError: If the rule is malformed or unsupported.
+    """
+    if not recurrence:
+        meeting.recurrence = None
+        meeting.recurrence_ends_at = None
+        return
+    rule = RecurrenceRule(recurrence)
+    meeting.recurrence = str(rule)
+    meeting.recurrence_ends_at = rule.series_end(meeting.starts_at, meeting.ends_at - meeting.starts_at)
+
+class MeetingOccurrence:
+    """
+    One concrete occurrence: a one-off meeting, or an instance of a series
+    with any exception applied.
+    """
+
+    __slots__ = ('meeting', 'original_start', 'starts_at', 'ends_at', 'exception')
+
+    def __init__(self, meeting: Meeting, original_start: datetime, starts_at: datetime,
+                 ends_at: datetime, exception: Optional[MeetingException] = None) -> None:
+        self.meeting = meeting
+        self.original_start = original_start
+        self.starts_at = starts_at
+        self.ends_at = ends_at
+        self.exception = exception
+
+    def _override(self, field: str) -> Any:
+        value = getattr(self.exception, field) if self.exception is not None else None
+        return value if value is not None else getattr(self.meeting, field)
+
+    @property
+    def title(self) -> str:
+        return self._override('title')
+
+    @property
+    def room(self) -> str:
+        return self._override('room')
+
+    @property
+    def notes(self) -> str:
+        return self._override('notes')
+
+    @property
+    def organizer_id(self) -> str:
+        return self.meeting.organizer_id
+
+    @property
+    def attendees_list(self) -> List[str]:
+        return self.meeting.attendees_list
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = self.meeting.to_dict()
+        data.update({
+            'title': self.title,
+            'date': self.starts_at.date().isoformat(),
+            'startTime': self.starts_at.strftime('%H:%M'),
+            'endTime': self.ends_at.strftime('%H:%M'),
+            'startsAt': self.starts_at.isoformat(),
+            'endsAt': self.ends_at.isoformat(),
+            'room': self.room,
+            'notes': self.notes
+        })
+        if self.meeting.recurrence:
+            data['occurrenceStart'] = self.original_start.isoformat()
+        return data
+
+def expand_series(series: List[Meeting], window_start: datetime, window_end: datetime) -> Any:
+    """
+    Lazily yield the occurrences of recurring meetings that overlap
+    [window_start, window_end), ordered by start.
+
+    Exceptions for the series are fetched in one query: those keyed by an
+    occurrence the rule places near the window, and those moved into it.
+    """
+    if not series:
+        return iter(())
+    ids = [meeting.id for meeting in series]
+    exceptions: Dict[int, Dict[datetime, MeetingException]] = {}
+    for exception in MeetingException.query.filter(
+        MeetingException.meeting_id.in_(ids),
+        or_(
+            and_(
+                MeetingException.original_start > window_start - MEETING_MAX_DURATION,
+                MeetingException.original_start < window_end
+            ),
+            and_(
+                MeetingException.starts_at > window_start - MEETING_MAX_DURATION,
+                MeetingException.starts_at < window_end
+            )
+        )
+    ):
+        exceptions.setdefault(exception.meeting_id, {})[exception.original_start] = exception
+
+    def occurrences(meeting: Meeting) -> Any:
+        duration = meeting.ends_at - meeting.starts_at
+        overrides = exceptions.get(meeting.id, {})
+        moved = sorted(
+            (MeetingOccurrence(meeting, exception.original_start, exception.starts_at, exception.ends_at, exception)
+             for exception in overrides.values()
+             if not exception.cancelled and exception.starts_at is not None
+             and exception.starts_at < window_end and exception.ends_at > window_start),
+            key=lambda occurrence: occurrence.starts_at
+        )
+        regular = (
+            MeetingOccurrence(meeting, start, start, start + duration)
+            for start in RecurrenceRule(meeting.recurrence).occurrences(
+                meeting.starts_at, window_start - duration + timedelta(microseconds=1), window_end
+            )
+            if start not in overrides
+        )
+        return heapq.merge(regular, moved, key=lambda occurrence: occurrence.starts_at)
+
+    return heapq.merge(*(occurrences(meeting) for meeting in series),
+                       key=lambda occurrence: (occurrence.starts_at, occurrence.meeting.id))
+
+def expand_meetings(window_start: datetime, window_end: datetime, *criteria: Any,
+                    exclude_id: Optional[int] = None) -> Any:
+    """
+    Lazily yield every occurrence overlapping [window_start, window_end) of
+    meetings matching `criteria`, ordered by start.
+
+    One-off meetings come from a bounded range scan on ix_meeting_starts_at
+    (recurrence, not recurrence_ends_at, tells them apart so the planner
+    isn't drawn to the NULL range of that index), streamed in batches; series
+    come from ix_meeting_recurrence_ends_at and are expanded in Python.
+    """
+    one_offs = Meeting.query.filter(
+        Meeting.recurrence.is_(None),
+        Meeting.starts_at > window_start - MEETING_MAX_DURATION,
+        Meeting.starts_at < window_end,
+        Meeting.ends_at > window_start,
+        *criteria
+    )
+    # Resolve live series on their own index first; with the criteria attached
+    # the planner prefers the room/organizer indexes and scans all history
+    series_ids = [meeting_id for meeting_id, in db.session.query(Meeting.id).filter(
+        Meeting.recurrence_ends_at > window_start,
+        Meeting.starts_at < window_end
+    )]
+    series = Meeting.query.filter(Meeting.id.in_(series_ids), *criteria)
+    if exclude_id is not None:
+        one_offs = one_offs.filter(Meeting.id != exclude_id)
+        series = series.filter(Meeting.id != exclude_id)
+
+    # Joined rather than selectin loading, which can't be combined with yield_per
+    one_offs = one_offs.options(db.joinedload(Meeting.organizer)).order_by(
+        Meeting.starts_at, Meeting.id
+    ).yield_per(500)
+    series = series.options(db.selectinload(Meeting.organizer)).all()
+    return heapq.merge(
+        (MeetingOccurrence(meeting, meeting.starts_at, meeting.starts_at, meeting.ends_at) for meeting in one_offs),
+        expand_series(series, window_start, window_end),
+        key=lambda occurrence: (occurrence.starts_at, occurrence.meeting.id)
+    )
+
+def parse_meeting_times(date: str, start_time: str, end_time: str) -> tuple:
+    """
+    Combine the scheduler's date and HH:MM strings into (starts_at, ends_at).
+
+    Raises:
+        ValueError: If a value cannot be parsed, the meeting ends before it
+            starts, or it is longer than MEETING_MAX_DURATION.
+    """
+    day = datetime.strptime(str(date)[:10], '%Y-%m-%d')
+    starts_at = datetime.combine(day.date(), datetime.strptime(str(start_time)[:5], '%H:%M').time())
+    ends_at = datetime.combine(day.date(), datetime.strptime(str(end_time)[:5], '%H:%M').time())
+    if ends_at <= starts_at:
+        raise ValueError('End time must be after start time')
+    if ends_at - starts_at > MEETING_MAX_DURATION:
+        raise ValueError('Meeting is too long')
+    return starts_at, ends_at
+
+# Widest range GET /api/meetings will expand occurrences for
+MEETING_LIST_MAX_RANGE = timedelta(days=366)
+# How far ahead a new or changed series is checked for clashes
+RECURRENCE_CONFLICT_HORIZON = timedelta(days=90)
+
+def find_meeting_conflicts(starts_at: datetime, ends_at: datetime, room: Optional[str] = None,
+                           people: Optional[List[str]] = None, exclude_id: Optional[int] = None,
+                           recurrence: Optional[str] = None) -> List[MeetingOccurrence]:
+    """
+    Return meeting occurrences overlapping [starts_at, ends_at) that share
+    the room or any of `people` (matched against organizers and attendees).
+
+    Since no meeting is longer than MEETING_MAX_DURATION, only one-off
+    meetings starting in (starts_at - MEETING_MAX_DURATION, ends_at) can
+    overlap, so the check is a bounded range scan on ix_meeting_starts_at
+    with attendee membership probed per candidate, independent of total
+    history. With `recurrence`, each occurrence of the proposed series within
+    RECURRENCE_CONFLICT_HORIZON is checked.
+    """
+    clauses = []
+    if room:
+        clauses.append(Meeting.room == room)
+        # Series with an occurrence moved into this room
+        clauses.append(db.select(MeetingException.id).where(
+            MeetingException.meeting_id == Meeting.id,
+            MeetingException.room == room
+        ).exists())
+    if people:
+        clauses.append(Meeting.organizer_id.in_(people))
+        clauses.append(db.select(MeetingAttendee.meeting_id).where(
+            MeetingAttendee.meeting_id == Meeting.id,
+            MeetingAttendee.attendee.in_(people)
+        ).exists())
+    if not clauses:
+        return []
+
+    if recurrence:
+        duration = ends_at - starts_at
+        slots = [(start, start + duration) for start in RecurrenceRule(recurrence).occurrences(
+            starts_at, starts_at, starts_at + RECURRENCE_CONFLICT_HORIZON
+        )]
+    else:
+        slots = [(starts_at, ends_at)]
+    if not slots:
+        return []
+
+    people_set = set(people or ())
+    conflicts = []
+    slot_index = 0
+    for occurrence in expand_meetings(slots[0][0], slots[-1][1], or_(*clauses), exclude_id=exclude_id):
+        # Exceptions can move an occurrence out of the matched room
+        if occurrence.room != room and not people_set & ({occurrence.organizer_id} | set(occurrence.attendees_list)):
+            continue
+        # Both lists are ordered by start, so walk the slots alongside
+        while slot_index < len(slots) and slots[slot_index][1] <= occurrence.starts_at:
+            slot_index += 1
+        for slot_start, slot_end in slots[slot_index:]:
+            if slot_start >= occurrence.ends_at:
+                break
+            if slot_end > occurrence.starts_at:
+                conflicts.append(occurrence)
+                break
+    return conflicts
+
+def meeting_conflict_dict(occurrence: MeetingOccurrence, room: Optional[str], people: List[str]) -> Dict[str, Any]:
+    """Describe why `occurrence` clashes with a booking for `room` and `people`."""
+    shared = set(people) & ({occurrence.organizer_id} | set(occurrence.attendees_list))
+    return {
+        'meeting': occurrence.to_dict(),
+        'room': bool(room) and occurrence.room == room,
+        'people': sorted(shared)
+    }
+
 class WorkItem(db.Model):
     id: int = db.Column(db.Integer, primary_key=True)
     title: str = db.Column(db.String(100), nullable=False)
@@ -295,30 +1290,84 @@ class WorkItem(db.Model):
     # Update relationships to specify foreign keys explicitly
     assignee = db.relationship('User', foreign_keys=[assigned_to], backref='work_items')
     creator = db.relationship('User', foreign_keys=[created_by], backref='created_work_items')
+    # Indexed copy of `tags`, kept in sync by sync_work_item_tags
+    tag_rows = db.relationship('WorkItemTag', cascade='all, delete-orphan')
+
+    # Each filter/sort column is paired with id so keyset pages stay on the index
+    __table_args__ = (
+        db.Index('ix_work_item_status_id', 'status', 'id'),
+        db.Index('ix_work_item_priority_id', 'priority', 'id'),
+        db.Index('ix_work_item_assigned_to_id', 'assigned_to', 'id'),
+        db.Index('ix_work_item_due_date_id', 'due_date', 'id'),
+        db.Index('ix_work_item_created_at_id', 'created_at', 'id'),
+        db.Index('ix_work_item_updated_at_id', 'updated_at', 'id'),
+    )
 
     @property
     def tags_list(self) -> List[str]:
         return json_column_to_list(self.tags)
 
-    def to_dict(self) -> Dict[str, Any]:
+    # One serializer per API field so sparse fieldsets only touch what they return
+    FIELD_SERIALIZERS = {
+        'id': lambda item: item.id,
+        'title': lambda item: item.title,
+        'description': lambda item: item.description,
+        'status': lambda item: item.status,
+        'priority': lambda item: item.priority,
+        'assignedTo': lambda item: item.assignee.to_dict() if item.assignee else None,
+        'createdBy': lambda item: item.creator.to_dict(),
+        'dueDate': lambda item: item.due_date.isoformat() if item.due_date else None,
+        'tags': lambda item: item.tags_list,
+        'createdAt': lambda item: item.created_at.isoformat(),
+        'updatedAt': lambda item: item.updated_at.isoformat(),
+        'attachments': lambda item: [attachment.to_dict() for attachment in item.attachments]
+    }
+
+    def to_dict(self, fields: Optional[set] = None) -> Dict[str, Any]:
         return {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'status': self.status,
-            'priority': self.priority,
-            'assignedTo': self.assignee.to_dict() if self.assignee else None,
-            'createdBy': self.creator.to_dict(),
-            'dueDate': self.due_date.isoformat() if self.due_date else None,
-            'tags': self.tags_list,
-            'createdAt': self.created_at.isoformat(),
-            'updatedAt': self.updated_at.isoformat(),
-            'attachments': [attachment.to_dict() for attachment in self.attachments] if hasattr(self, 'attachments') else []
+            field: serialize(self)
+            for field, serialize in self.FIELD_SERIALIZERS.items()
+            if fields is None or field in fields
         }
 
+class WorkItemTag(db.Model):
+    work_item_id: int = db.Column(db.Integer, db.ForeignKey('work_item.id', ondelete='CASCADE'), primary_key=True)
+    tag: str = db.Column(db.String(50), primary_key=True)
+
+    __table_args__ = (
+        db.Index('ix_work_item_tag_tag_work_item', 'tag', 'work_item_id'),
+    )
+
+@event.listens_for(WorkItem.tags, 'set')
+def sync_work_item_tags(target: WorkItem, value: Any, oldvalue: Any, initiator: Any) -> None:
+    """Mirror the JSON tags column into work_item_tag rows whenever it is assigned."""
+    tags = list(dict.fromkeys(str(tag)[:50] for tag in json_column_to_list(value)))
+    existing = {row.tag: row for row in target.tag_rows}
+    target.tag_rows = [existing.get(tag) or WorkItemTag(tag=tag) for tag in tags]
+
+def work_item_load_options(fields: Optional[set] = None) -> List[Any]:
+    """
+    Eager-load options for serializing a list of work items.
+
+    Users and attachment metadata are fetched with one SELECT ... IN per
+    relationship instead of lazily per item; the attachment data column is
+    never loaded. Relationships outside `fields` are skipped entirely.
+    """
+    options = []
+    if fields is None or 'assignedTo' in fields:
+        options.append(db.selectinload(WorkItem.assignee))
+    if fields is None or 'createdBy' in fields:
+        options.append(db.selectinload(WorkItem.creator))
+    if fields is None or 'attachments' in fields:
+        options.append(db.selectinload(WorkItem.attachments).options(
+            db.defer(FileAttachment.data),
+            db.selectinload(FileAttachment.uploader)
+        ))
+    return options
+
 class ChartData(db.Model):
     id: int = db.Column(db.Integer, primary_key=True)
-    chart_type: str = db.Column(db.String(50), nullable=False)
+    chart_type: str = db.Column(db.String(50), nullable=False, index=True)
     title: str = db.Column(db.String(100), nullable=False)
     data: str = db.Column(db.Text, nullable=False)  # JSON string
     created_at: datetime = db.Column(db.DateTime, default=datetime.utcnow)
@@ -343,6 +1392,17 @@ class ChartData(db.Model):
             'updatedAt': self.updated_at.isoformat()
         }
 
+    def to_json(self, data_json: str) -> str:
+        """Serialize like to_dict, splicing already-encoded data JSON in as-is."""
+        head = json.dumps({
+            'id': self.id,
+            'chartType': self.chart_type,
+            'title': self.title,
+            'createdAt': self.created_at.isoformat(),
+            'updatedAt': self.updated_at.isoformat()
+        })
+        return f'{head[:-1]}, "data": {data_json}}}'
+
 # New model for file attachments
 class FileAttachment(db.Model):
     id: int = db.Column(db.Integer, primary_key=True)
@@ -350,8 +1410,8 @@ class FileAttachment(db.Model):
     file_type: str = db.Column(db.String(100), nullable=False)
     file_size: int = db.Column(db.Integer, nullable=False)
     data: str = db.Column(db.Text, nullable=False)  # Base64 encoded file data
-    message_id: int = db.Column(db.Integer, db.ForeignKey('message.id'), nullable=True)
-    work_item_id: int = db.Column(db.Integer, db.ForeignKey('work_item.id'), nullable=True)
+    message_id: int = db.Column(db.Integer, db.ForeignKey('message.id'), nullable=True, index=True)
+    work_item_id: int = db.Column(db.Integer, db.ForeignKey('work_item.id'), nullable=True, index=True)
     uploader_id: str = db.Column(db.String(50), db.ForeignKey('user.id'), nullable=False)
     uploaded_at: datetime = db.Column(db.DateTime, default=datetime.utcnow)
 
@@ -382,6 +1442,10 @@ class EyeGazeData(db.Model):
     timestamp: datetime = db.Column(db.DateTime, default=datetime.utcnow)
     session_id: str = db.Column(db.String(50), nullable=False)
 
+    __table_args__ = (
+        db.Index('ix_eye_gaze_data_user_session_timestamp', 'user_id', 'session_id', 'timestamp'),
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'id': self.id,
@@ -392,26 +1456,1208 @@ class EyeGazeData(db.Model):
             'sessionId': self.session_id
         }
 
+# Per-session rollup of eye gaze samples, maintained at ingest time
+class EyeGazeSession(db.Model):
+    id: int = db.Column(db.Integer, primary_key=True)
+    user_id: str = db.Column(db.String(50), db.ForeignKey('user.id'), nullable=False)
+    session_id: str = db.Column(db.String(50), nullable=False)
+    started_at: datetime = db.Column(db.DateTime, nullable=False)
+    ended_at: datetime = db.Column(db.DateTime, nullable=False)
+    sample_count: int = db.Column(db.Integer, nullable=False, default=0)
+    looking_count: int = db.Column(db.Integer, nullable=False, default=0)
+    confidence_total: float = db.Column(db.Float, nullable=False, default=0.0)
+
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'session_id', name='uq_eye_gaze_session_user_session'),
+        db.Index('ix_eye_gaze_session_user_started', 'user_id', 'started_at'),
+    )
+
+    def stats(self) -> Dict[str, Any]:
+        # Time in seconds, assuming one sample per second
+        return eye_gaze_stats(self.sample_count, self.looking_count)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'sessionId': self.session_id,
+            'userId': self.user_id,
+            'startedAt': self.started_at.isoformat(),
+            'endedAt': self.ended_at.isoformat(),
+            'sampleCount': self.sample_count,
+            'averageConfidence': round(self.confidence_total / self.sample_count, 2) if self.sample_count else 0,
+            **self.stats()
+        }
+
+def eye_gaze_stats(total_count: int, looking_count: int) -> Dict[str, Any]:
+    """Build the eye gaze stats payload from sample counts (one sample per second)."""
+    return {
+        'totalTime': total_count,
+        'lookingTime': looking_count,
+        'notLookingTime': total_count - looking_count,
+        'attentionPercentage': round((looking_count / total_count) * 100) if total_count > 0 else 0
+    }
+
+def record_eye_gaze_sample(sample: EyeGazeData) -> None:
+    """
+    Fold a new eye gaze sample into its session rollup.
+
+    One INSERT ... ON CONFLICT DO UPDATE creates the session row on the
+    first sample and otherwise increments it atomically, so concurrent
+    writers to the same session neither lose updates nor race to create
+    the row. Must be called inside the same transaction that adds the sample.
+    """
+    looking = 1 if sample.is_looking_at_screen else 0
+    rollup = EyeGazeSession.__table__
+    db.session.execute(upsert(rollup, {
+        'user_id': sample.user_id,
+        'session_id': sample.session_id,
+        'started_at': sample.timestamp,
+        'ended_at': sample.timestamp,
+        'sample_count': 1,
+        'looking_count': looking,
+        'confidence_total': sample.confidence
+    }, ['user_id', 'session_id'], {
+        'sample_count': rollup.c.sample_count + 1,
+        'looking_count': rollup.c.looking_count + looking,
+        'confidence_total': rollup.c.confidence_total + sample.confidence,
+        'started_at': db.case((rollup.c.started_at > sample.timestamp, sample.timestamp),
+                              else_=rollup.c.started_at),
+        'ended_at': db.case((rollup.c.ended_at < sample.timestamp, sample.timestamp),
+                            else_=rollup.c.ended_at)
+    }))
+    # A Core statement on the table, so record the write for the caches here
+    db.session.info.setdefault('changed_tables', set()).add(rollup.name)
+    db.session.info.setdefault('mutated_tables', set()).add(rollup.name)
+
+# Per-table version counters, bumped after each commit that wrote to a table.
+# Cached query results record the versions they were computed against and are
+# discarded as soon as any of their source tables move on. Updates and deletes
+# are also counted separately so insert-only changes can be applied incrementally.
+table_versions: Dict[str, int] = {}
+table_mutations: Dict[str, int] = {}
+
+def get_table_versions(tables: List[str]) -> tuple:
+    return tuple(table_versions.get(table, 0) for table in tables)
+
+class TableVersion(db.Model):
+    """
+    Database-wide version of each table, bumped in the transaction that
+    writes to it, so every worker process sees every write (unlike
+    table_versions). Used for ETags.
+    """
+    table_name: str = db.Column(db.String(64), primary_key=True)
+    version: int = db.Column(db.BigInteger, nullable=False)
+
+def upsert(table: Any, rows: Any, keys: List[str], update: Dict[str, Any]) -> Any:
+    """Build INSERT ... ON CONFLICT (keys) DO UPDATE SET `update`, for SQLite or PostgreSQL."""
+    dialect_insert = postgresql.insert if db.engine.dialect.name == 'postgresql' else sqlite.insert
+    return dialect_insert(table).values(rows).on_conflict_do_update(index_elements=keys, set_=update)
+
+def get_shared_table_versions(tables: List[str]) -> tuple:
+    """The TableVersion of each table, None for tables never written."""
+    versions = dict(db.session.execute(
+        db.select(TableVersion.table_name, TableVersion.version).where(TableVersion.table_name.in_(tables))
+    ).all())
+    return tuple(versions.get(table) for table in tables)
+
+@event.listens_for(Session, 'before_commit')
+def bump_shared_table_versions(session: Session) -> None:
+    # Flush first so the tables written by pending changes are known
+    session.flush()
+    tables = sorted(session.info.get('changed_tables', ()))
+    if not tables:
+        return
+    version = TableVersion.__table__
+    # A new row starts at a random version so a recreated database never
+    # repeats ETags handed out before
+    session.execute(upsert(version, [{'table_name': table, 'version': random.getrandbits(48)} for table in tables],
+                           ['table_name'], {'version': version.c.version + 1}))
+
+@event.listens_for(Session, 'after_flush')
+def track_flushed_tables(session: Session, flush_context: Any) -> None:
+    changed = session.info.setdefault('changed_tables', set())
+    mutated = session.info.setdefault('mutated_tables', set())
+    for obj in session.new:
+        changed.add(obj.__table__.name)
+    for obj in chain(session.dirty, session.deleted):
+        changed.add(obj.__table__.name)
+        mutated.add(obj.__table__.name)
+
+@event.listens_for(Session, 'do_orm_execute')
+def track_bulk_writes(orm_execute_state: Any) -> None:
+    # Bulk query.update()/delete() and insert() statements bypass the flush
+    if orm_execute_state.is_select or orm_execute_state.bind_mapper is None:
+        return
+    table = orm_execute_state.bind_mapper.local_table.name
+    orm_execute_state.session.info.setdefault('changed_tables', set()).add(table)
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info.setdefault('mutated_tables', set()).add(table)
+
+@event.listens_for(Session, 'after_commit')
+def bump_table_versions(session: Session) -> None:
+    for table in session.info.pop('changed_tables', ()):
+        table_versions[table] = table_versions.get(table, 0) + 1
+    for table in session.info.pop('mutated_tables', ()):
+        table_mutations[table] = table_mutations.get(table, 0) + 1
+
+@event.listens_for(Session, 'after_rollback')
+def discard_changed_tables(session: Session) -> None:
+    session.info.pop('changed_tables', None)
+    session.info.pop('mutated_tables', None)
+
+class GroupCommitWriter:
+    """
+    Writer thread that commits inserts from many requests in one transaction.
+
+    Each write is a callable that adds rows to the session, flushes and
+    returns the response payload. The thread collects writes until
+    `max_rows` are queued or `window` seconds passed since the first one,
+    runs them all in its own session and commits once. If the batch fails,
+    its writes are retried one transaction each, so one bad row only fails
+    its own request.
+    """
+
+    def __init__(self, window: float, max_rows: int) -> None:
+        self.window = window
+        self.max_rows = max_rows
+        self.pending: queue.Queue = queue.Queue()
+        self.thread = threading.Thread(target=self.run, name='group-commit', daemon=True)
+        self.thread.start()
+        atexit.register(self.stop)
+
+    def submit(self, write: Callable[[], Any]) -> Future:
+        future: Future = Future()
+        self.pending.put((write, future))
+        return future
+
+    def stop(self) -> None:
+        self.pending.put(None)
+        self.thread.join(timeout=app.config['GROUP_COMMIT_TIMEOUT'])
+
+    def next_batch(self) -> tuple:
+        # Block for the first write, then gather more until the window closes
+        first = self.pending.get()
+        if first is None:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_rows:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self.pending.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def run(self) -> None:
+        with app.app_context():
+            stopping = False
+            while not stopping:
+                batch, stopping = self.next_batch()
+                if batch:
+                    self.commit(batch)
+
+    def commit(self, batch: List[tuple]) -> None:
+        try:
+            results = [write() for write, _ in batch]
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+            else:
+                for item in batch:
+                    self.commit([item])
+            return
+        finally:
+            db.session.close()
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+        GROUP_COMMIT_ROWS.observe(len(batch))
+
+group_writer: Optional[GroupCommitWriter] = None
+group_writer_lock = threading.Lock()
+
+def commit_write(write: Callable[[], Any]) -> Any:
+    """
+    Run an insert and commit it, returning what `write` returns.
+
+    With GROUP_COMMIT enabled the write runs on the group commit thread and
+    this waits until its batch is committed; otherwise it runs and commits
+    in the caller's session. `write` must be safe to run again and must
+    not touch objects loaded by the caller's session.
+    """
+    global group_writer
+    if not app.config['GROUP_COMMIT']:
+        result = write()
+        db.session.commit()
+        return result
+    # End the caller's read transaction first: requests holding pooled
+    # connections while they wait could leave the writer without one
+    db.session.rollback()
+    if group_writer is None:
+        with group_writer_lock:
+            if group_writer is None:
+                group_writer = GroupCommitWriter(app.config['GROUP_COMMIT_WINDOW_MS'] / 1000,
+                                                 app.config['GROUP_COMMIT_MAX_ROWS'])
+    return group_writer.submit(write).result(timeout=app.config['GROUP_COMMIT_TIMEOUT'])
+
+class QueryCache:
+    """
+    Thread-safe in-process LRU cache for computed query results.
+
+    Entries are tied to the versions of the tables they were computed from and
+    also expire after `ttl` seconds, which bounds staleness when several worker
+    processes write to the same database.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 60.0) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, tables: List[str]) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            versions, expires_at, value = entry
+            if versions != get_table_versions(tables) or expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Any, tables: List[str], value: Any, versions: Optional[tuple] = None) -> None:
+        # Callers should snapshot `versions` before querying so that a write
+        # landing mid-computation invalidates the entry
+        if versions is None:
+            versions = get_table_versions(tables)
+        with self._lock:
+            self._entries[key] = (versions, time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+analytics_cache = QueryCache()
+
+class SerializedChartCache:
+    """
+    In-process LRU of fully serialized ChartData JSON, keyed by (id, updated_at).
+
+    The stored data text is spliced into the response as-is, so a cached chart
+    costs a string copy per request. It is checked to be valid JSON once, when
+    first cached. Total size is capped at `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def serialize(self, charts: List[ChartData]) -> List[str]:
+        """
+        Return the JSON text for each chart, in order.
+
+        `charts` should be loaded with the data column deferred; the payloads
+        of cache misses are then fetched together in one query.
+        """
+        results: List[Optional[str]] = []
+        misses = []
+        with self._lock:
+            for chart in charts:
+                entry = self._entries.get((chart.id, chart.updated_at))
+                if entry is not None:
+                    self._entries.move_to_end((chart.id, chart.updated_at))
+                else:
+                    misses.append(chart)
+                results.append(entry)
+
+        if misses:
+            stored = dict(db.session.query(ChartData.id, ChartData.data).filter(
+                ChartData.id.in_([chart.id for chart in misses])
+            ).all())
+            fresh = {}
+            for chart in misses:
+                data_json = stored.get(chart.id)
+                try:
+                    json.loads(data_json)
+                except (TypeError, json.JSONDecodeError):
+                    data_json = '{}'  # Same fallback as ChartData.get_data
+                fresh[(chart.id, chart.updated_at)] = chart.to_json(data_json)
+
+            with self._lock:
+                for key, text in fresh.items():
+                    if key not in self._entries:
+                        self._entries[key] = text
+                        self._size += len(text)
+                while self._size > self.max_bytes and self._entries:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._size -= len(evicted)
+
+            results = [
+                result if result is not None else fresh[(chart.id, chart.updated_at)]
+                for chart, result in zip(charts, results)
+            ]
+
+        return results
+
+chart_json_cache = SerializedChartCache()
+
+def json_response(body: str, status: int = 200) -> Response:
+    return Response(body, status=status, mimetype='application/json')
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider for jsonify and request.get_json that encodes with orjson
+    when it is installed (FAST_JSON=false forces the standard library).
+    Both paths write dates and datetimes as ISO 8601, sort keys like
+    Flask's default provider and fall back to its handling of other types.
+    """
+
+    fast = orjson is not None and os.environ.get('FAST_JSON', 'true').lower() != 'false'
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        if isinstance(o, date):
+            return o.isoformat()
+        return DefaultJSONProvider.default(o)
+
+    def options(self, indent: bool = False) -> int:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if not self.fast or set(kwargs) - {'separators', 'indent'}:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self.options('indent' in kwargs)).decode('utf-8')
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        if not self.fast or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        if not self.fast:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        # Encoded straight to bytes, skipping the str round trip
+        body = orjson.dumps(obj, default=self.default, option=self.options(indent) | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+app.json = FastJSONProvider(app)
+
+def iter_json_array(items: Any, batch_size: int = 500) -> Any:
+    """
+    Serialize an iterable as a JSON array piece by piece, so a large list is
+    never held in memory as objects or as one string. Items are encoded
+    `batch_size` at a time to keep the number of chunks sent down.
+    """
+    dumps = app.json.dumps
+    iterator = iter(items)
+    separator = ''
+    yield '['
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            break
+        yield separator + ','.join(dumps(item) for item in batch)
+        separator = ','
+    yield ']'
+
+def log_stream_errors(chunks: Any, action: str) -> Any:
+    """
+    Pass through a streamed response body, logging anything it raises.
+
+    The generator runs after the view returned, outside its try/except, and
+    the 200 status line has already been sent. The exception is re-raised
+    so the server drops the connection instead of ending the body cleanly.
+    """
+    try:
+        yield from chunks
+    except Exception as e:
+        app.logger.exception(f"Error {action}: {e}")
+        raise
+
+def stream_json_array(items: Any) -> Response:
+    return Response(stream_with_context(log_stream_errors(iter_json_array(items), 'streaming JSON array')),
+                    mimetype='application/json')
+
+class ChartDefinition:
+    """
+    Declarative chart computed from a live table: COUNT(*) of `model` rows
+    grouped by `group_by`, optionally restricted by `filters`.
+    """
+
+    def __init__(self, title: str, display: str, model: Any, group_by: Any, filters: tuple = ()) -> None:
+        self.title = title
+        self.display = display
+        self.model = model
+        self.group_by = group_by
+        self.filters = filters
+
+    @property
+    def table(self) -> str:
+        return self.model.__table__.name
+
+    def count_query(self, after_id: int, up_to_id: int) -> Any:
+        return db.session.query(self.group_by, db.func.count(self.model.id)).filter(
+            *self.filters,
+            self.model.id > after_id,
+            self.model.id <= up_to_id
+        ).group_by(self.group_by)
+
+# Chart types computed on demand instead of stored as ChartData blobs
+CHART_DEFINITIONS: Dict[str, ChartDefinition] = {
+    'work_items_by_status': ChartDefinition(
+        'Work Items by Status', 'bar', WorkItem, WorkItem.status
+    ),
+    'work_items_by_priority': ChartDefinition(
+        'Work Items by Priority', 'pie', WorkItem, WorkItem.priority
+    ),
+    'work_items_by_assignee': ChartDefinition(
+        'Work Items by Assignee', 'bar', WorkItem, WorkItem.assigned_to
+    ),
+    'messages_per_day': ChartDefinition(
+        'Messages per Day', 'line', Message, db.func.date(Message.timestamp),
+        (Message.is_private == False,)
+    ),
+    'messages_by_sentiment': ChartDefinition(
+        'Message Sentiment', 'pie', Message, Message.sentiment,
+        (Message.is_private == False,)
+    ),
+    'meetings_per_day': ChartDefinition(
+        'Meetings per Day', 'line', Meeting, db.func.date(Meeting.starts_at)
+    ),
+}
+
+class ChartEngine:
+    """
+    Evaluates chart definitions on demand and caches their group counts.
+
+    When a source table has only seen inserts since the last evaluation, only
+    rows past the cached id high-water mark are counted and merged in; any
+    update or delete triggers a full recount. Results are fully recomputed at
+    least every `ttl` seconds, which also picks up writes from other processes.
+
+    The incremental pass assumes rows become visible in id order. That holds
+    on SQLite, which serializes writers, but on PostgreSQL a transaction can
+    commit a lower sequence id after a higher one was already counted; such a
+    row is missing from the counts until the next full recount, at most `ttl`
+    seconds later.
+    """
+
+    def __init__(self, ttl: float = 60.0) -> None:
+        self.ttl = ttl
+        self._state: Dict[str, Dict[str, Any]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def evaluate(self, name: str) -> Dict[str, Any]:
+        definition = CHART_DEFINITIONS[name]
+        table = definition.table
+        version = table_versions.get(table, 0)
+        mutations = table_mutations.get(table, 0)
+
+        with self._lock:
+            state = self._state.get(name)
+            generation = self._generation
+        fresh = state is not None and state['expires_at'] > time.monotonic()
+        if fresh and state['version'] == version:
+            return state
+
+        # Counted outside the lock so a full recount of one chart never
+        # holds up the others. Bound the counts by the current max id so
+        # rows inserted while counting are picked up by the next pass.
+        # Rows committed later below this mark are missed until the next
+        # full recount (see the class docstring).
+        high_water = db.session.query(db.func.max(definition.model.id)).scalar() or 0
+
+        if fresh and state['mutations'] == mutations:
+            # Insert-only changes: fold in the new rows
+            counts = dict(state['counts'])
+            for key, count in definition.count_query(state['high_water'], high_water).all():
+                counts[key] = counts.get(key, 0) + count
+            expires_at = state['expires_at']
+        else:
+            counts = dict(definition.count_query(0, high_water).all())
+            expires_at = time.monotonic() + self.ttl
+
+        state = {
+            'version': version,
+            'mutations': mutations,
+            'high_water': high_water,
+            'counts': counts,
+            'data': [
+                {'name': key, 'value': count}
+                for key, count in sorted(counts.items(), key=lambda item: str(item[0]))
+                if key is not None
+            ],
+            'computed_at': datetime.utcnow(),
+            'expires_at': expires_at
+        }
+        with self._lock:
+            current = self._state.get(name)
+            # Don't replace a newer result another thread stored meanwhile,
+            # or cache one that raced with clear()
+            if generation == self._generation and (
+                current is None or (current['version'], current['high_water']) <= (version, high_water)
+            ):
+                self._state[name] = state
+        return state
+
+    def to_dict(self, name: str) -> Dict[str, Any]:
+        """Serialize a computed chart in the same shape as ChartData.to_dict."""
+        definition = CHART_DEFINITIONS[name]
+        state = self.evaluate(name)
+        return {
+            'id': None,
+            'chartType': name,
+            'title': definition.title,
+            'display': definition.display,
+            'data': state['data'],
+            'computed': True,
+            'createdAt': state['computed_at'].isoformat(),
+            'updatedAt': state['computed_at'].isoformat()
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._state.clear()
+
+chart_engine = ChartEngine()
+
+# Bookable rooms, mirroring the defaults shown by RoomSelector
+MEETING_ROOMS: List[Dict[str, Any]] = [
+    {'id': '1', 'name': 'Room A', 'capacity': 10, 'equipment': ['Projector', 'Whiteboard']},
+    {'id': '2', 'name': 'Room B', 'capacity': 6, 'equipment': ['TV Screen', 'Conference Phone']},
+    {'id': '3', 'name': 'Room C', 'capacity': 15, 'equipment': ['Projector', 'Whiteboard', 'Video Conference']},
+    {'id': '4', 'name': 'Room D', 'capacity': 4, 'equipment': ['TV Screen']},
+]
+
+def merge_intervals(intervals: List[tuple]) -> List[tuple]:
+    """Sweep-line merge of (start, end) pairs into sorted, disjoint intervals; touching ones are joined."""
+    merged: List[tuple] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+def bitmap_runs(bitmap: int) -> List[tuple]:
+    """Return the (start, end) bit ranges of each run of set bits, lowest first."""
+    runs = []
+    while bitmap:
+        start = (bitmap & -bitmap).bit_length() - 1
+        shifted = bitmap >> start
+        length = (~shifted & (shifted + 1)).bit_length() - 1
+        runs.append((start, start + length))
+        bitmap &= ~(((1 << length) - 1) << start)
+    return runs
+
+class AvailabilityEngine:
+    """
+    Per-day busy bitmaps for people and rooms, built from Meeting rows.
+
+    A day is split into SLOT_MINUTES slots; bit i of a bitmap is set when the
+    person or room is booked during slot i. Meeting times are rounded outwards
+    to whole slots. Each day is built with one query, its intervals merged per
+    person/room, and cached until a commit touches a meeting on that day (see
+    track_meeting_days). Entries also expire after `ttl` seconds so writes from
+    other processes are picked up.
+    """
+
+    SLOT_MINUTES = 5
+    SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+
+    def __init__(self, ttl: float = 60.0, max_days: int = 731) -> None:
+        self.ttl = ttl
+        self.max_days = max_days
+        self._days: OrderedDict = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self, days: Optional[set] = None) -> None:
+        """Drop the given days, or every day when `days` is None."""
+        with self._lock:
+            self._generation += 1
+            if days is None:
+                self._days.clear()
+            else:
+                for day in days:
+                    self._days.pop(day, None)
+
+    def day(self, day: Any) -> Dict[str, Dict[str, int]]:
+        """Return {'people': {id: bitmap}, 'rooms': {name: bitmap}} for a date."""
+        with self._lock:
+            entry = self._days.get(day)
+            if entry is not None and entry[0] > time.monotonic():
+                self._days.move_to_end(day)
+                return entry[1]
+            generation = self._generation
+
+        expires_at = time.monotonic() + self.ttl
+        busy = self._build(day)
+        with self._lock:
+            # Don't cache a build that raced with an invalidation
+            if generation != self._generation:
+                return busy
+            self._days[day] = (expires_at, busy)
+            while len(self._days) > self.max_days:
+                self._days.popitem(last=False)
+        return busy
+
+    def _build(self, day: Any) -> Dict[str, Dict[str, int]]:
+        day_start = datetime.combine(day, datetime.min.time())
+        day_end = day_start + timedelta(days=1)
+        window = and_(
+            Meeting.recurrence.is_(None),
+            Meeting.starts_at > day_start - MEETING_MAX_DURATION,
+            Meeting.starts_at < day_end,
+            Meeting.ends_at > day_start
+        )
+        meetings = db.session.query(
+            Meeting.id, Meeting.starts_at, Meeting.ends_at, Meeting.room, Meeting.organizer_id
+        ).filter(window).all()
+        attendees = db.session.query(MeetingAttendee.meeting_id, MeetingAttendee.attendee).join(
+            Meeting, Meeting.id == MeetingAttendee.meeting_id
+        ).filter(window).all()
+        series = Meeting.query.filter(
+            Meeting.recurrence_ends_at > day_start,
+            Meeting.starts_at < day_end
+        ).all()
+
+        def to_span(starts_at: datetime, ends_at: datetime) -> tuple:
+            start = max(starts_at, day_start) - day_start
+            end = min(ends_at, day_end) - day_start
+            return (
+                int(start.total_seconds() // (self.SLOT_MINUTES * 60)),
+                -int(-end.total_seconds() // (self.SLOT_MINUTES * 60))
+            )
+
+        slots = {}
+        people: Dict[str, List[tuple]] = {}
+        rooms: Dict[str, List[tuple]] = {}
+        for meeting_id, starts_at, ends_at, room, organizer_id in meetings:
+            span = to_span(starts_at, ends_at)
+            slots[meeting_id] = span
+            rooms.setdefault(room, []).append(span)
+            people.setdefault(organizer_id, []).append(span)
+        for meeting_id, attendee in attendees:
+            people.setdefault(attendee, []).append(slots[meeting_id])
+        for occurrence in expand_series(series, day_start, day_end):
+            span = to_span(occurrence.starts_at, occurrence.ends_at)
+            rooms.setdefault(occurrence.room, []).append(span)
+            for person in {occurrence.organizer_id, *occurrence.attendees_list}:
+                people.setdefault(person, []).append(span)
+
+        def to_bitmap(intervals: List[tuple]) -> int:
+            bitmap = 0
+            for start, end in merge_intervals(intervals):
+                bitmap |= ((1 << (end - start)) - 1) << start
+            return bitmap
+
+        return {
+            'people': {key: to_bitmap(intervals) for key, intervals in people.items()},
+            'rooms': {key: to_bitmap(intervals) for key, intervals in rooms.items()}
+        }
+
+    def find_slots(self, people: List[str], duration: int, window_start: datetime, window_end: datetime,
+                   day_start: Any, day_end: Any, step: int = 15, rooms: Optional[List[str]] = None,
+                   needs_room: bool = True, limit: int = 20) -> Dict[str, Any]:
+        """
+        Find common free time for `people` between window_start and window_end,
+        restricted to day_start..day_end on each day.
+
+        Returns free windows at least `duration` minutes long, plus up to
+        `limit` candidate start times every `step` minutes with the rooms
+        (from `rooms`) that are free for the whole meeting.
+        """
+        slot = timedelta(minutes=self.SLOT_MINUTES)
+        need = -(-duration // self.SLOT_MINUTES)
+        stride = max(1, step // self.SLOT_MINUTES)
+        free_windows = []
+        candidates = []
+
+        day = window_start.date()
+        while day <= window_end.date() and len(candidates) < limit:
+            midnight = datetime.combine(day, datetime.min.time())
+            lower = max(window_start, datetime.combine(day, day_start)) - midnight
+            upper = min(window_end, datetime.combine(day, day_end)) - midnight
+            first = -int(-lower.total_seconds() // slot.total_seconds())
+            last = int(upper.total_seconds() // slot.total_seconds())
+            day += timedelta(days=1)
+            if last - first < need:
+                continue
+
+            busy = self.day(midnight.date())
+            combined = 0
+            for person in people:
+                combined |= busy['people'].get(person, 0)
+            hours_mask = ((1 << (last - first)) - 1) << first
+            free = ~combined & hours_mask
+
+            for run_start, run_end in bitmap_runs(free):
+                if run_end - run_start < need:
+                    continue
+                free_windows.append({
+                    'start': (midnight + run_start * slot).isoformat(),
+                    'end': (midnight + run_end * slot).isoformat()
+                })
+                # Candidates start on step boundaries measured from midnight
+                start = -(-run_start // stride) * stride
+                while start + need <= run_end and len(candidates) < limit:
+                    meeting_mask = ((1 << need) - 1) << start
+                    free_rooms = [
+                        room for room in (rooms or [])
+                        if not busy['rooms'].get(room, 0) & meeting_mask
+                    ]
+                    if free_rooms or not needs_room:
+                        candidates.append({
+                            'start': (midnight + start * slot).isoformat(),
+                            'end': (midnight + start * slot + timedelta(minutes=duration)).isoformat(),
+                            'rooms': free_rooms
+                        })
+                    start += stride
+
+        return {'freeWindows': free_windows, 'slots': candidates}
+
+    def room_is_free(self, room: str, starts_at: datetime, ends_at: datetime) -> bool:
+        """Check a room over [starts_at, ends_at), which may span several days."""
+        day = starts_at.date()
+        while day <= ends_at.date():
+            midnight = datetime.combine(day, datetime.min.time())
+            first = max(0, int((starts_at - midnight).total_seconds() // (self.SLOT_MINUTES * 60)))
+            last = min(self.SLOTS_PER_DAY, -int(-(ends_at - midnight).total_seconds() // (self.SLOT_MINUTES * 60)))
+            if last > first and self.day(day)['rooms'].get(room, 0) & (((1 << (last - first)) - 1) << first):
+                return False
+            day += timedelta(days=1)
+        return True
+
+availability_engine = AvailabilityEngine()
+
+@event.listens_for(Session, 'after_flush')
+def track_meeting_days(session: Session, flush_context: Any) -> None:
+    """Record the days covered by flushed meetings, before and after the change."""
+    days = session.info.setdefault('meeting_days', set())
+    if days is None:
+        return
+    for obj in chain(session.new, session.dirty, session.deleted):
+        state = db.inspect(obj)
+        if isinstance(obj, MeetingException):
+            # The occurrence's regular slot starts on original_start's day
+            spans = [(obj.original_start, obj.original_start), (obj.starts_at, obj.ends_at)]
+        elif isinstance(obj, Meeting):
+            if obj.recurrence_ends_at is not None or state.attrs.recurrence_ends_at.history.deleted:
+                # A series spans too many days to list; drop them all
+                session.info['meeting_days'] = None
+                return
+            spans = [(obj.starts_at, obj.ends_at)]
+        else:
+            continue
+        old_start = state.attrs.starts_at.history.deleted
+        old_end = state.attrs.ends_at.history.deleted
+        if old_start or old_end:
+            spans.append((old_start[0] if old_start else obj.starts_at, old_end[0] if old_end else obj.ends_at))
+        for starts_at, ends_at in spans:
+            if starts_at is None or ends_at is None:
+                continue
+            day = starts_at.date()
+            while day <= ends_at.date():
+                days.add(day)
+                day += timedelta(days=1)
+
+@event.listens_for(Session, 'do_orm_execute')
+def track_bulk_meeting_writes(orm_execute_state: Any) -> None:
+    # Bulk statements don't say which rows they touch, so drop every day
+    if orm_execute_state.is_select or orm_execute_state.bind_mapper is None:
+        return
+    if orm_execute_state.bind_mapper.local_table.name in ('meeting', 'meeting_attendee', 'meeting_exception'):
+        orm_execute_state.session.info['meeting_days'] = None
+
+@event.listens_for(Session, 'after_commit')
+def invalidate_meeting_days(session: Session) -> None:
+    if 'meeting_days' in session.info:
+        days = session.info.pop('meeting_days')
+        if days is None or days:
+            availability_engine.invalidate(days)
+
+@event.listens_for(Session, 'after_rollback')
+def discard_meeting_days(session: Session) -> None:
+    session.info.pop('meeting_days', None)
+
+def ics_escape(text: Any) -> str:
+    """Escape a TEXT value for iCalendar (RFC 5545 3.3.11)."""
+    return (str(text or '').replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+def ics_line(line: str) -> str:
+    """Fold a content line at 75 octets and terminate it with CRLF."""
+    if len(line.encode('utf-8')) <= 75:
+        return line + '\r\n'
+    parts = []
+    current = ''
+    size = 0
+    for char in line:
+        width = len(char.encode('utf-8'))
+        # Continuation lines start with a space, which counts towards the limit
+        if size + width > (75 if not parts else 74):
+            parts.append(current)
+            current = ''
+            size = 0
+        current += char
+        size += width
+    parts.append(current)
+    return '\r\n '.join(parts) + '\r\n'
+
+def ics_time(value: datetime) -> str:
+    # Meeting times are stored without a zone, so they are emitted as floating times
+    return value.strftime('%Y%m%dT%H%M%S')
+
+def meeting_to_ics(meeting: Meeting, users: Dict[str, User]) -> str:
+    """
+    Render a meeting as VEVENTs: one for a one-off meeting, or the series
+    with an RRULE, EXDATEs for cancelled occurrences and one overriding
+    VEVENT per changed occurrence.
+    """
+    uid = f'meeting-{meeting.id}@team-dashboard'
+    stamp = meeting.created_at.strftime('%Y%m%dT%H%M%SZ')
+    organizer = meeting.organizer
+    common = [
+        f'ORGANIZER;CN={ics_escape(organizer.name)}:mailto:{organizer.email}'
+    ]
+    for attendee in meeting.attendees_list:
+        user = users.get(attendee)
+        if user is not None:
+            common.append(f'ATTENDEE;CN={ics_escape(user.name)}:mailto:{user.email}')
+
+    def event(starts_at: datetime, ends_at: datetime, title: str, room: str, notes: str, extra: List[str]) -> str:
+        lines = [
+            'BEGIN:VEVENT',
+            f'UID:{uid}',
+            f'DTSTAMP:{stamp}',
+            *extra,
+            f'DTSTART:{ics_time(starts_at)}',
+            f'DTEND:{ics_time(ends_at)}',
+            f'SUMMARY:{ics_escape(title)}',
+            f'LOCATION:{ics_escape(room)}',
+            f'DESCRIPTION:{ics_escape(notes)}',
+            *common,
+            'END:VEVENT'
+        ]
+        return ''.join(ics_line(line) for line in lines)
+
+    if not meeting.recurrence:
+        return event(meeting.starts_at, meeting.ends_at, meeting.title, meeting.room, meeting.notes, [])
+
+    exceptions = sorted(meeting.exceptions, key=lambda exception: exception.original_start)
+    extra = [f'RRULE:{meeting.recurrence}']
+    cancelled = [ics_time(exception.original_start) for exception in exceptions if exception.cancelled]
+    if cancelled:
+        extra.append('EXDATE:' + ','.join(cancelled))
+    parts = [event(meeting.starts_at, meeting.ends_at, meeting.title, meeting.room, meeting.notes, extra)]
+    for exception in exceptions:
+        if exception.cancelled:
+            continue
+        occurrence = MeetingOccurrence(meeting, exception.original_start, exception.starts_at,
+                                       exception.ends_at, exception)
+        parts.append(event(occurrence.starts_at, occurrence.ends_at, occurrence.title, occurrence.room,
+                           occurrence.notes, [f'RECURRENCE-ID:{ics_time(exception.original_start)}']))
+    return ''.join(parts)
+
+class CalendarFeedCache:
+    """
+    Per-user iCalendar feeds, assembled from per-meeting VEVENT text.
+
+    A commit touching a meeting drops that meeting's events and the feeds of
+    everyone it lists (before and after the change), see track_feed_changes.
+    Rebuilding a feed then renders only the meetings whose events were
+    dropped. Feeds also expire after `ttl` seconds so writes from other
+    processes are picked up; a cached, unexpired feed is served without any
+    database access. Each feed keeps a hash of the feed secret it was built
+    for, so feed tokens can be checked against it without loading the user.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_feeds: int = 1024, max_events: int = 50000) -> None:
+        self.ttl = ttl
+        self.max_feeds = max_feeds
+        self.max_events = max_events
+        self._feeds: OrderedDict = OrderedDict()
+        # meeting id -> (VEVENT text, ids of users whose feeds include it)
+        self._events: OrderedDict = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def cached(self, user_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            feed = self._feeds.get(user_id)
+            if feed is None or feed['expires_at'] < time.monotonic():
+                return None
+            self._feeds.move_to_end(user_id)
+            return feed
+
+    def invalidate(self, meeting_ids: Optional[set] = None, user_ids: Optional[set] = None) -> None:
+        """Drop the given meetings' events and affected feeds, or everything when meeting_ids is None."""
+        with self._lock:
+            self._generation += 1
+            if meeting_ids is None:
+                self._feeds.clear()
+                self._events.clear()
+                return
+            users = set(user_ids or ())
+            for meeting_id in meeting_ids:
+                entry = self._events.pop(meeting_id, None)
+                if entry is not None:
+                    users |= entry[1]
+            for user_id in users:
+                self._feeds.pop(user_id, None)
+
+    def feed(self, user: User) -> Dict[str, Any]:
+        """Return {'body', 'etag', 'last_modified', 'secret_hash'} for a user's feed, rebuilding it if needed."""
+        feed = self.cached(user.id)
+        if feed is not None:
+            return feed
+        with self._lock:
+            generation = self._generation
+            previous = self._feeds.get(user.id)
+
+        meeting_ids = sorted(meeting_id for meeting_id, in db.session.query(Meeting.id).filter(
+            Meeting.organizer_id == user.id
+        ).union(
+            db.session.query(MeetingAttendee.meeting_id).filter(MeetingAttendee.attendee == user.id)
+        ))
+        with self._lock:
+            events = {meeting_id: self._events[meeting_id][0] for meeting_id in meeting_ids if meeting_id in self._events}
+        missing = [meeting_id for meeting_id in meeting_ids if meeting_id not in events]
+
+        rendered = {}
+        for chunk in chunked(missing):
+            meetings = Meeting.query.filter(Meeting.id.in_(chunk)).options(
+                db.selectinload(Meeting.organizer),
+                db.selectinload(Meeting.exceptions)
+            ).all()
+            attendee_ids = {attendee for meeting in meetings for attendee in meeting.attendees_list}
+            users = {row.id: row for row in User.query.filter(User.id.in_(attendee_ids))} if attendee_ids else {}
+            for meeting in meetings:
+                text = meeting_to_ics(meeting, users)
+                events[meeting.id] = text
+                rendered[meeting.id] = (text, {meeting.organizer_id, *meeting.attendees_list})
+
+        body = ''.join([
+            ics_line('BEGIN:VCALENDAR'),
+            ics_line('VERSION:2.0'),
+            ics_line('PRODID:-//Team Management Dashboard//Meetings//EN'),
+            ics_line('CALSCALE:GREGORIAN'),
+            ics_line(f'X-WR-CALNAME:{ics_escape(user.name)} - Meetings'),
+            *(events[meeting_id] for meeting_id in meeting_ids if meeting_id in events),
+            ics_line('END:VCALENDAR')
+        ])
+        etag = hashlib.sha1(body.encode('utf-8')).hexdigest()
+        last_modified = previous['last_modified'] if previous and previous['etag'] == etag \
+            else datetime.utcnow().replace(microsecond=0)
+        feed = {
+            'body': body,
+            'etag': etag,
+            'last_modified': last_modified,
+            'secret_hash': calendar_secret_hash(user.calendar_feed_secret),
+            'expires_at': time.monotonic() + self.ttl
+        }
+
+        with self._lock:
+            # Don't cache anything built while a commit invalidated it
+            if generation == self._generation:
+                self._events.update(rendered)
+                while len(self._events) > self.max_events:
+                    _, (_, users) = self._events.popitem(last=False)
+                    for user_id in users:
+                        self._feeds.pop(user_id, None)
+                self._feeds[user.id] = feed
+                self._feeds.move_to_end(user.id)
+                while len(self._feeds) > self.max_feeds:
+                    self._feeds.popitem(last=False)
+        return feed
+
+calendar_feeds = CalendarFeedCache()
+
+CALENDAR_FEED_SCOPE = 'calendar'
+
+def calendar_secret_hash(secret: Optional[str]) -> Optional[str]:
+    return hashlib.sha256(secret.encode('utf-8')).hexdigest() if secret else None
+
+@event.listens_for(Session, 'after_flush')
+def track_feed_changes(session: Session, flush_context: Any) -> None:
+    """Record meetings and users whose calendar feeds a flush changes."""
+    changes = session.info.setdefault('feed_changes', (set(), set()))
+    if changes is None:
+        return
+    meeting_ids, user_ids = changes
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Meeting):
+            meeting_ids.add(obj.id)
+            state = db.inspect(obj)
+            user_ids.add(obj.organizer_id)
+            user_ids.update(obj.attendees_list)
+            user_ids.update(value for value in state.attrs.organizer_id.history.deleted if value)
+            for value in state.attrs.attendees.history.deleted:
+                user_ids.update(json_column_to_list(value))
+        elif isinstance(obj, (MeetingAttendee, MeetingException)):
+            meeting_ids.add(obj.meeting_id)
+
+@event.listens_for(Session, 'do_orm_execute')
+def track_bulk_feed_writes(orm_execute_state: Any) -> None:
+    if orm_execute_state.is_select or orm_execute_state.bind_mapper is None:
+        return
+    if orm_execute_state.bind_mapper.local_table.name in ('meeting', 'meeting_attendee', 'meeting_exception', 'user'):
+        orm_execute_state.session.info['feed_changes'] = None
+
+@event.listens_for(Session, 'after_commit')
+def invalidate_feeds(session: Session) -> None:
+    if 'feed_changes' in session.info:
+        changes = session.info.pop('feed_changes')
+        if changes is None:
+            calendar_feeds.invalidate()
+        elif changes[0] or changes[1]:
+            calendar_feeds.invalidate(*changes)
+
+@event.listens_for(Session, 'after_rollback')
+def discard_feed_changes(session: Session) -> None:
+    session.info.pop('feed_changes', None)
+
+def authenticate(token: Optional[str]) -> tuple[Optional[User], Optional[str]]:
+    """
+    Resolve an Authorization header value to its user.
+
+    Returns:
+        (user, None) on success, otherwise (None, error message).
+    """
+    if not token:
+        return None, 'Authorization token missing'
+    try:
+        # Remove 'Bearer ' prefix if present
+        token = token.split()[1] if len(token.split()) > 1 else token
+        data = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'])
+        # Calendar feed tokens only grant read access to the .ics feed
+        if data.get('scope') == CALENDAR_FEED_SCOPE:
+            return None, 'Invalid token'
+        current_user = User.query.get(data['user_id'])
+        if not current_user:
+            return None, 'User not found'
+    except jwt.ExpiredSignatureError:
+        return None, 'Token has expired'
+    except jwt.InvalidTokenError:
+        return None, 'Invalid token'
+    return current_user, None
+
 def token_required(f: Callable[..., R]) -> Callable[..., R]:
     @wraps(f)
     def decorated(*args: Any, **kwargs: Any) -> R:
-        token = request.headers.get('Authorization')
-        if not token:
-            return jsonify({'error': 'Authorization token missing'}), 401  # type: ignore
-        try:
-            # Remove 'Bearer ' prefix if present
-            token = token.split()[1] if len(token.split()) > 1 else token
-            data = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'])
-            current_user = User.query.get(data['user_id'])
-            if not current_user:
-                return jsonify({'error': 'User not found'}), 401  # type: ignore
-        except jwt.ExpiredSignatureError:
-            return jsonify({'error': 'Token has expired'}), 401  # type: ignore
-        except jwt.InvalidTokenError:
-            return jsonify({'error': 'Invalid token'}), 401  # type: ignore
+        current_user, error = authenticate(request.headers.get('Authorization'))
+        if error:
+            return jsonify({'error': error}), 401  # type: ignore
+        g.current_user_id = current_user.id
         return f(current_user, *args, **kwargs)
     return decorated
 
+# Conditional GET and compression for list endpoints. ETags come from the
+# TableVersion rows of the tables a route reads, which every write
+# transaction bumps, so an unchanged list is answered with 304 after a single
+# small query, and a write in any worker process changes the next ETag.
+app.config['COMPRESS_MIN_BYTES'] = int(os.environ.get('COMPRESS_MIN_BYTES', '1024'))
+app.config['GZIP_LEVEL'] = int(os.environ.get('GZIP_LEVEL', '6'))
+app.config['BROTLI_QUALITY'] = int(os.environ.get('BROTLI_QUALITY', '4'))
+COMPRESSIBLE_TYPES = {'application/json', 'application/x-ndjson', 'text/csv', 'text/calendar', 'text/plain'}
+
+def versioned(*tables: str) -> Callable[[Callable[..., R]], Callable[..., R]]:
+    """
+    Add a weak ETag to a token_required GET route and answer If-None-Match.
+
+    Args:
+        tables: Every table the response is built from
+
+    The ETag covers the caller, the full path with query string and the
+    tables' shared versions, which are read before the view runs so a write
+    that lands meanwhile can only make the next ETag differ. Requests served
+    from a read replica get neither an ETag nor a 304.
+    """
+    def decorator(f: Callable[..., R]) -> Callable[..., R]:
+        @wraps(f)
+        def decorated(current_user: User, *args: Any, **kwargs: Any) -> Any:
+            # Versions are read from the primary; a lagging replica's body must not get a current ETag
+            if request.method not in READ_METHODS or reads_from_replica():
+                return f(current_user, *args, **kwargs)
+            etag = hashlib.sha1(repr((
+                current_user.id, request.full_path, get_shared_table_versions(list(tables))
+            )).encode('utf-8')).hexdigest()
+            if request.if_none_match.contains_weak(etag):
+                response = Response(status=304)
+            else:
+                response = app.make_response(f(current_user, *args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag, weak=True)
+            # Let browsers keep the body but revalidate on every load
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return decorated
+    return decorator
+
+def compress_chunks(chunks: Any, encoding: str) -> Any:
+    """Incrementally compress an iterable of byte strings with gzip or brotli."""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=app.config['BROTLI_QUALITY'])
+        compress, finish = compressor.process, compressor.finish
+    else:
+        compressor = zlib.compressobj(app.config['GZIP_LEVEL'], zlib.DEFLATED, 31)
+        compress, finish = compressor.compress, compressor.flush
+    for chunk in chunks:
+        data = compress(chunk)
+        if data:
+            yield data
+    yield finish()
+
+@app.after_request
+def compress_response(response: Response) -> Response:
+    """
+    Compress text responses for clients that accept it. Buffered bodies are
+    compressed above COMPRESS_MIN_BYTES; streamed bodies always are, chunk by
+    chunk as they are sent, so they are never held in memory.
+    """
+    if (response.status_code < 200 or response.status_code in (204, 206, 304) or response.direct_passthrough
+            or 'Content-Encoding' in response.headers or response.mimetype not in COMPRESSIBLE_TYPES):
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = request.accept_encodings.best_match(['br', 'gzip'] if brotli else ['gzip'])
+    if encoding is None:
+        return response
+    if response.is_streamed:
+        response.response = compress_chunks(response.iter_encoded(), encoding)
+        response.headers.pop('Content-Length', None)
+    else:
+        body = response.get_data()
+        if len(body) < app.config['COMPRESS_MIN_BYTES']:
+            return response
+        response.set_data(b''.join(compress_chunks([body], encoding)))
+    response.headers['Content-Encoding'] = encoding
+    return response
+
 @app.route('/api/auth/login', methods=['POST'])
 def login() -> RouteReturn:
     data = request.get_json()
@@ -520,6 +2766,7 @@ def get_user(current_user: User, user_id: str) -> RouteReturn:
 
 @app.route('/api/messages', methods=['GET', 'POST'])
 @token_required
+@versioned('message', 'user')
 def handle_messages(current_user: User) -> RouteReturn:
     if request.method == 'GET':
         # Filter messages: all public messages + private messages where user is sender or recipient
@@ -572,8 +2819,8 @@ def handle_messages(current_user: User) -> RouteReturn:
                 user = User.query.filter_by(name=mention).first()
                 if user:
                     resolved_mentions.append(user.id)
-                # else: # Optional: Handle case where mention ID is invalid
-                #    print(f"Warning: Mentioned user ID '{mention}' not found.")
+                else:
+                    current_app.logger.debug('Mentioned user not found', extra={'mention': mention})
 
             # Get sentiment from data or analyze it
             sentiment = data.get('sentiment')
@@ -583,31 +2830,38 @@ def handle_messages(current_user: User) -> RouteReturn:
 
             # Acknowledge attachment placeholders from request (don't store them directly here)
             attachment_placeholders = data.get('attachments', [])
-            print(f"Received message creation request with {len(attachment_placeholders)} attachment placeholders.")
-
-            # Create new message with relationships
-            new_message = Message(
-                sender_id=current_user.id,
-                content=content, # Use content variable
-                is_private=data.get('isPrivate', False),
-                recipient_id=data.get('recipientId') if data.get('isPrivate', False) else None,
-                priority=data.get('priority', 'normal'),
-                tags=json.dumps(data.get('tags', [])),
-                mentions=json.dumps(resolved_mentions),
-                search_keywords=json.dumps(data.get('searchKeywords', [])),
-                read_by=json.dumps([current_user.id]),
-                sentiment=sentiment
-            )
+            current_app.logger.debug('Creating message', extra={
+                'userId': current_user.id, 'attachmentPlaceholders': len(attachment_placeholders)
+            })
+
+            sender_id = current_user.id
+
+            def insert() -> int:
+                # Create new message with relationships
+                new_message = Message(
+                    sender_id=sender_id,
+                    content=content, # Use content variable
+                    is_private=data.get('isPrivate', False),
+                    recipient_id=data.get('recipientId') if data.get('isPrivate', False) else None,
+                    priority=data.get('priority', 'normal'),
+                    tags=json.dumps(data.get('tags', [])),
+                    mentions=json.dumps(resolved_mentions),
+                    search_keywords=json.dumps(data.get('searchKeywords', [])),
+                    read_by=json.dumps([sender_id]),
+                    sentiment=sentiment
+                )
+                db.session.add(new_message)
+                db.session.flush()
+                return new_message.id
 
-            db.session.add(new_message)
-            db.session.commit() # Commit to get the new_message.id
+            message_id = commit_write(insert) # Committed once this returns
 
             # Fetch the created message with relationships loaded to ensure response is accurate
             # (Attachments relationship will be empty until files are uploaded via /api/files)
             created_message = Message.query.options(
                 db.joinedload(Message.sender),
                 db.joinedload(Message.attachments) # Load attachments relationship
-            ).get(new_message.id)
+            ).get(message_id)
 
             if not created_message:
                  # This should not happen if commit was successful
@@ -636,9 +2890,7 @@ def handle_messages(current_user: User) -> RouteReturn:
 
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Error creating message: {e}")
-            import traceback
-            traceback.print_exc() # Print full traceback for better debugging
+            current_app.logger.exception(f"Error creating message: {e}")
             return jsonify({'error': 'Failed to create message', 'details': str(e)}), 500
 
 # Sentiment analysis endpoint
@@ -734,27 +2986,408 @@ def get_team_sentiment(current_user: User) -> RouteReturn:
         }
     })
 
-# Meetings API routes
-@app.route('/api/meetings', methods=['GET'])
+# Aggregated project analytics endpoint
+@app.route('/api/analytics', methods=['GET'])
 @token_required
-def get_meetings(current_user: User) -> RouteReturn:
+def get_analytics(current_user: User) -> RouteReturn:
+    """
+    Return work item, meeting and message aggregates for the analytics charts.
+
+    Query params:
+        from, to: optional ISO dates (inclusive) bounding the range
+        team: optional comma-separated user IDs to restrict the counts to
+    """
     try:
-        print(f"Getting meetings for user: {current_user.id} ({current_user.name})")
-        meetings = Meeting.query.all()
-        print(f"Found {len(meetings)} meetings")
+        date_from = request.args.get('from')
+        date_to = request.args.get('to')
+        team = sorted(filter(None, request.args.get('team', '').split(',')))
 
-        # Debug information about each meeting
-        for meeting in meetings:
-            print(f"Meeting {meeting.id}: {meeting.title} (Date: {meeting.date})")
+        try:
+            start = datetime.fromisoformat(date_from) if date_from else None
+            # Make the end date inclusive
+            end = datetime.fromisoformat(date_to) + timedelta(days=1) if date_to else None
+        except ValueError as e:
+            return jsonify({'error': f'Invalid date format: {e}'}), 400
+
+        tables = ['work_item', 'meeting', 'message']
+        cache_key = (date_from, date_to, tuple(team))
+        cached = analytics_cache.get(cache_key, tables)
+        if cached is not None:
+            return jsonify(cached), 200
+        versions = get_table_versions(tables)
+
+        # Work items by status and priority, filtered on creation date and assignee
+        work_filters = []
+        if start:
+            work_filters.append(WorkItem.created_at >= start)
+        if end:
+            work_filters.append(WorkItem.created_at < end)
+        if team:
+            work_filters.append(WorkItem.assigned_to.in_(team))
+
+        status_counts = db.session.query(WorkItem.status, db.func.count(WorkItem.id)).filter(
+            *work_filters
+        ).group_by(WorkItem.status).all()
+        priority_counts = db.session.query(WorkItem.priority, db.func.count(WorkItem.id)).filter(
+            *work_filters
+        ).group_by(WorkItem.priority).all()
+
+        # Meetings per day of their start time
+        meeting_filters = []
+        if start:
+            meeting_filters.append(Meeting.starts_at >= start)
+        if end:
+            meeting_filters.append(Meeting.starts_at < end)
+        if team:
+            meeting_filters.append(Meeting.organizer_id.in_(team))
+
+        meeting_day = db.func.date(Meeting.starts_at)
+        meeting_counts = db.session.query(meeting_day, db.func.count(Meeting.id)).filter(
+            *meeting_filters
+        ).group_by(meeting_day).order_by(meeting_day).all()
+
+        # Sentiment of public messages, as in the team sentiment analysis
+        message_filters = [Message.is_private == False]
+        if start:
+            message_filters.append(Message.timestamp >= start)
+        if end:
+            message_filters.append(Message.timestamp < end)
+        if team:
+            message_filters.append(Message.sender_id.in_(team))
+
+        sentiment_counts = db.session.query(Message.sentiment, db.func.count(Message.id)).filter(
+            *message_filters
+        ).group_by(Message.sentiment).all()
+
+        result = {
+            'workStatus': [{'name': status, 'value': count} for status, count in status_counts],
+            'workPriority': [{'name': priority, 'value': count} for priority, count in priority_counts],
+            'meetingTrend': [{'date': date, 'meetings': count} for date, count in meeting_counts],
+            'messageSentiment': [
+                {'name': sentiment, 'value': count} for sentiment, count in sentiment_counts if sentiment
+            ],
+            'totals': {
+                'workItems': sum(count for _, count in status_counts),
+                'meetings': sum(count for _, count in meeting_counts),
+                'messages': sum(count for _, count in sentiment_counts)
+            },
+            'filters': {
+                'from': date_from,
+                'to': date_to,
+                'team': team
+            }
+        }
 
-        return jsonify([meeting.to_dict() for meeting in meetings]), 200
+        analytics_cache.set(cache_key, tables, result, versions)
+        return jsonify(result), 200
     except Exception as e:
-        current_app.logger.error(f"Error fetching meetings: {e}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({'error': 'Failed to fetch meetings', 'details': str(e)}), 500
+        current_app.logger.error(f"Error computing analytics: {e}")
+        return jsonify({'error': 'Failed to compute analytics', 'details': str(e)}), 500
 
-@app.route('/api/meetings', methods=['POST'])
+# Meetings API routes
+@app.route('/api/meetings', methods=['GET'])
+@token_required
+@versioned('meeting', 'meeting_attendee', 'meeting_exception', 'user')
+def get_meetings(current_user: User) -> RouteReturn:
+    """
+    List meetings. Without a range every meeting row is returned, with each
+    recurring series listed once. Given from and to, the occurrences in that
+    range are expanded and streamed in start order.
+
+    Query params:
+        from, to: optional ISO dates (inclusive) bounding the range, at most
+            MEETING_LIST_MAX_RANGE apart; give both or neither
+        room: optional room name
+        attendee: optional user ID; matches organizer or attendee
+    """
+    try:
+        date_from = request.args.get('from')
+        date_to = request.args.get('to')
+
+        try:
+            start = datetime.fromisoformat(date_from) if date_from else None
+            # Make the end date inclusive
+            end = datetime.fromisoformat(date_to) + timedelta(days=1) if date_to else None
+        except ValueError as e:
+            return jsonify({'error': f'Invalid date format: {e}'}), 400
+        if (start is None) != (end is None):
+            return jsonify({'error': 'from and to must be given together'}), 400
+        if start and not timedelta(0) < end - start <= MEETING_LIST_MAX_RANGE:
+            return jsonify({'error': f'Range must be between 1 and {MEETING_LIST_MAX_RANGE.days} days'}), 400
+
+        # Rows match on the series room; expanded occurrences may have been moved
+        row_criteria = []
+        criteria = []
+        room = request.args.get('room')
+        if room:
+            row_criteria.append(Meeting.room == room)
+            criteria.append(or_(
+                Meeting.room == room,
+                db.select(MeetingException.id).where(
+                    MeetingException.meeting_id == Meeting.id,
+                    MeetingException.room == room
+                ).exists()
+            ))
+        if request.args.get('attendee'):
+            attendee = request.args['attendee']
+            attendee_clause = or_(
+                Meeting.organizer_id == attendee,
+                Meeting.id.in_(db.select(MeetingAttendee.meeting_id).where(MeetingAttendee.attendee == attendee))
+            )
+            row_criteria.append(attendee_clause)
+            criteria.append(attendee_clause)
+
+        if start is None:
+            query = Meeting.query.filter(*row_criteria)
+            meetings = query.options(db.selectinload(Meeting.organizer)).order_by(
+                Meeting.starts_at, Meeting.id
+            ).all()
+            current_app.logger.debug('Listed meetings', extra={'userId': current_user.id, 'count': len(meetings)})
+            return jsonify([meeting.to_dict() for meeting in meetings]), 200
+
+        occurrences = expand_meetings(start, end, *criteria)
+
+        # Stream the array so long series are never held in memory at once
+        return stream_json_array(
+            occurrence.to_dict() for occurrence in occurrences if not room or occurrence.room == room
+        )
+    except Exception as e:
+        current_app.logger.exception(f"Error fetching meetings: {e}")
+        return jsonify({'error': 'Failed to fetch meetings', 'details': str(e)}), 500
+
+def calendar_feed_url(user: User) -> str:
+    """Build the user's iCalendar subscription URL from their current feed secret."""
+    # Calendar clients can't refresh a token, so feed tokens don't expire;
+    # rotating the secret is how they are revoked
+    token = jwt.encode({
+        'user_id': user.id,
+        'scope': CALENDAR_FEED_SCOPE,
+        'secret': user.calendar_feed_secret
+    }, current_app.config['SECRET_KEY'], algorithm='HS256')
+    return f"{request.host_url.rstrip('/')}/api/calendar/{token}.ics"
+
+@app.route('/api/meetings/feed-url', methods=['GET'])
+@token_required
+def get_calendar_feed_url(current_user: User) -> RouteReturn:
+    """Return the caller's iCalendar subscription URL."""
+    try:
+        if not current_user.calendar_feed_secret:
+            current_user.calendar_feed_secret = secrets.token_urlsafe(32)
+            db.session.commit()
+        return jsonify({'url': calendar_feed_url(current_user)}), 200
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Error creating calendar feed URL: {e}")
+        return jsonify({'error': 'Failed to create calendar feed URL', 'details': str(e)}), 500
+
+@app.route('/api/meetings/feed-url/rotate', methods=['POST'])
+@token_required
+def rotate_calendar_feed_url(current_user: User) -> RouteReturn:
+    """Revoke the caller's calendar feed URLs and return a new one."""
+    try:
+        current_user.calendar_feed_secret = secrets.token_urlsafe(32)
+        db.session.commit()
+        # Other processes keep accepting the old secret until their cached feed expires
+        calendar_feeds.invalidate(set(), {current_user.id})
+        current_app.logger.info('Rotated calendar feed secret', extra={'userId': current_user.id})
+        return jsonify({'url': calendar_feed_url(current_user)}), 200
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Error rotating calendar feed URL: {e}")
+        return jsonify({'error': 'Failed to rotate calendar feed URL', 'details': str(e)}), 500
+
+@app.route('/api/calendar/<token>.ics', methods=['GET'])
+def get_calendar_feed(token: str) -> RouteReturn:
+    """
+    Serve a user's meetings as an iCalendar feed.
+
+    Authenticated by the token in the URL, since calendar clients can't send
+    headers; the token's secret must match the user's current one. The
+    secret is checked against the hash stored with the cached feed, so a
+    poll of a cached feed needs no database access; the user is loaded only
+    when the feed is not cached or was built for a different secret.
+    Supports If-None-Match and If-Modified-Since.
+    """
+    try:
+        data = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'])
+        if data.get('scope') != CALENDAR_FEED_SCOPE:
+            raise jwt.InvalidTokenError('not a calendar token')
+    except jwt.InvalidTokenError:
+        return jsonify({'error': 'Invalid token'}), 401
+
+    secret = data.get('secret')
+    if not isinstance(secret, str) or not secret:
+        return jsonify({'error': 'Invalid token'}), 401
+    secret_hash = calendar_secret_hash(secret)
+
+    try:
+        feed = calendar_feeds.cached(data['user_id'])
+        if feed is None or not secrets.compare_digest(secret_hash, feed['secret_hash'] or ''):
+            user = db.session.get(User, data['user_id'])
+            if not user:
+                return jsonify({'error': 'User not found'}), 404
+            if not user.calendar_feed_secret or not secrets.compare_digest(secret, user.calendar_feed_secret):
+                return jsonify({'error': 'Invalid token'}), 401
+            if feed is not None:
+                # Built for a secret since rotated by another process
+                calendar_feeds.invalidate(set(), {user.id})
+            feed = calendar_feeds.feed(user)
+
+        if request.if_none_match:
+            not_modified = feed['etag'] in request.if_none_match
+        else:
+            not_modified = request.if_modified_since is not None and \
+                request.if_modified_since.replace(tzinfo=None) >= feed['last_modified']
+        response = Response(status=304) if not_modified else \
+            Response(feed['body'], mimetype='text/calendar')
+        response.set_etag(feed['etag'])
+        response.last_modified = feed['last_modified']
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+    except Exception as e:
+        current_app.logger.error(f"Error building calendar feed: {e}")
+        return jsonify({'error': 'Failed to build calendar feed', 'details': str(e)}), 500
+
+@app.route('/api/meetings/conflicts', methods=['GET'])
+@token_required
+def get_meeting_conflicts(current_user: User) -> RouteReturn:
+    """
+    Check a prospective booking for room and people clashes without saving it.
+
+    Query params:
+        date, startTime, endTime: the slot, as sent when creating a meeting
+        room: optional room name
+        attendees: optional comma-separated attendee IDs; the caller is always included
+        excludeId: optional meeting ID to ignore, for edits
+    """
+    try:
+        try:
+            starts_at, ends_at = parse_meeting_times(
+                request.args.get('date', ''), request.args.get('startTime', ''), request.args.get('endTime', '')
+            )
+            exclude_id = int(request.args['excludeId']) if request.args.get('excludeId') else None
+        except ValueError as e:
+            return jsonify({'error': f'Invalid meeting time: {e}'}), 400
+
+        room = request.args.get('room')
+        people = list(dict.fromkeys([current_user.id] + list(filter(None, request.args.get('attendees', '').split(',')))))
+        conflicts = find_meeting_conflicts(starts_at, ends_at, room, people, exclude_id)
+
+        return jsonify({
+            'conflicts': [meeting_conflict_dict(meeting, room, people) for meeting in conflicts]
+        }), 200
+    except Exception as e:
+        current_app.logger.error(f"Error checking meeting conflicts: {e}")
+        return jsonify({'error': 'Failed to check meeting conflicts', 'details': str(e)}), 500
+
+@app.route('/api/availability', methods=['GET'])
+@token_required
+def get_availability(current_user: User) -> RouteReturn:
+    """
+    Find common free slots for a group of people, with the rooms free for each.
+
+    Query params:
+        duration: meeting length in minutes (required)
+        attendees: optional comma-separated user IDs; the caller is always included
+        from, to: optional ISO dates or datetimes bounding the search (a bare
+            `to` date is inclusive); defaults to the next 7 days
+        dayStart, dayEnd: working hours as HH:MM (default 09:00-17:00)
+        step: minutes between candidate start times (default 15)
+        rooms: optional comma-separated room names; defaults to rooms large
+            enough for everyone
+        needsRoom: 'false' to also return slots with no free room
+        limit: maximum number of candidate slots (default 20, max 200)
+    """
+    try:
+        try:
+            duration = int(request.args['duration'])
+            step = int(request.args.get('step', 15))
+            limit = min(max(int(request.args.get('limit', 20)), 1), 200)
+            date_from = request.args.get('from')
+            date_to = request.args.get('to')
+            window_start = datetime.fromisoformat(date_from) if date_from else datetime.now().replace(second=0, microsecond=0)
+            if date_to:
+                window_end = datetime.fromisoformat(date_to)
+                if len(date_to) == 10:
+                    window_end += timedelta(days=1)
+            else:
+                window_end = window_start + timedelta(days=7)
+            day_start = datetime.strptime(request.args.get('dayStart', '09:00'), '%H:%M').time()
+            day_end = datetime.strptime(request.args.get('dayEnd', '17:00'), '%H:%M').time()
+        except KeyError:
+            return jsonify({'error': 'duration is required'}), 400
+        except ValueError as e:
+            return jsonify({'error': f'Invalid availability query: {e}'}), 400
+
+        if not 0 < duration <= MEETING_MAX_DURATION.total_seconds() // 60:
+            return jsonify({'error': 'duration is out of range'}), 400
+        if step < AvailabilityEngine.SLOT_MINUTES:
+            return jsonify({'error': f'step must be at least {AvailabilityEngine.SLOT_MINUTES} minutes'}), 400
+        if window_end <= window_start or window_end - window_start > timedelta(days=31):
+            return jsonify({'error': 'Search window must be between 0 and 31 days'}), 400
+
+        people = list(dict.fromkeys([current_user.id] + list(filter(None, request.args.get('attendees', '').split(',')))))
+        if request.args.get('rooms'):
+            rooms = list(filter(None, request.args['rooms'].split(',')))
+        else:
+            rooms = [room['name'] for room in MEETING_ROOMS if room['capacity'] >= len(people)]
+
+        result = availability_engine.find_slots(
+            people, duration, window_start, window_end, day_start, day_end,
+            step=step, rooms=rooms, needs_room=request.args.get('needsRoom', 'true') != 'false', limit=limit
+        )
+        return jsonify(result), 200
+    except Exception as e:
+        current_app.logger.error(f"Error finding availability: {e}")
+        return jsonify({'error': 'Failed to find availability', 'details': str(e)}), 500
+
+@app.route('/api/rooms', methods=['GET'])
+@token_required
+def get_rooms(current_user: User) -> RouteReturn:
+    """
+    List bookable rooms. Given date, startTime and endTime, each room's
+    isAvailable reflects that slot and busy rooms carry the clashing meeting.
+    """
+    try:
+        if not request.args.get('date'):
+            return jsonify([dict(room, isAvailable=True) for room in MEETING_ROOMS]), 200
+
+        try:
+            starts_at, ends_at = parse_meeting_times(
+                request.args['date'], request.args.get('startTime', ''), request.args.get('endTime', '')
+            )
+        except ValueError as e:
+            return jsonify({'error': f'Invalid meeting time: {e}'}), 400
+
+        busy = [room['name'] for room in MEETING_ROOMS
+                if not availability_engine.room_is_free(room['name'], starts_at, ends_at)]
+        current = {}
+        if busy:
+            for meeting in Meeting.query.filter(
+                Meeting.room.in_(busy),
+                Meeting.starts_at > starts_at - MEETING_MAX_DURATION,
+                Meeting.starts_at < ends_at,
+                Meeting.ends_at > starts_at
+            ).order_by(Meeting.starts_at).all():
+                current.setdefault(meeting.room, {
+                    'title': meeting.title,
+                    'startTime': meeting.starts_at.strftime('%H:%M'),
+                    'endTime': meeting.ends_at.strftime('%H:%M'),
+                    'attendees': meeting.attendees_list
+                })
+
+        rooms = []
+        for room in MEETING_ROOMS:
+            entry = dict(room, isAvailable=room['name'] not in busy)
+            if room['name'] in current:
+                entry['currentMeeting'] = current[room['name']]
+            rooms.append(entry)
+        return jsonify(rooms), 200
+    except Exception as e:
+        current_app.logger.error(f"Error fetching rooms: {e}")
+        return jsonify({'error': 'Failed to fetch rooms', 'details': str(e)}), 500
+
+@app.route('/api/meetings', methods=['POST'])
 @token_required
 def create_meeting(current_user: User) -> RouteReturn:
     data = request.get_json()
@@ -763,38 +3396,54 @@ def create_meeting(current_user: User) -> RouteReturn:
         return jsonify({'error': 'Missing required meeting fields'}), 400
 
     try:
-        # Add debugging
-        print(f"Creating meeting with data: {data}")
-        print(f"Current user: {current_user.id} ({current_user.name})")
+        starts_at, ends_at = parse_meeting_times(data['date'], data['startTime'], data['endTime'])
+    except ValueError as e:
+        return jsonify({'error': f'Invalid meeting time: {e}'}), 400
+    try:
+        recurrence = str(RecurrenceRule(data['recurrence'])) if data.get('recurrence') else None
+    except ValueError as e:
+        return jsonify({'error': f'Invalid recurrence: {e}'}), 400
 
+    try:
         # Ensure attendees is a valid JSON array
         attendees = data.get('attendees', [])
         if not isinstance(attendees, list):
             attendees = []
 
-        print(f"Attendees: {attendees}")
+        current_app.logger.debug('Creating meeting', extra={
+            'userId': current_user.id, 'attendeeCount': len(attendees), 'room': data.get('room'),
+            'recurring': recurrence is not None
+        })
+
+        # Refuse double bookings unless the client explicitly overrides
+        if not data.get('force'):
+            people = list(dict.fromkeys([current_user.id] + [str(attendee) for attendee in attendees]))
+            conflicts = find_meeting_conflicts(starts_at, ends_at, data['room'], people, recurrence=recurrence)
+            if conflicts:
+                return jsonify({
+                    'error': 'Meeting conflicts with existing bookings',
+                    'conflicts': [meeting_conflict_dict(meeting, data['room'], people) for meeting in conflicts]
+                }), 409
 
         meeting = Meeting(
             title=data['title'],
-            date=data['date'],
-            start_time=data['startTime'],
-            end_time=data['endTime'],
+            starts_at=starts_at,
+            ends_at=ends_at,
             room=data['room'],
             organizer_id=current_user.id,
             attendees=json.dumps(attendees),
             notes=data.get('notes', '')
         )
+        set_meeting_recurrence(meeting, recurrence)
 
         db.session.add(meeting)
         db.session.commit()
 
-        print(f"Successfully created meeting {meeting.id}")
+        current_app.logger.info('Created meeting', extra={'userId': current_user.id, 'meetingId': meeting.id})
         return jsonify(meeting.to_dict()), 201
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Error creating meeting: {e}")
-        import traceback
-        traceback.print_exc()
+        current_app.logger.exception(f"Error creating meeting: {e}")
         return jsonify({'error': 'Failed to create meeting', 'details': str(e)}), 500
 
 @app.route('/api/meetings/<int:meeting_id>', methods=['GET'])
@@ -824,19 +3473,46 @@ def update_meeting(current_user: User, meeting_id: int) -> RouteReturn:
         if meeting.organizer_id != current_user.id:
             return jsonify({'error': 'Unauthorized to update this meeting'}), 403
 
+        series_before = (meeting.starts_at, meeting.ends_at, meeting.recurrence)
+
         # Update fields if provided
         if 'title' in data:
             meeting.title = data['title']
-        if 'date' in data:
-            meeting.date = data['date']
-        if 'startTime' in data:
-            meeting.start_time = data['startTime']
-        if 'endTime' in data:
-            meeting.end_time = data['endTime']
+        if any(key in data for key in ('date', 'startTime', 'endTime')):
+            try:
+                meeting.starts_at, meeting.ends_at = parse_meeting_times(
+                    data.get('date', meeting.starts_at.date().isoformat()),
+                    data.get('startTime', meeting.starts_at.strftime('%H:%M')),
+                    data.get('endTime', meeting.ends_at.strftime('%H:%M'))
+                )
+            except ValueError as e:
+                return jsonify({'error': f'Invalid meeting time: {e}'}), 400
+        if any(key in data for key in ('date', 'startTime', 'endTime', 'recurrence')):
+            try:
+                set_meeting_recurrence(meeting, data['recurrence'] if 'recurrence' in data else meeting.recurrence)
+            except ValueError as e:
+                return jsonify({'error': f'Invalid recurrence: {e}'}), 400
+        # Clients may send back unchanged times; only a changed series can orphan exceptions
+        if (meeting.starts_at, meeting.ends_at, meeting.recurrence) != series_before:
+            drop_orphaned_exceptions(meeting)
         if 'room' in data:
             meeting.room = data['room']
         if 'attendees' in data:
             meeting.attendees = json.dumps(data['attendees'])
+
+        # Re-check clashes when the slot, room or attendees moved
+        if not data.get('force') and any(key in data for key in ('date', 'startTime', 'endTime', 'recurrence', 'room', 'attendees')):
+            people = list(dict.fromkeys([meeting.organizer_id] + [str(attendee) for attendee in meeting.attendees_list]))
+            with db.session.no_autoflush:
+                conflicts = find_meeting_conflicts(
+                    meeting.starts_at, meeting.ends_at, meeting.room, people, meeting.id, meeting.recurrence
+                )
+            if conflicts:
+                db.session.rollback()
+                return jsonify({
+                    'error': 'Meeting conflicts with existing bookings',
+                    'conflicts': [meeting_conflict_dict(conflict, meeting.room, people) for conflict in conflicts]
+                }), 409
         if 'notes' in data:
             meeting.notes = data['notes']
 
@@ -847,6 +3523,127 @@ def update_meeting(current_user: User, meeting_id: int) -> RouteReturn:
         current_app.logger.error(f"Error updating meeting: {e}")
         return jsonify({'error': 'Failed to update meeting', 'details': str(e)}), 500
 
+def drop_orphaned_exceptions(meeting: Meeting) -> None:
+    """
+    Remove the exceptions of a series whose times or rule changed that are
+    keyed by an occurrence start the series no longer produces. Exceptions
+    on occurrences that still exist are kept.
+    """
+    rule = RecurrenceRule(meeting.recurrence) if meeting.recurrence else None
+    meeting.exceptions = [
+        exception for exception in meeting.exceptions
+        if rule is not None and exception.original_start in rule.occurrences(
+            meeting.starts_at, exception.original_start, exception.original_start + timedelta(seconds=1)
+        )
+    ]
+
+def find_series_occurrence(meeting: Meeting, occurrence_start: str) -> Optional[datetime]:
+    """Parse an occurrence start and check the meeting's rule actually produces it."""
+    try:
+        original_start = datetime.fromisoformat(occurrence_start)
+    except ValueError:
+        return None
+    if not meeting.recurrence:
+        return None
+    rule = RecurrenceRule(meeting.recurrence)
+    if original_start not in rule.occurrences(meeting.starts_at, original_start, original_start + timedelta(seconds=1)):
+        return None
+    return original_start
+
+@app.route('/api/meetings/<int:meeting_id>/occurrences/<occurrence_start>', methods=['PUT'])
+@token_required
+def update_meeting_occurrence(current_user: User, meeting_id: int, occurrence_start: str) -> RouteReturn:
+    """
+    Change one occurrence of a recurring meeting. Accepts date, startTime,
+    endTime, title, room and notes; send {"cancelled": false} to restore a
+    cancelled occurrence.
+    """
+    data = request.get_json() or {}
+
+    try:
+        meeting = Meeting.query.get(meeting_id)
+        if not meeting:
+            return jsonify({'error': 'Meeting not found'}), 404
+        if meeting.organizer_id != current_user.id:
+            return jsonify({'error': 'Unauthorized to update this meeting'}), 403
+
+        original_start = find_series_occurrence(meeting, occurrence_start)
+        if original_start is None:
+            return jsonify({'error': 'Occurrence not found'}), 404
+
+        exception = MeetingException.query.filter_by(
+            meeting_id=meeting.id, original_start=original_start
+        ).first() or MeetingException(meeting_id=meeting.id, original_start=original_start)
+        duration = meeting.ends_at - meeting.starts_at
+        current_start = exception.starts_at or original_start
+        current_end = exception.ends_at or original_start + duration
+
+        if any(key in data for key in ('date', 'startTime', 'endTime')):
+            try:
+                exception.starts_at, exception.ends_at = parse_meeting_times(
+                    data.get('date', current_start.date().isoformat()),
+                    data.get('startTime', current_start.strftime('%H:%M')),
+                    data.get('endTime', current_end.strftime('%H:%M'))
+                )
+            except ValueError as e:
+                return jsonify({'error': f'Invalid meeting time: {e}'}), 400
+        elif exception.starts_at is None:
+            exception.starts_at, exception.ends_at = current_start, current_end
+        for field in ('title', 'room', 'notes'):
+            if field in data:
+                setattr(exception, field, data[field])
+        if 'cancelled' in data:
+            exception.cancelled = bool(data['cancelled'])
+        elif exception.cancelled is None:
+            exception.cancelled = False
+
+        occurrence = MeetingOccurrence(meeting, original_start, exception.starts_at, exception.ends_at, exception)
+        if not data.get('force') and not exception.cancelled:
+            people = list(dict.fromkeys([meeting.organizer_id] + meeting.attendees_list))
+            with db.session.no_autoflush:
+                conflicts = find_meeting_conflicts(occurrence.starts_at, occurrence.ends_at, occurrence.room, people, meeting.id)
+            if conflicts:
+                db.session.rollback()
+                return jsonify({
+                    'error': 'Meeting conflicts with existing bookings',
+                    'conflicts': [meeting_conflict_dict(conflict, occurrence.room, people) for conflict in conflicts]
+                }), 409
+
+        db.session.add(exception)
+        db.session.commit()
+        return jsonify(occurrence.to_dict()), 200
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Error updating meeting occurrence: {e}")
+        return jsonify({'error': 'Failed to update meeting occurrence', 'details': str(e)}), 500
+
+@app.route('/api/meetings/<int:meeting_id>/occurrences/<occurrence_start>', methods=['DELETE'])
+@token_required
+def cancel_meeting_occurrence(current_user: User, meeting_id: int, occurrence_start: str) -> RouteReturn:
+    """Cancel one occurrence of a recurring meeting, leaving the rest of the series."""
+    try:
+        meeting = Meeting.query.get(meeting_id)
+        if not meeting:
+            return jsonify({'error': 'Meeting not found'}), 404
+        if meeting.organizer_id != current_user.id:
+            return jsonify({'error': 'Unauthorized to update this meeting'}), 403
+
+        original_start = find_series_occurrence(meeting, occurrence_start)
+        if original_start is None:
+            return jsonify({'error': 'Occurrence not found'}), 404
+
+        exception = MeetingException.query.filter_by(
+            meeting_id=meeting.id, original_start=original_start
+        ).first() or MeetingException(meeting_id=meeting.id, original_start=original_start)
+        exception.cancelled = True
+        db.session.add(exception)
+        db.session.commit()
+        return jsonify({'message': 'Occurrence cancelled successfully'}), 200
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Error cancelling meeting occurrence: {e}")
+        return jsonify({'error': 'Failed to cancel meeting occurrence', 'details': str(e)}), 500
+
 @app.route('/api/meetings/<int:meeting_id>', methods=['DELETE'])
 @token_required
 def delete_meeting(current_user: User, meeting_id: int) -> RouteReturn:
@@ -867,24 +3664,186 @@ def delete_meeting(current_user: User, meeting_id: int) -> RouteReturn:
         current_app.logger.error(f"Error deleting meeting: {e}")
         return jsonify({'error': 'Failed to delete meeting', 'details': str(e)}), 500
 
+# Sortable work item columns for keyset pagination
+WORK_ITEM_SORTS = {
+    'id': lambda: WorkItem.id,
+    'createdAt': lambda: WorkItem.created_at,
+    'updatedAt': lambda: WorkItem.updated_at,
+    'dueDate': lambda: WorkItem.due_date
+}
+
+# Columns the grouped-counts mode can group by
+WORK_ITEM_GROUPS = {
+    'status': lambda: WorkItem.status,
+    'priority': lambda: WorkItem.priority,
+    'assignee': lambda: WorkItem.assigned_to
+}
+
+def filter_work_items(query: Any, args: Any) -> Any:
+    """
+    Apply the list filters from request args to a WorkItem query.
+
+    Supports comma-separated status, priority and tag lists, assignee (a user
+    ID, or 'none' for unassigned) and an inclusive dueFrom/dueTo ISO date
+    range. Raises ValueError on malformed dates.
+    """
+    if args.get('status'):
+        query = query.filter(WorkItem.status.in_(args['status'].split(',')))
+    if args.get('priority'):
+        query = query.filter(WorkItem.priority.in_(args['priority'].split(',')))
+
+    assignee = args.get('assignee')
+    if assignee == 'none':
+        query = query.filter(WorkItem.assigned_to.is_(None))
+    elif assignee:
+        query = query.filter(WorkItem.assigned_to == assignee)
+
+    if args.get('tag'):
+        tagged = db.select(WorkItemTag.work_item_id).where(WorkItemTag.tag.in_(args['tag'].split(',')))
+        query = query.filter(WorkItem.id.in_(tagged))
+
+    if args.get('dueFrom'):
+        query = query.filter(WorkItem.due_date >= datetime.fromisoformat(args['dueFrom']))
+    if args.get('dueTo'):
+        # Make the end date inclusive
+        query = query.filter(WorkItem.due_date < datetime.fromisoformat(args['dueTo']) + timedelta(days=1))
+
+    return query
+
+def encode_cursor(value: Any, item_id: int) -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return base64.urlsafe_b64encode(json.dumps([value, item_id]).encode('utf-8')).decode('ascii')
+
+def decode_cursor(cursor: str, sort_key: str) -> tuple:
+    value, item_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    if value is not None and sort_key != 'id':
+        value = datetime.fromisoformat(value)
+    return value, int(item_id)
+
+def keyset_page(query: Any, sort: str, cursor: Optional[str], limit: int) -> tuple:
+    """
+    Order a WorkItem query by `sort` ('-' prefix for descending) with id as the
+    tie-breaker, and return the page after `cursor` plus the next cursor (or None).
+    Due dates sort with nulls last in both directions.
+    """
+    descending = sort.startswith('-')
+    sort_key = sort.lstrip('-')
+    if sort_key not in WORK_ITEM_SORTS:
+        raise ValueError(f"Unsupported sort field: {sort_key}")
+    column = WORK_ITEM_SORTS[sort_key]()
+    nullable = sort_key == 'dueDate'
+
+    if cursor:
+        value, last_id = decode_cursor(cursor, sort_key)
+        id_after = WorkItem.id < last_id if descending else WorkItem.id > last_id
+        if sort_key == 'id':
+            query = query.filter(id_after)
+        elif value is None:
+            query = query.filter(column.is_(None), id_after)
+        else:
+            value_after = column < value if descending else column > value
+            after = or_(value_after, and_(column == value, id_after))
+            if nullable:
+                after = or_(after, column.is_(None))
+            query = query.filter(after)
+
+    ordering = column.desc() if descending else column.asc()
+    if nullable:
+        ordering = ordering.nulls_last()
+    query = query.order_by(ordering)
+    if sort_key != 'id':
+        query = query.order_by(WorkItem.id.desc() if descending else WorkItem.id.asc())
+
+    # Fetch one extra row to learn whether another page follows
+    items = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, column.key), last.id)
+    return items, next_cursor
+
+def iter_by_id(query: Any, id_column: Any, batch_size: int = 500) -> Any:
+    """
+    Yield every row of `query` in id order, fetching `batch_size` rows per
+    SELECT with keyset pagination. Unlike yield_per this works with
+    selectinload options, and no cursor stays open between batches.
+    """
+    last_id = None
+    while True:
+        batch_query = query if last_id is None else query.filter(id_column > last_id)
+        batch = batch_query.order_by(id_column).limit(batch_size).all()
+        yield from batch
+        if len(batch) < batch_size:
+            return
+        last_id = batch[-1].id
+
 # Work items API routes
 @app.route('/api/work-items', methods=['GET'])
 @token_required
+@versioned('work_item', 'work_item_tag', 'file_attachment', 'user')
 def get_work_items(current_user: User) -> RouteReturn:
     try:
-        print(f"Getting work items for user: {current_user.id} ({current_user.name})")
-        work_items = WorkItem.query.all()
-        print(f"Found {len(work_items)} work items")
+        # Sparse fieldset, e.g. ?fields=id,title,status
+        fields = None
+        if request.args.get('fields'):
+            fields = set(request.args['fields'].split(','))
+            unknown = fields - WorkItem.FIELD_SERIALIZERS.keys()
+            if unknown:
+                return jsonify({'error': f"Unknown fields: {', '.join(sorted(unknown))}"}), 400
 
-        # Debug information about each work item
-        for item in work_items:
-            print(f"Work item {item.id}: {item.title} (Status: {item.status})")
+        try:
+            query = filter_work_items(WorkItem.query, request.args)
+        except ValueError as e:
+            return jsonify({'error': f'Invalid date format: {e}'}), 400
+
+        # Grouped-counts mode: per-group totals without row payloads, e.g. ?counts=status
+        group = request.args.get('counts')
+        if group:
+            if group not in WORK_ITEM_GROUPS:
+                return jsonify({'error': f"Unsupported counts grouping: {group}"}), 400
+            column = WORK_ITEM_GROUPS[group]()
+            counts = dict(query.with_entities(column, db.func.count(WorkItem.id)).group_by(column).all())
+            return jsonify({
+                'counts': {key if key is not None else 'none': count for key, count in counts.items()},
+                'total': sum(counts.values())
+            }), 200
+
+        query = query.options(*work_item_load_options(fields))
 
-        return jsonify([item.to_dict() for item in work_items]), 200
+        if request.args.get('cursor') or request.args.get('limit'):
+            # Keyset pagination: stable and index-backed at any depth
+            limit = min(max(request.args.get('limit', default=50, type=int), 1), 500)
+            try:
+                work_items, next_cursor = keyset_page(
+                    query, request.args.get('sort', 'id'), request.args.get('cursor'), limit
+                )
+            except (ValueError, TypeError) as e:
+                return jsonify({'error': f'Invalid sort or cursor: {e}'}), 400
+            headers = {'X-Next-Cursor': next_cursor or ''}
+            return jsonify([item.to_dict(fields) for item in work_items]), 200, headers
+
+        # Offset pagination only when asked to, so existing clients still get every item
+        page = request.args.get('page', type=int)
+        if page is not None:
+            per_page = min(max(request.args.get('perPage', default=50, type=int), 1), 500)
+            page = max(page, 1)
+            headers = {
+                'X-Total-Count': str(query.order_by(None).count()),
+                'X-Page': str(page),
+                'X-Per-Page': str(per_page)
+            }
+            query = query.order_by(WorkItem.id).offset((page - 1) * per_page).limit(per_page)
+
+            work_items = query.all()
+            current_app.logger.debug('Listed work items', extra={'userId': current_user.id, 'count': len(work_items)})
+            return jsonify([item.to_dict(fields) for item in work_items]), 200, headers
+
+        # Every item: stream them in batches rather than loading the whole table
+        return stream_json_array(item.to_dict(fields) for item in iter_by_id(query, WorkItem.id))
     except Exception as e:
-        current_app.logger.error(f"Error fetching work items: {e}")
-        import traceback
-        traceback.print_exc()
+        current_app.logger.exception(f"Error fetching work items: {e}")
         return jsonify({'error': 'Failed to fetch work items', 'details': str(e)}), 500
 
 @app.route('/api/work-items', methods=['POST'])
@@ -896,9 +3855,9 @@ def create_work_item(current_user: User) -> RouteReturn:
         return jsonify({'error': 'Missing required fields'}), 400
 
     try:
-        # Add debugging
-        print(f"Creating work item with data: {data}")
-        print(f"Current user: {current_user.id} ({current_user.name})")
+        current_app.logger.debug('Creating work item', extra={
+            'userId': current_user.id, 'assignedTo': data.get('assignedTo'), 'tagCount': len(data.get('tags') or [])
+        })
 
         # Check if assignedTo exists and is a valid user ID
         assigned_to = data.get('assignedTo')
@@ -913,7 +3872,6 @@ def create_work_item(current_user: User) -> RouteReturn:
             try:
                 due_date = datetime.fromisoformat(data['dueDate'])
             except ValueError as e:
-                print(f"Error parsing due date: {e}")
                 return jsonify({'error': f'Invalid date format: {e}'}), 400
 
         # Create work item
@@ -934,12 +3892,155 @@ def create_work_item(current_user: User) -> RouteReturn:
         return jsonify(work_item.to_dict()), 201
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Error creating work item: {e}")
-        # Also print to console for debugging
-        import traceback
-        traceback.print_exc()
+        current_app.logger.exception(f"Error creating work item: {e}")
         return jsonify({'error': 'Failed to create work item', 'details': str(e)}), 500
 
+# Work item patch fields accepted by the bulk endpoint, mapped to columns
+WORK_ITEM_PATCH_FIELDS = {
+    'title': 'title',
+    'description': 'description',
+    'status': 'status',
+    'priority': 'priority',
+    'assignedTo': 'assigned_to',
+    'dueDate': 'due_date',
+    'tags': 'tags'
+}
+WORK_ITEM_NULLABLE_PATCH_FIELDS = {'description', 'assignedTo', 'dueDate'}
+
+# Keep IN lists well under SQLite's bound parameter limit
+BULK_CHUNK_SIZE = 500
+
+def parse_work_item_patch(patch: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert an API patch into column values. Raises ValueError if it is malformed."""
+    unknown = set(patch) - set(WORK_ITEM_PATCH_FIELDS) - {'id'}
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    values = {}
+    for field, column in WORK_ITEM_PATCH_FIELDS.items():
+        if field not in patch:
+            continue
+        value = patch[field]
+        if field == 'title' and not value:
+            raise ValueError('Title cannot be empty')
+        if field in WORK_ITEM_NULLABLE_PATCH_FIELDS and value is None:
+            pass
+        elif field != 'tags' and not isinstance(value, str):
+            raise ValueError(f'{field} must be a string')
+        if field == 'dueDate':
+            value = datetime.fromisoformat(value) if value else None
+        elif field == 'tags':
+            if not isinstance(value, list) or not all(isinstance(tag, str) for tag in value):
+                raise ValueError('Tags must be a list of strings')
+            value = json.dumps(value)
+        values[column] = value
+
+    if not values:
+        raise ValueError('Patch has no fields to update')
+    return values
+
+def chunked(values: List[Any], size: int = BULK_CHUNK_SIZE) -> Any:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+@app.route('/api/work-items/bulk', methods=['POST'])
+@token_required
+def bulk_update_work_items(current_user: User) -> RouteReturn:
+    """
+    Apply a list of work item patches in one transaction.
+
+    Body: {"patches": [{"id": 1, "status": "done"}, ...], "atomic": false}
+
+    Each patch is authorized like PUT /api/work-items/<id> (creator or
+    assignee) and gets its own result. Patches carrying identical changes are
+    applied with one set-based UPDATE per group. With "atomic": true nothing is
+    written unless every patch succeeds.
+    """
+    data = request.get_json()
+    if not data or not isinstance(data.get('patches'), list):
+        return jsonify({'error': 'A list of patches is required'}), 400
+
+    patches = data['patches']
+    if len(patches) > 5000:
+        return jsonify({'error': 'At most 5000 patches per request'}), 400
+
+    results: Dict[int, Dict[str, Any]] = {}
+    parsed: Dict[int, Dict[str, Any]] = {}
+    order = []
+    for index, patch in enumerate(patches):
+        item_id = patch.get('id') if isinstance(patch, dict) else None
+        if not isinstance(item_id, int) or isinstance(item_id, bool):
+            return jsonify({'error': f'Patch {index} needs an integer id'}), 400
+        if item_id in results:
+            return jsonify({'error': f'Work item {item_id} appears in more than one patch'}), 400
+        order.append(item_id)
+        try:
+            parsed[item_id] = parse_work_item_patch(patch)
+            results[item_id] = {'id': item_id, 'status': 'updated'}
+        except (ValueError, TypeError) as e:
+            results[item_id] = {'id': item_id, 'status': 'invalid', 'error': str(e)}
+
+    try:
+        # Ownership for every targeted item, in a few IN queries
+        owners = {}
+        for ids in chunked(list(parsed)):
+            for item_id, created_by, assigned_to in db.session.query(
+                WorkItem.id, WorkItem.created_by, WorkItem.assigned_to
+            ).filter(WorkItem.id.in_(ids)):
+                owners[item_id] = (created_by, assigned_to)
+
+        # New assignees must exist
+        assignees = list({values['assigned_to'] for values in parsed.values() if values.get('assigned_to')})
+        known_users = set()
+        for ids in chunked(assignees):
+            known_users.update(user_id for user_id, in db.session.query(User.id).filter(User.id.in_(ids)))
+
+        # Group authorized patches by their exact change set
+        groups: Dict[tuple, List[int]] = {}
+        for item_id, values in parsed.items():
+            if item_id not in owners:
+                results[item_id] = {'id': item_id, 'status': 'not_found', 'error': 'Work item not found'}
+            elif current_user.id not in owners[item_id]:
+                results[item_id] = {'id': item_id, 'status': 'forbidden', 'error': 'Unauthorized to update this work item'}
+            elif values.get('assigned_to') and values['assigned_to'] not in known_users:
+                results[item_id] = {'id': item_id, 'status': 'invalid', 'error': 'Assigned user not found'}
+            else:
+                groups.setdefault(tuple(sorted(values.items())), []).append(item_id)
+
+        failed = [result for result in results.values() if result['status'] != 'updated']
+        if data.get('atomic') and failed:
+            for result in results.values():
+                if result['status'] == 'updated':
+                    result['status'] = 'skipped'
+            return jsonify({'updated': 0, 'results': [results[item_id] for item_id in order]}), 409
+
+        for change_set, ids in groups.items():
+            values = dict(change_set)
+            for chunk in chunked(ids):
+                db.session.query(WorkItem).filter(WorkItem.id.in_(chunk)).update(
+                    values, synchronize_session=False
+                )
+                if 'tags' in values:
+                    # Set-based updates skip the ORM tag sync, so rewrite the tag rows here
+                    db.session.query(WorkItemTag).filter(WorkItemTag.work_item_id.in_(chunk)).delete(
+                        synchronize_session=False
+                    )
+                    tags = list(dict.fromkeys(str(tag)[:50] for tag in json.loads(values['tags'])))
+                    if tags:
+                        db.session.execute(db.insert(WorkItemTag), [
+                            {'work_item_id': item_id, 'tag': tag} for item_id in chunk for tag in tags
+                        ])
+
+        db.session.commit()
+        return jsonify({
+            'updated': sum(len(ids) for ids in groups.values()),
+            'results': [results[item_id] for item_id in order]
+        }), 200
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Error bulk updating work items: {e}")
+        return jsonify({'error': 'Failed to update work items', 'details': str(e)}), 500
+
 @app.route('/api/work-items/<int:item_id>', methods=['GET'])
 @token_required
 def get_work_item(current_user: User, item_id: int) -> RouteReturn:
@@ -1013,15 +4114,99 @@ def delete_work_item(current_user: User, item_id: int) -> RouteReturn:
 # Chart data API routes
 @app.route('/api/chart-data', methods=['GET'])
 @token_required
+@versioned('chart_data', *sorted({definition.table for definition in CHART_DEFINITIONS.values()}))
 def get_chart_data(current_user: User) -> RouteReturn:
     try:
         chart_type = request.args.get('type')
-        charts = ChartData.query.filter_by(chart_type=chart_type) if chart_type else ChartData.query.all()
-        return jsonify([chart.to_dict() for chart in charts]), 200
+        query = ChartData.query.options(db.defer(ChartData.data))
+        if chart_type:
+            query = query.filter_by(chart_type=chart_type)
+        parts = chart_json_cache.serialize(query.all())
+
+        # Computed charts are served alongside any stored charts of the same type
+        if chart_type in CHART_DEFINITIONS:
+            parts.append(json.dumps(chart_engine.to_dict(chart_type)))
+
+        return json_response(f"[{','.join(parts)}]")
     except Exception as e:
         current_app.logger.error(f"Error fetching chart data: {e}")
         return jsonify({'error': 'Failed to fetch chart data', 'details': str(e)}), 500
 
+@app.route('/api/chart-data/computed', methods=['GET'])
+@token_required
+def get_computed_chart_types(current_user: User) -> RouteReturn:
+    return jsonify([{
+        'chartType': name,
+        'title': definition.title,
+        'display': definition.display
+    } for name, definition in CHART_DEFINITIONS.items()]), 200
+
+@app.route('/api/chart-data/computed/<string:chart_type>', methods=['GET'])
+@token_required
+def get_computed_chart(current_user: User, chart_type: str) -> RouteReturn:
+    if chart_type not in CHART_DEFINITIONS:
+        return jsonify({'error': 'Computed chart type not found'}), 404
+
+    try:
+        return jsonify(chart_engine.to_dict(chart_type)), 200
+    except Exception as e:
+        current_app.logger.error(f"Error computing chart {chart_type}: {e}")
+        return jsonify({'error': 'Failed to compute chart data', 'details': str(e)}), 500
+
+@app.route('/api/chart-data/batch', methods=['GET'])
+@token_required
+def get_chart_data_batch(current_user: User) -> RouteReturn:
+    """
+    Fetch several chart types in one round-trip.
+
+    Query params:
+        types: comma-separated chart types, e.g. tasks,performance,team
+
+    Returns a mapping of chart type to its charts. Supports If-None-Match:
+    the ETag is derived from a cheap aggregate over the matching rows (plus
+    the cached series of any computed chart types), so an unchanged
+    dashboard gets a 304 without loading any chart payloads.
+    """
+    types = list(dict.fromkeys(filter(None, request.args.get('types', '').split(','))))
+    if not types:
+        return jsonify({'error': 'At least one chart type is required'}), 400
+
+    try:
+        # Row count, id sum and latest update change on any insert, update or delete
+        count, id_sum, last_updated = db.session.query(
+            db.func.count(ChartData.id),
+            db.func.coalesce(db.func.sum(ChartData.id), 0),
+            db.func.max(ChartData.updated_at)
+        ).filter(ChartData.chart_type.in_(types)).one()
+        computed_types = [chart_type for chart_type in types if chart_type in CHART_DEFINITIONS]
+        computed_data = [chart_engine.evaluate(chart_type)['data'] for chart_type in computed_types]
+        etag = hashlib.sha1(
+            f"{','.join(types)}|{count}|{id_sum}|{last_updated}|{json.dumps(computed_data, default=str)}".encode('utf-8')
+        ).hexdigest()
+
+        if etag in request.if_none_match:
+            response = Response(status=304)
+        else:
+            charts = ChartData.query.options(db.defer(ChartData.data)).filter(
+                ChartData.chart_type.in_(types)
+            ).order_by(ChartData.id).all()
+            result: Dict[str, List[str]] = {chart_type: [] for chart_type in types}
+            for chart, text in zip(charts, chart_json_cache.serialize(charts)):
+                result[chart.chart_type].append(text)
+            for chart_type in computed_types:
+                result[chart_type].append(json.dumps(chart_engine.to_dict(chart_type)))
+            response = json_response('{' + ','.join(
+                f"{json.dumps(chart_type)}:[{','.join(parts)}]" for chart_type, parts in result.items()
+            ) + '}')
+
+        response.set_etag(etag)
+        # Let browsers keep the body but revalidate on every load
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+    except Exception as e:
+        current_app.logger.error(f"Error fetching chart data batch: {e}")
+        return jsonify({'error': 'Failed to fetch chart data', 'details': str(e)}), 500
+
 @app.route('/api/chart-data', methods=['POST'])
 @token_required
 def create_chart_data(current_user: User) -> RouteReturn:
@@ -1103,29 +4288,36 @@ def upload_file(current_user: User) -> RouteReturn:
         # Calculate file size
         file_size = len(base64.b64decode(file_data.split(',')[1] if ',' in file_data else file_data))
 
-        # Create file attachment record
-        file_attachment = FileAttachment(
-            filename=filename,
-            file_type=file_type,
-            file_size=file_size,
-            data=file_data,
-            message_id=data.get('messageId'),
-            work_item_id=data.get('workItemId'),
-            uploader_id=current_user.id
-        )
-
-        # Add debugging information
-        print(f"Uploading file: {filename}, type: {file_type}, size: {file_size}, message_id: {data.get('messageId')}, work_item_id: {data.get('workItemId')}")
-
-        db.session.add(file_attachment)
-        db.session.commit()
+        uploader_id = current_user.id
+
+        def insert() -> Dict[str, Any]:
+            # Create file attachment record
+            file_attachment = FileAttachment(
+                filename=filename,
+                file_type=file_type,
+                file_size=file_size,
+                data=file_data,
+                message_id=data.get('messageId'),
+                work_item_id=data.get('workItemId'),
+                uploader_id=uploader_id
+            )
+            db.session.add(file_attachment)
+            db.session.flush()
+            return file_attachment.to_dict()
+
+        current_app.logger.debug('Uploading file', extra={
+            'userId': current_user.id,
+            'fileName': filename,
+            'fileType': file_type,
+            'fileSize': file_size,
+            'messageId': data.get('messageId'),
+            'workItemId': data.get('workItemId')
+        })
 
-        return jsonify(file_attachment.to_dict()), 201
+        return jsonify(commit_write(insert)), 201
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Error uploading file: {e}")
-        import traceback
-        traceback.print_exc()
+        current_app.logger.exception(f"Error uploading file: {e}")
         return jsonify({'error': 'Failed to upload file', 'details': str(e)}), 500
 
 @app.route('/api/files/<int:file_id>', methods=['GET'])
@@ -1198,130 +4390,47 @@ def check_email(email: str) -> RouteReturn:
         current_app.logger.error(f"Error checking email: {e}")
         return jsonify({'error': 'Failed to check email', 'details': str(e)}), 500
 
+PROFILE_ID_PATTERN = re.compile(r'^[0-9T]+-[0-9a-f]{6}$')
+
+@app.route('/api/dev/profiles', methods=['GET'])
+@token_required
+def list_profiles(current_user: User) -> RouteReturn:
+    """List recent request profiles, newest first. Admins only."""
+    if current_user.id not in app.config['PROFILER_ADMINS']:
+        return jsonify({'error': 'Forbidden'}), 403
+    directory = app.config['PROFILER_DIR']
+    if not os.path.isdir(directory):
+        return jsonify([]), 200
+    captures = []
+    for name in sorted((name for name in os.listdir(directory) if name.endswith('.json')), reverse=True):
+        try:
+            with open(os.path.join(directory, name)) as f:
+                captures.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return jsonify(captures), 200
+
+@app.route('/api/dev/profiles/<capture_id>', methods=['GET'])
+@token_required
+def get_profile(current_user: User, capture_id: str) -> RouteReturn:
+    """Download a profile as collapsed stacks, e.g. for flamegraph.pl or speedscope. Admins only."""
+    if current_user.id not in app.config['PROFILER_ADMINS']:
+        return jsonify({'error': 'Forbidden'}), 403
+    if not PROFILE_ID_PATTERN.match(capture_id):
+        return jsonify({'error': 'Profile not found'}), 404
+    path = os.path.join(app.config['PROFILER_DIR'], f'{capture_id}.collapsed')
+    if not os.path.exists(path):
+        return jsonify({'error': 'Profile not found'}), 404
+    return send_from_directory(app.config['PROFILER_DIR'], f'{capture_id}.collapsed', mimetype='text/plain')
+
 # Add route to reset database (development only)
 @app.route('/api/dev/reset-db', methods=['POST'])
 def reset_database() -> RouteReturn:
+    # seed.py imports this module, so load it on first use
+    from seed import seed_database
     try:
-        # Drop all tables
-        db.drop_all()
-
-        # Create all tables
-        db.create_all()
-
-        # Create test user
-        test_user = User(
-            id=str(uuid.uuid4()),
-            name="Test User",
-            email="test@example.com",
-            is_online=True
-        )
-        test_user.set_password("password123")
-
-        test_user2 = User(
-            id=str(uuid.uuid4()),
-            name="Another User",
-            email="user2@example.com",
-            is_online=False
-        )
-        test_user2.set_password("password123")
-
-        db.session.add(test_user)
-        db.session.add(test_user2)
-        db.session.commit()
-
-        # Create test messages
-        messages = [
-            Message(
-                content="Hello! How is everyone doing?",
-                sender_id=test_user.id,
-                is_private=False,
-                priority="normal",
-                sentiment="positive",
-                tags=json.dumps(["greeting", "team"]),
-                mentions=json.dumps([])
-            ),
-            Message(
-                content="I'm working on the new feature. It's coming along well!",
-                sender_id=test_user.id,
-                is_private=False,
-                priority="normal",
-                sentiment="positive",
-                tags=json.dumps(["work", "development"]),
-                mentions=json.dumps([])
-            ),
-            Message(
-                content="@AnotherUser Can you help with the database issue?",
-                sender_id=test_user.id,
-                is_private=True,
-                priority="urgent",
-                sentiment="neutral",
-                tags=json.dumps(["help", "database"]),
-                mentions=json.dumps([test_user2.id])
-            )
-        ]
-
-        for msg in messages:
-            db.session.add(msg)
-
-        # Create test meetings
-        meetings = [
-            Meeting(
-                title="Team Standup",
-                date=datetime.utcnow().date().isoformat(),
-                start_time="09:00",
-                end_time="09:30",
-                room="Conference Room A",
-                organizer_id=test_user.id,
-                attendees=json.dumps([test_user.id, test_user2.id]),
-                notes="Daily standup meeting to discuss progress and blockers."
-            ),
-            Meeting(
-                title="Sprint Planning",
-                date=(datetime.utcnow() + timedelta(days=1)).date().isoformat(),
-                start_time="14:00",
-                end_time="16:00",
-                room="Main Hall",
-                organizer_id=test_user.id,
-                attendees=json.dumps([test_user.id, test_user2.id]),
-                notes="Planning for the next sprint cycle."
-            )
-        ]
-
-        for meeting in meetings:
-            db.session.add(meeting)
-
-        # Create work items
-        statuses = ["todo", "in-progress", "review", "done"]
-        priorities = ["low", "medium", "high", "urgent"]
-
-        for i in range(1, 11):
-            work_item = WorkItem(
-                title=f"Task {i}",
-                description=f"This is a description for task {i}",
-                status=random.choice(statuses),
-                priority=random.choice(priorities),
-                assigned_to=test_user.id if i % 2 == 0 else test_user2.id,
-                created_by=test_user.id,
-                due_date=(datetime.utcnow() + timedelta(days=i)).date(),
-                tags=json.dumps([f"tag{i}", "work"])
-            )
-            db.session.add(work_item)
-
-        # Create chart data
-        chart = ChartData(
-            chart_type="bar",
-            title="Sample Task Status",
-            data=json.dumps([
-                {"name": "Todo", "value": 5},
-                {"name": "In Progress", "value": 3},
-                {"name": "Review", "value": 2},
-                {"name": "Done", "value": 7}
-            ])
-        )
-        db.session.add(chart)
-
-        db.session.commit()
-        return jsonify({'message': 'Database reset successfully'}), 200
+        counts = seed_database()
+        return jsonify({'message': 'Database reset successfully', 'rows': counts}), 200
     except Exception as e:
         db.session.rollback()
         current_app.logger.error(f"Error resetting database: {e}")
@@ -1348,27 +4457,84 @@ def delete_message(current_user: User, message_id: int) -> RouteReturn:
         current_app.logger.error(f"Error deleting message: {e}")
         return jsonify({'error': 'Failed to delete message', 'details': str(e)}), 500
 
-# Add a new route for summarizing chat messages using the Gemini API
-@app.route('/api/summarize', methods=['POST'])
-@token_required
-def summarize_chat(current_user: User) -> RouteReturn:
-    data = request.get_json()
-    if not data or 'messages' not in data:
-        return jsonify({'error': 'Messages to summarize are required'}), 400
+# Outbound AI and translation calls. These can take seconds, so the WSGI
+# routes below can cap how many worker threads per process wait on them
+# (AI_SYNC_CONCURRENCY) and turn the rest away with a 503. The default is
+# above any usual thread count, so nothing is turned away unless it is
+# lowered. asgi.py serves the same endpoints on an event loop, where waiting
+# holds no thread, with a concurrency limit per endpoint.
+app.config['GEMINI_API_URL'] = os.environ.get('GEMINI_API_URL', 'https://generativelanguage.googleapis.com/v1beta')
+app.config['GEMINI_MODEL'] = os.environ.get('GEMINI_MODEL', 'gemini-2.0-flash-lite')
+app.config['TRANSLATE_URL'] = os.environ.get('TRANSLATE_URL', 'https://translate.google.com/m')
+app.config['AI_TIMEOUT'] = float(os.environ.get('AI_TIMEOUT', '30'))
+app.config['AI_SYNC_CONCURRENCY'] = int(os.environ.get('AI_SYNC_CONCURRENCY', '64'))
+app.config['AI_CONCURRENCY'] = {
+    'summarize': int(os.environ.get('SUMMARIZE_CONCURRENCY', '64')),
+    'ai-chat': int(os.environ.get('AI_CHAT_CONCURRENCY', '128')),
+    'translate': int(os.environ.get('TRANSLATE_CONCURRENCY', '16'))
+}
+
+# Language code mapping to match what Google Translate expects
+TRANSLATE_LANGUAGES = {
+    'en': 'english',
+    'es': 'spanish',
+    'fr': 'french',
+    'de': 'german',
+    'it': 'italian',
+    'pt': 'portuguese',
+    'ru': 'russian',
+    'zh': 'chinese (simplified)',
+    'ja': 'japanese',
+    'ko': 'korean',
+    'ar': 'arabic',
+    'hi': 'hindi'
+}
+
+class OutboundBusy(Exception):
+    """Raised when every slot for outbound calls in this process is taken."""
+
+sync_outbound_slots = threading.BoundedSemaphore(app.config['AI_SYNC_CONCURRENCY'])
+
+@contextmanager
+def sync_outbound_slot() -> Any:
+    # Fail fast rather than queue: queued requests would hold threads too
+    if not sync_outbound_slots.acquire(blocking=False):
+        raise OutboundBusy()
+    try:
+        yield
+    finally:
+        sync_outbound_slots.release()
 
+def outbound_busy_response() -> RouteReturn:
+    return jsonify({'error': 'Too many AI requests in progress, try again shortly'}), 503, {'Retry-After': '5'}
+
+def invalid_summarize_request(data: Any) -> Optional[str]:
+    if not isinstance(data, dict) or 'messages' not in data:
+        return 'Messages to summarize are required'
     messages = data['messages']
     if not isinstance(messages, list) or not all(isinstance(msg, dict) and 'content' in msg for msg in messages):
-        return jsonify({'error': 'Invalid messages format'}), 400
-
-    try:
-        # Configure the Gemini API client
-        genai.configure(api_key=current_app.config['GEMINI_API_KEY'])
-
-        # Format the messages for summarization
-        messages_text = "\n".join([f"{msg.get('sender', {}).get('name', 'Unknown')}: {msg.get('content', '')}" for msg in messages])
+        return 'Invalid messages format'
+    return None
+
+def invalid_ai_chat_request(data: Any) -> Optional[str]:
+    if not isinstance(data, dict) or 'message' not in data:
+        return 'Message is required'
+    if not isinstance(data['message'], str):
+        return 'Invalid message format'
+    return None
+
+def invalid_translate_request(data: Any) -> Optional[str]:
+    if not isinstance(data, dict) or 'messages' not in data or 'targetLanguage' not in data:
+        return 'Messages and target language are required'
+    messages = data['messages']
+    if not isinstance(messages, list) or not all(isinstance(msg, dict) and 'id' in msg and 'content' in msg for msg in messages):
+        return 'Invalid messages format'
+    return None
 
-        # Create the prompt for summarization
-        prompt = f"""Summarize the following chat conversation, highlighting:
+def summary_prompt(messages: List[Dict[str, Any]]) -> str:
+    # Format the messages for summarization
+    messages_text = "\n".join([f"{msg.get('sender', {}).get('name', 'Unknown')}: {msg.get('content', '')}" for msg in messages])
+    return f"""Summarize the following chat conversation, highlighting:
         - Key discussion points and decisions
         - Action items or responsibilities assigned
         - Questions that need follow-up
@@ -1378,16 +4544,56 @@ def summarize_chat(current_user: User) -> RouteReturn:
         {messages_text}
         """
 
-        # Initialize the Gemini model
-        model = genai.GenerativeModel(model_name="gemini-2.0-flash-lite")
+def ai_chat_prompt(message: str) -> str:
+    return f"""You are a helpful AI assistant in a team chat application.
+        Respond to the following message in a conversational, helpful, and concise manner.
+        If the message is a question, provide a direct answer. If it's a request for help, offer assistance.
+        Keep your response under 200 words and maintain a friendly, professional tone.
+
+        User message: {message}
+        """
+
+def gemini_request(prompt: str) -> Dict[str, Any]:
+    """Keyword arguments for a generateContent call, shared by the sync and async clients."""
+    config = app.config
+    return {
+        'url': f"{config['GEMINI_API_URL']}/models/{config['GEMINI_MODEL']}:generateContent",
+        'params': {'key': config['GEMINI_API_KEY']},
+        'json': {'contents': [{'parts': [{'text': prompt}]}]}
+    }
+
+def gemini_text(payload: Dict[str, Any]) -> str:
+    candidates = payload.get('candidates') or []
+    if not candidates:
+        reason = (payload.get('promptFeedback') or {}).get('blockReason', 'no candidates returned')
+        raise ValueError(f"Gemini returned no text: {reason}")
+    return ''.join(part.get('text', '') for part in candidates[0].get('content', {}).get('parts', []))
+
+def generate_text(prompt: str) -> str:
+    with track_outbound('gemini'):
+        response = requests.post(timeout=current_app.config['AI_TIMEOUT'], **gemini_request(prompt))
+        response.raise_for_status()
+        return gemini_text(response.json())
+
+# Add a new route for summarizing chat messages using the Gemini API
+@app.route('/api/summarize', methods=['POST'])
+@token_required
+def summarize_chat(current_user: User) -> RouteReturn:
+    data = request.get_json()
+    error = invalid_summarize_request(data)
+    if error:
+        return jsonify({'error': error}), 400
 
-        # Generate the summary
-        response = model.generate_content(prompt)
+    try:
+        with sync_outbound_slot():
+            summary = generate_text(summary_prompt(data['messages']))
 
         return jsonify({
-            'summary': response.text,
+            'summary': summary,
             'analysisTime': datetime.utcnow().isoformat()
         }), 200
+    except OutboundBusy:
+        return outbound_busy_response()
     except Exception as e:
         current_app.logger.error(f"Error summarizing chat: {e}")
         return jsonify({'error': 'Failed to summarize chat', 'details': str(e)}), 500
@@ -1397,36 +4603,20 @@ def summarize_chat(current_user: User) -> RouteReturn:
 @token_required
 def ai_chat(current_user: User) -> RouteReturn:
     data = request.get_json()
-    if not data or 'message' not in data:
-        return jsonify({'error': 'Message is required'}), 400
-
-    message = data['message']
-    if not isinstance(message, str):
-        return jsonify({'error': 'Invalid message format'}), 400
+    error = invalid_ai_chat_request(data)
+    if error:
+        return jsonify({'error': error}), 400
 
     try:
-        # Configure the Gemini API client
-        genai.configure(api_key=current_app.config['GEMINI_API_KEY'])
-
-        # Create the prompt for AI chat
-        prompt = f"""You are a helpful AI assistant in a team chat application.
-        Respond to the following message in a conversational, helpful, and concise manner.
-        If the message is a question, provide a direct answer. If it's a request for help, offer assistance.
-        Keep your response under 200 words and maintain a friendly, professional tone.
-
-        User message: {message}
-        """
-
-        # Initialize the Gemini model
-        model = genai.GenerativeModel(model_name="gemini-2.0-flash-lite")
-
-        # Generate the response
-        response = model.generate_content(prompt)
+        with sync_outbound_slot():
+            reply = generate_text(ai_chat_prompt(data['message']))
 
         return jsonify({
-            'response': response.text,
+            'response': reply,
             'timestamp': datetime.utcnow().isoformat()
         }), 200
+    except OutboundBusy:
+        return outbound_busy_response()
     except Exception as e:
         current_app.logger.error(f"Error in AI chat: {e}")
         return jsonify({'error': 'Failed to get AI response', 'details': str(e)}), 500
@@ -1436,37 +4626,19 @@ def ai_chat(current_user: User) -> RouteReturn:
 @token_required
 def translate_messages(current_user: User) -> RouteReturn:
     data = request.get_json()
-    if not data or 'messages' not in data or 'targetLanguage' not in data:
-        return jsonify({'error': 'Messages and target language are required'}), 400
+    error = invalid_translate_request(data)
+    if error:
+        return jsonify({'error': error}), 400
 
     messages = data['messages']
     target_language = data['targetLanguage']
 
-    if not isinstance(messages, list) or not all(isinstance(msg, dict) and 'id' in msg and 'content' in msg for msg in messages):
-        return jsonify({'error': 'Invalid messages format'}), 400
-
     try:
         # Import deep-translator (import here to avoid loading unless needed)
         from deep_translator import GoogleTranslator, exceptions
 
-        # Language code mapping to match what deep-translator expects
-        translate_lang_map = {
-            'en': 'english',
-            'es': 'spanish',
-            'fr': 'french',
-            'de': 'german',
-            'it': 'italian',
-            'pt': 'portuguese',
-            'ru': 'russian',
-            'zh': 'chinese (simplified)',
-            'ja': 'japanese',
-            'ko': 'korean',
-            'ar': 'arabic',
-            'hi': 'hindi'
-        }
-
         # Get target language for deep-translator
-        target = translate_lang_map.get(target_language.lower(), target_language)
+        target = TRANSLATE_LANGUAGES.get(target_language.lower(), target_language)
 
         # Initialize translations dictionary
         translations = {}
@@ -1475,29 +4647,33 @@ def translate_messages(current_user: User) -> RouteReturn:
         translator = GoogleTranslator(source='auto', target=target)
 
         # Process each message
-        for msg in messages:
-            msg_id = msg['id']
-            content = msg['content']
-
-            # Skip empty messages
-            if not content.strip():
-                translations[msg_id] = ""
-                continue
-
-            try:
-                # Translate the message
-                translated_text = translator.translate(content)
-                translations[msg_id] = translated_text
-            except exceptions.TranslationError as e:
-                current_app.logger.error(f"Translation error for message {msg_id}: {e}")
-                # Fall back to original content if translation fails
-                translations[msg_id] = content
+        with sync_outbound_slot():
+            for msg in messages:
+                msg_id = msg['id']
+                content = msg['content']
+
+                # Skip empty messages
+                if not content.strip():
+                    translations[msg_id] = ""
+                    continue
+
+                try:
+                    # Translate the message
+                    with track_outbound('translator'):
+                        translated_text = translator.translate(content)
+                    translations[msg_id] = translated_text
+                except exceptions.TranslationError as e:
+                    current_app.logger.error(f"Translation error for message {msg_id}: {e}")
+                    # Fall back to original content if translation fails
+                    translations[msg_id] = content
 
         return jsonify({
             'translations': translations,
             'targetLanguage': target_language
         }), 200
 
+    except OutboundBusy:
+        return outbound_busy_response()
     except ImportError:
         return jsonify({
             'error': 'Translation library not available',
@@ -1521,18 +4697,24 @@ def create_eye_gaze_data(current_user: User) -> RouteReturn:
     if not data or 'isLookingAtScreen' not in data or 'confidence' not in data or 'sessionId' not in data:
         return jsonify({'error': 'Missing required fields'}), 400
 
-    try:
+    user_id = current_user.id
+    timestamp = datetime.utcnow()
+
+    def insert() -> Dict[str, Any]:
         eye_gaze_data = EyeGazeData(
-            user_id=current_user.id,
+            user_id=user_id,
             is_looking_at_screen=data['isLookingAtScreen'],
             confidence=data['confidence'],
-            session_id=data['sessionId']
+            session_id=data['sessionId'],
+            timestamp=timestamp
         )
-
         db.session.add(eye_gaze_data)
-        db.session.commit()
+        record_eye_gaze_sample(eye_gaze_data)
+        db.session.flush()
+        return eye_gaze_data.to_dict()
 
-        return jsonify(eye_gaze_data.to_dict()), 201
+    try:
+        return jsonify(commit_write(insert)), 201
     except Exception as e:
         db.session.rollback()
         current_app.logger.error(f"Error creating eye gaze data: {e}")
@@ -1565,13 +4747,13 @@ def get_eye_gaze_data(current_user: User) -> RouteReturn:
 @token_required
 def get_eye_gaze_sessions(current_user: User) -> RouteReturn:
     try:
-        # Get unique session IDs for the current user
-        sessions = db.session.query(EyeGazeData.session_id).filter_by(user_id=current_user.id).distinct().all()
+        sessions = EyeGazeSession.query.filter_by(user_id=current_user.id).order_by(EyeGazeSession.started_at).all()
 
-        # Format session IDs
-        session_ids = [session[0] for session in sessions]
+        # Full session summaries on request, plain session IDs otherwise
+        if request.args.get('details', '').lower() == 'true':
+            return jsonify([session.to_dict() for session in sessions]), 200
 
-        return jsonify(session_ids), 200
+        return jsonify([session.session_id for session in sessions]), 200
     except Exception as e:
         current_app.logger.error(f"Error fetching eye gaze sessions: {e}")
         return jsonify({'error': 'Failed to fetch eye gaze sessions', 'details': str(e)}), 500
@@ -1583,50 +4765,187 @@ def get_eye_gaze_stats(current_user: User) -> RouteReturn:
         # Get query parameters
         session_id = request.args.get('sessionId')
 
-        # Build query
-        query = EyeGazeData.query.filter_by(user_id=current_user.id)
+        # Read the running totals from the session rollups instead of scanning samples
+        query = db.session.query(
+            db.func.coalesce(db.func.sum(EyeGazeSession.sample_count), 0),
+            db.func.coalesce(db.func.sum(EyeGazeSession.looking_count), 0)
+        ).filter(EyeGazeSession.user_id == current_user.id)
 
         # Filter by session if provided
         if session_id:
-            query = query.filter_by(session_id=session_id)
+            query = query.filter(EyeGazeSession.session_id == session_id)
 
-        # Get all data for the query
-        eye_gaze_data = query.all()
+        total_count, looking_count = query.one()
 
-        if not eye_gaze_data:
-            return jsonify({
-                'totalTime': 0,
-                'lookingTime': 0,
-                'notLookingTime': 0,
-                'attentionPercentage': 0
-            }), 200
+        return jsonify(eye_gaze_stats(int(total_count), int(looking_count))), 200
+    except Exception as e:
+        current_app.logger.error(f"Error calculating eye gaze stats: {e}")
+        return jsonify({'error': 'Failed to calculate eye gaze stats', 'details': str(e)}), 500
 
-        # Calculate stats
-        total_count = len(eye_gaze_data)
-        looking_count = sum(1 for data in eye_gaze_data if data.is_looking_at_screen)
-        not_looking_count = total_count - looking_count
+# Data export
+class ExportDataset:
+    """
+    A table that can be exported: the columns written, keyed by their
+    output name, and the columns the export filters apply to.
+    """
 
-        # Calculate time in seconds (assuming 1 second intervals)
-        total_time = total_count
-        looking_time = looking_count
-        not_looking_time = not_looking_count
+    def __init__(self, model: Any, columns: Dict[str, Any], timestamp: Any, users: tuple,
+                 session: Any = None, json_columns: tuple = (), visible_to: Optional[Callable[[str], Any]] = None) -> None:
+        self.model = model
+        self.columns = columns
+        self.timestamp = timestamp
+        self.users = users
+        self.session = session
+        self.json_columns = json_columns
+        # viewer ID -> clause limiting rows to what that user may see
+        self.visible_to = visible_to
+
+EXPORTS: Dict[str, ExportDataset] = {
+    'messages': ExportDataset(Message, {
+        'id': Message.id,
+        'senderId': Message.sender_id,
+        'recipientId': Message.recipient_id,
+        'content': Message.content,
+        'timestamp': Message.timestamp,
+        'isPrivate': Message.is_private,
+        'priority': Message.priority,
+        'tags': Message.tags,
+        'mentions': Message.mentions,
+        'sentiment': Message.sentiment
+    }, Message.timestamp, (Message.sender_id,), json_columns=('tags', 'mentions'), visible_to=lambda user_id: or_(
+        Message.is_private == False,
+        Message.sender_id == user_id,
+        Message.recipient_id == user_id
+    )),
+    'work-items': ExportDataset(WorkItem, {
+        'id': WorkItem.id,
+        'title': WorkItem.title,
+        'description': WorkItem.description,
+        'status': WorkItem.status,
+        'priority': WorkItem.priority,
+        'assignedTo': WorkItem.assigned_to,
+        'createdBy': WorkItem.created_by,
+        'dueDate': WorkItem.due_date,
+        'tags': WorkItem.tags,
+        'createdAt': WorkItem.created_at,
+        'updatedAt': WorkItem.updated_at
+    }, WorkItem.created_at, (WorkItem.assigned_to, WorkItem.created_by), json_columns=('tags',)),
+    'eye-gaze': ExportDataset(EyeGazeData, {
+        'id': EyeGazeData.id,
+        'userId': EyeGazeData.user_id,
+        'sessionId': EyeGazeData.session_id,
+        'timestamp': EyeGazeData.timestamp,
+        'isLookingAtScreen': EyeGazeData.is_looking_at_screen,
+        'confidence': EyeGazeData.confidence
+    }, EyeGazeData.timestamp, (EyeGazeData.user_id,), session=EyeGazeData.session_id,
+        visible_to=lambda user_id: EyeGazeData.user_id == user_id)
+}
+EXPORT_FORMATS = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+EXPORT_BATCH_SIZE = 2000
+
+def export_filters(args: Any) -> Dict[str, Any]:
+    """
+    Read export filters from request args (or any mapping): from/to as
+    inclusive ISO dates, user and sessionId. Raises ValueError on malformed dates.
+    """
+    return {
+        'start': datetime.fromisoformat(args['from']) if args.get('from') else None,
+        # Make the end date inclusive
+        'end': datetime.fromisoformat(args['to']) + timedelta(days=1) if args.get('to') else None,
+        'user': args.get('user') or None,
+        'session': args.get('sessionId') or None
+    }
 
-        # Calculate attention percentage
-        attention_percentage = round((looking_time / total_time) * 100) if total_time > 0 else 0
+def iter_export(name: str, fmt: str, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                user: Optional[str] = None, session: Optional[str] = None, viewer_id: Optional[str] = None) -> Any:
+    """
+    Stream the rows of an export dataset as NDJSON lines or CSV, in id order.
 
-        return jsonify({
-            'totalTime': total_time,
-            'lookingTime': looking_time,
-            'notLookingTime': not_looking_time,
-            'attentionPercentage': attention_percentage
-        }), 200
-    except Exception as e:
-        current_app.logger.error(f"Error calculating eye gaze stats: {e}")
-        return jsonify({'error': 'Failed to calculate eye gaze stats', 'details': str(e)}), 500
+    Plain column tuples are fetched EXPORT_BATCH_SIZE at a time with
+    yield_per and written out batch by batch, so memory stays flat however
+    many rows match. With `viewer_id`, only rows that user may see are included.
+    """
+    dataset = EXPORTS[name]
+    statement = db.select(*[column.label(key) for key, column in dataset.columns.items()])
+    if viewer_id is not None and dataset.visible_to is not None:
+        statement = statement.where(dataset.visible_to(viewer_id))
+    if start is not None:
+        statement = statement.where(dataset.timestamp >= start)
+    if end is not None:
+        statement = statement.where(dataset.timestamp < end)
+    if user is not None:
+        statement = statement.where(or_(*[column == user for column in dataset.users]))
+    if session is not None:
+        if dataset.session is None:
+            raise ValueError(f"{name} has no sessions to filter by")
+        statement = statement.where(dataset.session == session)
+    statement = statement.order_by(dataset.model.id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+    keys = list(dataset.columns)
+    batches = db.session.execute(statement).partitions()
+    if fmt == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(keys)
+        for rows in batches:
+            writer.writerows(
+                [value.isoformat() if isinstance(value, datetime) else value for value in row] for row in rows
+            )
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            # Nothing matched: just the header
+            yield buffer.getvalue()
+        return
+
+    dumps = app.json.dumps
+    for rows in batches:
+        records = [dict(zip(keys, row)) for row in rows]
+        for key in dataset.json_columns:
+            for record in records:
+                record[key] = json_column_to_list(record[key])
+        yield '\n'.join(dumps(record) for record in records) + '\n'
+
+@app.route('/api/export/<string:dataset>', methods=['GET'])
+@token_required
+def export_data(current_user: User, dataset: str) -> RouteReturn:
+    """
+    Download messages, work items or eye gaze samples as a stream of rows.
+
+    Query params:
+        format: ndjson (default) or csv
+        from, to: optional ISO dates (inclusive) on the message, creation or sample time
+        user: optional user ID; matches sender, assignee or creator, or sample owner
+        sessionId: optional eye gaze session
+
+    Only messages the caller can read and the caller's own eye gaze samples
+    are exported. Use export.py for unrestricted exports.
+    """
+    if dataset not in EXPORTS:
+        return jsonify({'error': f"Unknown export: {dataset}"}), 404
+    fmt = request.args.get('format', 'ndjson')
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({'error': f"Unsupported format: {fmt}"}), 400
+    try:
+        filters = export_filters(request.args)
+    except ValueError as e:
+        return jsonify({'error': f'Invalid date format: {e}'}), 400
+    if filters['session'] and EXPORTS[dataset].session is None:
+        return jsonify({'error': f"{dataset} has no sessions to filter by"}), 400
+
+    current_app.logger.info('Exporting data', extra={'userId': current_user.id, 'dataset': dataset, 'format': fmt})
+    rows = iter_export(dataset, fmt, viewer_id=current_user.id, **filters)
+    response = Response(stream_with_context(log_stream_errors(rows, f'exporting {dataset}')),
+                        mimetype=EXPORT_FORMATS[fmt])
+    response.headers['Content-Disposition'] = f'attachment; filename="{dataset}.{fmt}"'
+    return response
 
 if __name__ == '__main__':
+    # Let `import app` (e.g. from seed.py) find this module instead of loading a second copy
+    sys.modules.setdefault('app', sys.modules[__name__])
     with app.app_context():
         db.create_all()
-        print("Database tables created successfully")
-    print("Starting Flask server on http://127.0.0.1:5000")
+        app.logger.info('Database tables created')
+    app.logger.info('Starting Flask server', extra={'url': 'http://127.0.0.1:5000'})
     app.run(debug=True, host='127.0.0.1', port=5000)
@@ -0,0 +1,223 @@
+# ASGI entry point. The AI and translation endpoints run on the event loop
+# with an async HTTP client, so a request waiting on a slow model holds no
+# thread. Every other route is passed to the Flask app on its own thread
+# pool, which AI traffic therefore cannot exhaust.
+#
+# Usage:
+#   uvicorn asgi:application --host 127.0.0.1 --port 5000 --workers 4
+#   gunicorn -c gunicorn.conf.py -k uvicorn.workers.UvicornWorker asgi:application
+#
+# WSGI_THREADS (default 16) sizes the Flask thread pool of each process;
+# AI_TIMEOUT and SUMMARIZE/AI_CHAT/TRANSLATE_CONCURRENCY are read by app.py.
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+from a2wsgi import WSGIMiddleware
+
+from app import (
+    app, authenticate, CORS_SETTINGS, TRANSLATE_LANGUAGES, REQUEST_SECONDS, track_outbound,
+    invalid_summarize_request, invalid_ai_chat_request, invalid_translate_request,
+    summary_prompt, ai_chat_prompt, gemini_request, gemini_text
+)
+
+MAX_BODY_BYTES = 2 * 1024 * 1024
+
+wsgi_app = WSGIMiddleware(app, workers=int(os.environ.get('WSGI_THREADS', '16')))
+
+class AsyncOutbound:
+    """
+    Shared async HTTP client with one semaphore per endpoint, bounding how
+    many calls each endpoint has in flight towards its upstream service.
+    Callers wait for a free slot; the request timeout covers that wait too.
+    """
+
+    def __init__(self) -> None:
+        limits = app.config['AI_CONCURRENCY']
+        self.slots = {endpoint: asyncio.Semaphore(limit) for endpoint, limit in limits.items()}
+        self.client = httpx.AsyncClient(
+            timeout=app.config['AI_TIMEOUT'],
+            limits=httpx.Limits(max_connections=sum(limits.values()), max_keepalive_connections=32)
+        )
+
+    async def generate_text(self, endpoint: str, prompt: str) -> str:
+        async with self.slots[endpoint]:
+            with track_outbound('gemini'):
+                response = await self.client.post(**gemini_request(prompt))
+                response.raise_for_status()
+                return gemini_text(response.json())
+
+    async def translate(self, text: str, language_code: str) -> str:
+        from bs4 import BeautifulSoup
+
+        async with self.slots['translate']:
+            with track_outbound('translator'):
+                response = await self.client.get(app.config['TRANSLATE_URL'],
+                                                 params={'tl': language_code, 'sl': 'auto', 'q': text})
+                response.raise_for_status()
+        # Same markup deep-translator reads for the synchronous route
+        soup = BeautifulSoup(response.text, 'html.parser')
+        element = soup.find('div', {'class': 't0'}) or soup.find('div', {'class': 'result-container'})
+        if element is None:
+            raise LookupError(f'No translation found for {text[:50]!r}')
+        return element.get_text(strip=True)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+outbound: Optional[AsyncOutbound] = None
+
+def get_outbound() -> AsyncOutbound:
+    # Created on first use so it belongs to the serving process's event loop
+    global outbound
+    if outbound is None:
+        outbound = AsyncOutbound()
+    return outbound
+
+async def summarize_chat(data: Any, request_id: str) -> tuple:
+    summary = await get_outbound().generate_text('summarize', summary_prompt(data['messages']))
+    return 200, {'summary': summary, 'analysisTime': datetime.utcnow().isoformat()}
+
+async def ai_chat(data: Any, request_id: str) -> tuple:
+    reply = await get_outbound().generate_text('ai-chat', ai_chat_prompt(data['message']))
+    return 200, {'response': reply, 'timestamp': datetime.utcnow().isoformat()}
+
+async def translate_messages(data: Any, request_id: str) -> tuple:
+    try:
+        from deep_translator.constants import GOOGLE_LANGUAGES_TO_CODES
+    except ImportError:
+        return 503, {
+            'error': 'Translation library not available',
+            'message': 'Please install deep-translator: pip install deep-translator',
+            'status': 'missing_dependency'
+        }
+    target_language = data['targetLanguage']
+    target = TRANSLATE_LANGUAGES.get(target_language.lower(), target_language)
+    language_code = GOOGLE_LANGUAGES_TO_CODES.get(target, target)
+    client = get_outbound()
+
+    async def translate_one(msg: Dict[str, Any]) -> tuple:
+        content = msg['content']
+        # Skip empty messages
+        if not content.strip():
+            return msg['id'], ''
+        try:
+            return msg['id'], await client.translate(content, language_code)
+        except (httpx.HTTPError, LookupError) as e:
+            app.logger.error(f"Translation error for message {msg['id']}: {e}", extra={'request_id': request_id})
+            # Fall back to original content if translation fails
+            return msg['id'], content
+
+    translations = dict(await asyncio.gather(*(translate_one(msg) for msg in data['messages'])))
+    return 200, {'translations': translations, 'targetLanguage': target_language}
+
+# path -> (validator, handler, error message for failures)
+ASYNC_ROUTES: Dict[str, tuple] = {
+    '/api/summarize': (invalid_summarize_request, summarize_chat, 'Failed to summarize chat'),
+    '/api/ai-chat': (invalid_ai_chat_request, ai_chat, 'Failed to get AI response'),
+    '/api/translate': (invalid_translate_request, translate_messages, 'Failed to translate messages')
+}
+
+def authenticated_user_id(token: Optional[str]) -> tuple:
+    # Runs on a worker thread: token checks may hit the database
+    with app.app_context():
+        user, error = authenticate(token)
+        return (user.id if user else None), error
+
+async def read_body(receive: Callable[[], Awaitable[Dict[str, Any]]]) -> Optional[bytes]:
+    chunks: List[bytes] = []
+    size = 0
+    while True:
+        message = await receive()
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            return None
+        chunks.append(chunk)
+        if not message.get('more_body'):
+            return b''.join(chunks)
+
+def cors_headers(origin: Optional[str]) -> List[tuple]:
+    # Preflight requests are answered by Flask-CORS; this mirrors its headers on the actual response
+    allowed = CORS_SETTINGS['origins']
+    if not origin or origin not in ([allowed] if isinstance(allowed, str) else allowed):
+        return []
+    return [
+        (b'access-control-allow-origin', origin.encode('latin-1')),
+        (b'access-control-allow-credentials', b'true'),
+        (b'access-control-expose-headers', ', '.join(CORS_SETTINGS['expose_headers']).encode('latin-1')),
+        (b'vary', b'Origin')
+    ]
+
+async def handle(scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+    started = time.perf_counter()
+    path = scope['path']
+    validate, handler, failure = ASYNC_ROUTES[path]
+    headers = {key.decode('latin-1').lower(): value.decode('latin-1') for key, value in scope['headers']}
+    request_id = headers.get('x-request-id') or uuid.uuid4().hex
+    extra_headers: List[tuple] = []
+
+    body = await read_body(receive)
+    if body is None:
+        status, payload = 413, {'error': 'Request body too large'}
+    else:
+        user_id, error = await asyncio.to_thread(authenticated_user_id, headers.get('authorization'))
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            data = None
+        invalid = validate(data)
+        if error:
+            status, payload = 401, {'error': error}
+        elif invalid:
+            status, payload = 400, {'error': invalid}
+        else:
+            try:
+                status, payload = await asyncio.wait_for(handler(data, request_id), app.config['AI_TIMEOUT'])
+            except (asyncio.TimeoutError, httpx.TimeoutException):
+                app.logger.warning(f"Timed out after {app.config['AI_TIMEOUT']}s on {path}", extra={'request_id': request_id})
+                status, payload = 504, {'error': 'The AI service took too long to respond, try again shortly'}
+                extra_headers.append((b'retry-after', b'5'))
+            except Exception as e:
+                app.logger.error(f"{failure}: {e}", extra={'request_id': request_id})
+                status, payload = 500, {'error': failure, 'details': str(e)}
+
+    content = json.dumps(payload).encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(content)).encode('latin-1')),
+            (b'x-request-id', request_id.encode('latin-1')),
+            *extra_headers,
+            *cors_headers(headers.get('origin'))
+        ]
+    })
+    await send({'type': 'http.response.body', 'body': content})
+    REQUEST_SECONDS.observe(time.perf_counter() - started, scope['method'], path, status)
+
+async def lifespan(receive: Callable, send: Callable) -> None:
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            if outbound is not None:
+                await outbound.aclose()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+async def application(scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+    if scope['type'] == 'lifespan':
+        await lifespan(receive, send)
+    elif scope['type'] == 'http' and scope['method'] == 'POST' and scope['path'] in ASYNC_ROUTES:
+        await handle(scope, receive, send)
+    else:
+        await wsgi_app(scope, receive, send)
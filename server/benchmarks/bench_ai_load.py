@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# Load test: latency of ordinary endpoints while many AI calls are in flight
+# against a slow local stand-in for Gemini, comparing:
+#   asgi            uvicorn asgi:application (AI endpoints on the event loop)
+#   wsgi            gunicorn wsgi:application with AI_SYNC_CONCURRENCY=2
+#   wsgi-unbounded  the same with the default limit, so AI calls can take every thread
+# Each server runs one process with 8 threads for Flask routes.
+#
+# Usage:
+#   python benchmarks/bench_ai_load.py [--servers asgi,wsgi,wsgi-unbounded] [--in-flight 100]
+#                                      [--delay 3] [--duration 10]
+
+import argparse
+import importlib.util
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run against a throwaway database, shared with the server processes
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+sys.path.insert(0, SERVER_DIR)
+
+import jwt
+import requests
+
+REGULAR_PATHS = ['/api/messages', '/api/work-items?page=1&perPage=50', '/api/users']
+THREADS = 8
+
+class SlowGemini(BaseHTTPRequestHandler):
+    """Answers generateContent after `delay` seconds, like a busy model."""
+
+    delay = 3.0
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        time.sleep(self.delay)
+        body = json.dumps({'candidates': [{'content': {'parts': [{'text': 'A slow reply.'}]}}]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def start_server(name: str, port: int, env: dict) -> subprocess.Popen:
+    if name == 'asgi':
+        command = [sys.executable, '-m', 'uvicorn', 'asgi:application', '--port', str(port),
+                   '--workers', '1', '--log-level', 'warning']
+        env = {**env, 'WSGI_THREADS': str(THREADS)}
+    else:
+        command = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--bind', f'127.0.0.1:{port}',
+                   '--workers', '1', '--threads', str(THREADS), 'wsgi:application']
+        if name == 'wsgi':
+            env = {**env, 'AI_SYNC_CONCURRENCY': '2'}
+    return subprocess.Popen(command, cwd=SERVER_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def wait_until_ready(base_url: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'Server exited with status {process.returncode}')
+        try:
+            requests.get(base_url + '/api/users', timeout=1)
+            return
+        except requests.ConnectionError:
+            time.sleep(0.1)
+    raise RuntimeError('Server did not start in time')
+
+def probe(base_url: str, headers: dict, duration: float) -> list:
+    """Latencies of ordinary requests from a few keep-alive clients over `duration` seconds."""
+    samples: list = []
+    deadline = time.monotonic() + duration
+
+    def run(offset: int) -> None:
+        session = requests.Session()
+        i = offset
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                session.get(base_url + REGULAR_PATHS[i % len(REGULAR_PATHS)], headers=headers, timeout=60)
+            except requests.RequestException:
+                pass
+            samples.append(time.perf_counter() - start)
+            i += 1
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(samples)
+
+def flood(base_url: str, headers: dict, in_flight: int, stop: threading.Event, outcomes: dict) -> list:
+    """Keep `in_flight` AI chat calls open until `stop` is set; count responses by status."""
+    lock = threading.Lock()
+
+    def run() -> None:
+        session = requests.Session()
+        while not stop.is_set():
+            try:
+                status = session.post(base_url + '/api/ai-chat', json={'message': 'How is the sprint going?'},
+                                      headers=headers, timeout=60).status_code
+            except requests.RequestException:
+                status = 'error'
+            with lock:
+                outcomes[status] = outcomes.get(status, 0) + 1
+            if status == 503:
+                # Turned away: back off briefly like a real client instead of spinning
+                stop.wait(1.0)
+
+    threads = [threading.Thread(target=run, daemon=True) for _ in range(in_flight)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+def percentiles(samples: list) -> str:
+    if not samples:
+        return f"{'-':>9}{'-':>9}{'-':>9}"
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return f"{statistics.median(samples) * 1000:>9.1f}{p95 * 1000:>9.1f}{len(samples):>9}"
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Regular endpoint latency under AI load')
+    parser.add_argument('--servers', default='asgi,wsgi,wsgi-unbounded')
+    parser.add_argument('--in-flight', type=int, default=100, help='concurrent AI calls')
+    parser.add_argument('--delay', type=float, default=3.0, help='seconds the stub takes per AI call')
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds to measure each phase')
+    args = parser.parse_args()
+
+    SlowGemini.delay = args.delay
+    ThreadingHTTPServer.request_queue_size = 1024
+    stub = ThreadingHTTPServer(('127.0.0.1', 0), SlowGemini)
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+
+    from app import app, User
+    from seed import seed_database
+    with app.app_context():
+        seed_database(users=50, messages=5000, work_items=2000, gaze_samples=0)
+        user_id = User.query.filter_by(email='test@example.com').one().id
+    token = jwt.encode({'user_id': user_id, 'exp': datetime.utcnow() + timedelta(hours=1)},
+                       app.config['SECRET_KEY'], algorithm='HS256')
+    headers = {'Authorization': f'Bearer {token}'}
+    env = {
+        **os.environ,
+        'GEMINI_API_URL': f'http://127.0.0.1:{stub.server_port}/v1beta',
+        'AI_TIMEOUT': str(args.delay * 4),
+        'AI_CHAT_CONCURRENCY': str(max(args.in_flight, 1))
+    }
+
+    print(f"{args.in_flight} AI calls in flight, {args.delay:.1f} s per upstream call, {THREADS} Flask threads\n")
+    print(f"{'Server':<16}{'phase':<10}{'p50 ms':>9}{'p95 ms':>9}{'reqs':>9}   AI responses by status")
+    for name in args.servers.split(','):
+        module = 'uvicorn' if name == 'asgi' else 'gunicorn'
+        if importlib.util.find_spec(module) is None:
+            print(f"{name:<16}not run: {module} is not installed")
+            continue
+        port = free_port()
+        base_url = f'http://127.0.0.1:{port}'
+        process = start_server(name, port, env)
+        try:
+            wait_until_ready(base_url, process)
+            for path in REGULAR_PATHS * 3:
+                requests.get(base_url + path, headers=headers, timeout=30)
+            idle = probe(base_url, headers, args.duration)
+            print(f"{name:<16}{'idle':<10}{percentiles(idle)}")
+
+            stop = threading.Event()
+            outcomes: dict = {}
+            threads = flood(base_url, headers, args.in_flight, stop, outcomes)
+            time.sleep(min(1.0, args.delay / 2))
+            loaded = probe(base_url, headers, args.duration)
+            stop.set()
+            for thread in threads:
+                thread.join(timeout=args.delay * 5)
+            summary = ', '.join(f'{status}: {count}' for status, count in sorted(outcomes.items(), key=str))
+            print(f"{'':<16}{'AI load':<10}{percentiles(loaded)}   {summary}")
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+    stub.shutdown()
+
+if __name__ == '__main__':
+    main()
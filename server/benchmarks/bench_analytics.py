@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# Benchmark: client-side analytics (download everything, reduce in the browser)
+# versus the server-side /api/analytics aggregates.
+#
+# Usage: python benchmarks/bench_analytics.py [--work-items 100000]
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Run against a throwaway database
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jwt
+from app import app, db, User, WorkItem, Meeting, Message, analytics_cache
+
+def seed(work_item_count: int, meeting_count: int, message_count: int) -> str:
+    """Bulk insert synthetic rows and return the ID of the first user."""
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    user_ids = [f'user-{i}' for i in range(20)]
+
+    db.drop_all()
+    db.create_all()
+    db.session.execute(db.insert(User), [{
+        'id': user_id,
+        'name': f'User {i}',
+        'email': f'user{i}@example.com',
+        'password_hash': 'x',
+        'is_online': False
+    } for i, user_id in enumerate(user_ids)])
+    db.session.execute(db.insert(WorkItem), [{
+        'title': f'Task {i}',
+        'description': 'Synthetic work item',
+        'status': rng.choice(['todo', 'in-progress', 'review', 'done']),
+        'priority': rng.choice(['low', 'medium', 'high']),
+        'assigned_to': rng.choice(user_ids),
+        'created_by': rng.choice(user_ids),
+        'tags': '["bench"]',
+        'created_at': now - timedelta(minutes=i),
+        'updated_at': now
+    } for i in range(work_item_count)])
+    meeting_days = [rng.randint(-30, 30) for _ in range(meeting_count)]
+    db.session.execute(db.insert(Meeting), [{
+        'title': f'Meeting {i}',
+        'starts_at': (now + timedelta(days=day)).replace(hour=9, minute=0, second=0, microsecond=0),
+        'ends_at': (now + timedelta(days=day)).replace(hour=9, minute=30, second=0, microsecond=0),
+        'room': 'Conference Room A',
+        'organizer_id': rng.choice(user_ids),
+        'attendees': '[]',
+        'created_at': now
+    } for i, day in enumerate(meeting_days)])
+    db.session.execute(db.insert(Message), [{
+        'sender_id': rng.choice(user_ids),
+        'content': 'Synthetic message',
+        'timestamp': now - timedelta(minutes=i),
+        'is_private': False,
+        'sentiment': rng.choice(['positive', 'neutral', 'negative'])
+    } for i in range(message_count)])
+    db.session.commit()
+    return user_ids[0]
+
+def timed_get(client, url: str, headers: dict) -> tuple:
+    # Swallow the handlers' debug output so it doesn't skew timings
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        response = client.get(url, headers=headers)
+        elapsed = time.perf_counter() - start
+    assert response.status_code == 200, response.data[:200]
+    return elapsed, len(response.data), response
+
+def client_side_reduce(work_items: list, meetings: list, messages: list) -> dict:
+    """Python equivalent of the reduce() calls in ProjectAnalytics.tsx."""
+    result = {'status': {}, 'priority': {}, 'meetings': {}, 'sentiment': {}}
+    for item in work_items:
+        result['status'][item['status']] = result['status'].get(item['status'], 0) + 1
+        result['priority'][item['priority']] = result['priority'].get(item['priority'], 0) + 1
+    for meeting in meetings:
+        result['meetings'][meeting['date']] = result['meetings'].get(meeting['date'], 0) + 1
+    for message in messages:
+        result['sentiment'][message['sentiment']] = result['sentiment'].get(message['sentiment'], 0) + 1
+    return result
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the analytics endpoint')
+    parser.add_argument('--work-items', type=int, default=100000)
+    parser.add_argument('--meetings', type=int, default=2000)
+    parser.add_argument('--messages', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with app.app_context():
+        print(f"Seeding {args.work_items} work items, {args.meetings} meetings, {args.messages} messages...")
+        user_id = seed(args.work_items, args.meetings, args.messages)
+
+    token = jwt.encode({'user_id': user_id, 'exp': datetime.utcnow() + timedelta(hours=1)},
+                       app.config['SECRET_KEY'], algorithm='HS256')
+    headers = {'Authorization': f'Bearer {token}'}
+    client = app.test_client()
+
+    # Current approach: three list downloads, aggregated on the client
+    print("\n=== Client-side aggregation (current) ===")
+    total_time = 0.0
+    total_bytes = 0
+    payloads = {}
+    for url in ['/api/work-items', '/api/meetings', '/api/messages']:
+        elapsed, size, response = timed_get(client, url, headers)
+        payloads[url] = response.get_json()
+        total_time += elapsed
+        total_bytes += size
+        print(f"GET {url:<20} {elapsed * 1000:10.1f} ms  {size / 1024:10.1f} KiB")
+    start = time.perf_counter()
+    client_side_reduce(payloads['/api/work-items'], payloads['/api/meetings'], payloads['/api/messages']['data'])
+    reduce_time = time.perf_counter() - start
+    print(f"reduce()                  {reduce_time * 1000:10.1f} ms")
+    print(f"Total                     {(total_time + reduce_time) * 1000:10.1f} ms  {total_bytes / 1024:10.1f} KiB")
+
+    # New approach: one aggregate request
+    print("\n=== Server-side aggregation (/api/analytics) ===")
+    cold = []
+    for _ in range(args.repeat):
+        analytics_cache.clear()
+        cold.append(timed_get(client, '/api/analytics', headers))
+    warm = [timed_get(client, '/api/analytics', headers) for _ in range(args.repeat)]
+    print(f"Cold (GROUP BY)           {statistics.median(t for t, _, _ in cold) * 1000:10.1f} ms  {cold[0][1] / 1024:10.1f} KiB")
+    print(f"Warm (cached)             {statistics.median(t for t, _, _ in warm) * 1000:10.1f} ms  {warm[0][1] / 1024:10.1f} KiB")
+
+if __name__ == '__main__':
+    main()
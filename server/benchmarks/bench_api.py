@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# End-to-end API benchmark: seeds messages, work items and eye gaze samples at
+# a given scale, drives the main endpoints through the Flask test client and
+# through a real threaded WSGI server with concurrent clients, and reports
+# latency percentiles, throughput and SQL statements per request.
+#
+# Results can be saved as a baseline and later runs compared against it;
+# the script exits with status 1 when a scenario regresses.
+#
+# Usage:
+#   python benchmarks/bench_api.py [--scale 10k|100k|1m] [--requests 200] [--concurrency 8]
+#                                  [--mode both|client|wsgi] [--save-baseline] [--threshold 0.25]
+
+import argparse
+import base64
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+# Run against a throwaway database
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jwt
+import requests
+from sqlalchemy import event
+from werkzeug.serving import make_server
+from app import app, db, User
+from seed import seed_database
+
+SCALES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines')
+USER_COUNT = 50
+
+def seed(rows: int) -> str:
+    """Seed `rows` messages, work items and gaze samples; return the demo user's ID."""
+    seed_database(seed=41, users=USER_COUNT, messages=rows, work_items=rows, gaze_samples=rows, files=0)
+    return User.query.filter_by(email='test@example.com').one().id
+
+def scenarios(rows: int) -> list:
+    """(name, method, path, json body factory or None) for each endpoint under test."""
+    attachment = 'data:text/plain;base64,' + base64.b64encode(b'x' * 2048).decode()
+    return [
+        ('messages.list', 'GET', '/api/messages', None),
+        ('messages.create', 'POST', '/api/messages',
+         lambda i: {'content': f'Load test message {i}', 'sentiment': 'neutral', 'tags': ['load']}),
+        ('work_items.page', 'GET', '/api/work-items?page=1&perPage=50', None),
+        ('work_items.cursor', 'GET', '/api/work-items?limit=50&status=todo&sort=-createdAt', None),
+        ('work_items.get', 'GET', lambda i: f'/api/work-items/{1 + i * 7919 % rows}', None),
+        ('work_items.create', 'POST', '/api/work-items',
+         lambda i: {'title': f'Load test task {i}', 'priority': 'low', 'tags': ['load']}),
+        ('files.upload', 'POST', '/api/files',
+         lambda i: {'filename': f'load-{i}.txt', 'fileType': 'text/plain', 'fileData': attachment}),
+        ('eye_gaze.list', 'GET', '/api/eye-gaze?limit=100', None),
+        ('eye_gaze.stats', 'GET', '/api/eye-gaze/stats', None),
+        ('eye_gaze.create', 'POST', '/api/eye-gaze',
+         lambda i: {'isLookingAtScreen': True, 'confidence': 0.9, 'sessionId': 'load-test'}),
+        ('analytics', 'GET', '/api/analytics', None)
+    ]
+
+class StatementCounter:
+    """Count SQL statements executed by any engine in this process."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._lock = threading.Lock()
+        event.listen(db.engine, 'after_cursor_execute', self._increment)
+
+    def _increment(self, *args: object) -> None:
+        with self._lock:
+            self.count += 1
+
+def summarize(samples: list, elapsed: float, statements: int) -> dict:
+    samples = sorted(samples)
+    percentiles = statistics.quantiles(samples, n=100, method='inclusive') if len(samples) > 1 else samples * 99
+    return {
+        'requests': len(samples),
+        'p50': round(percentiles[49], 3),
+        'p95': round(percentiles[94], 3),
+        'p99': round(percentiles[98], 3),
+        'throughput': round(len(samples) / elapsed, 1),
+        'queriesPerRequest': round(statements / len(samples), 2)
+    }
+
+def run_client(scenario: tuple, count: int, headers: dict, counter: StatementCounter) -> dict:
+    name, method, path, body = scenario
+    client = app.test_client()
+    samples = []
+    before = counter.count
+    started = time.perf_counter()
+    for i in range(count):
+        url = path(i) if callable(path) else path
+        start = time.perf_counter()
+        response = client.open(url, method=method, headers=headers, json=body(i) if body else None)
+        response.get_data()
+        samples.append((time.perf_counter() - start) * 1000)
+        assert response.status_code < 400, f'{name}: {response.status_code} {response.get_data(as_text=True)[:200]}'
+    return summarize(samples, time.perf_counter() - started, counter.count - before)
+
+def run_wsgi(scenario: tuple, count: int, concurrency: int, base_url: str, headers: dict,
+             counter: StatementCounter) -> dict:
+    name, method, path, body = scenario
+    local = threading.local()
+
+    def one(i: int) -> float:
+        if not hasattr(local, 'session'):
+            local.session = requests.Session()
+        url = base_url + (path(i) if callable(path) else path)
+        start = time.perf_counter()
+        response = local.session.request(method, url, headers=headers, json=body(i) if body else None)
+        elapsed = (time.perf_counter() - start) * 1000
+        assert response.status_code < 400, f'{name}: {response.status_code} {response.text[:200]}'
+        return elapsed
+
+    before = counter.count
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        samples = list(pool.map(one, range(count)))
+    return summarize(samples, time.perf_counter() - started, counter.count - before)
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Return a line per scenario whose p95 or query count got worse than the baseline allows."""
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if not previous:
+            continue
+        if result['p95'] > previous['p95'] * (1 + threshold):
+            regressions.append(f"{key}: p95 {previous['p95']} -> {result['p95']} ms")
+        if result['queriesPerRequest'] > previous['queriesPerRequest']:
+            regressions.append(f"{key}: queries/request {previous['queriesPerRequest']} -> {result['queriesPerRequest']}")
+    return regressions
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='End-to-end API benchmark')
+    parser.add_argument('--scale', choices=sorted(SCALES), default='10k')
+    parser.add_argument('--requests', type=int, default=200, help='requests per scenario and mode')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--mode', choices=['both', 'client', 'wsgi'], default='both')
+    parser.add_argument('--only', help='comma-separated scenario names')
+    parser.add_argument('--baseline', help='baseline file (default: baselines/bench_api_<scale>.json)')
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed p95 slowdown before failing')
+    parser.add_argument('--output', help='also write the results as JSON to this file')
+    args = parser.parse_args()
+
+    rows = SCALES[args.scale]
+    with app.app_context():
+        print(f"Seeding {rows} messages, work items and eye gaze samples...")
+        start = time.perf_counter()
+        user_id = seed(rows)
+        print(f"Seeded in {time.perf_counter() - start:.1f} s\n")
+        counter = StatementCounter()
+
+    token = jwt.encode({'user_id': user_id, 'exp': datetime.utcnow() + timedelta(hours=1)},
+                       app.config['SECRET_KEY'], algorithm='HS256')
+    headers = {'Authorization': f'Bearer {token}'}
+    selected = [scenario for scenario in scenarios(rows)
+                if not args.only or scenario[0] in args.only.split(',')]
+
+    results = {}
+    if args.mode in ('both', 'client'):
+        for scenario in selected:
+            results[f'client:{scenario[0]}'] = run_client(scenario, args.requests, headers, counter)
+    if args.mode in ('both', 'wsgi'):
+        # The dev server logs every request line; keep the report readable
+        logging.getLogger('werkzeug').setLevel(logging.ERROR)
+        server = make_server('127.0.0.1', 0, app, threaded=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f'http://127.0.0.1:{server.server_port}'
+        try:
+            for scenario in selected:
+                results[f'wsgi:{scenario[0]}'] = run_wsgi(scenario, args.requests, args.concurrency,
+                                                          base_url, headers, counter)
+        finally:
+            server.shutdown()
+
+    print(f"{'scenario':<32}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}{'queries':>9}")
+    for key, result in results.items():
+        print(f"{key:<32}{result['p50']:>9.2f}{result['p95']:>9.2f}{result['p99']:>9.2f}"
+              f"{result['throughput']:>9.1f}{result['queriesPerRequest']:>9.2f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    baseline_path = args.baseline or os.path.join(BASELINE_DIR, f'bench_api_{args.scale}.json')
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+        with open(baseline_path, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\nSaved baseline to {baseline_path}")
+        return
+
+    if os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\nRegressions against {baseline_path}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions against {baseline_path}")
+
+if __name__ == '__main__':
+    main()
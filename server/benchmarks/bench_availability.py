@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# Benchmark: common free slots and free rooms for a large group over a work
+# week, from cold and warm day bitmaps.
+#
+# Usage: python benchmarks/bench_availability.py [--meetings 50000] [--attendees 200] [--runs 50]
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Run against a throwaway database
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jwt
+from app import app, db, User, Meeting, MeetingAttendee, MEETING_ROOMS, availability_engine
+
+PEOPLE = [f'user-{i}' for i in range(1000)]
+DAY_ZERO = datetime(2026, 1, 1)
+
+def seed(meeting_count: int) -> None:
+    rng = random.Random(35)
+    db.drop_all()
+    db.create_all()
+    db.session.execute(db.insert(User), [
+        {'id': user_id, 'name': user_id, 'email': f'{user_id}@example.com', 'password_hash': 'x'}
+        for user_id in PEOPLE
+    ])
+    meetings = []
+    attendees = []
+    for meeting_id in range(1, meeting_count + 1):
+        starts_at = DAY_ZERO + timedelta(days=rng.randrange(365), minutes=rng.randrange(8 * 60, 17 * 60, 15))
+        people = rng.sample(PEOPLE, 6)
+        meetings.append({
+            'id': meeting_id,
+            'title': f'Meeting {meeting_id}',
+            'starts_at': starts_at,
+            'ends_at': starts_at + timedelta(minutes=rng.choice([30, 60, 90])),
+            'room': rng.choice(MEETING_ROOMS)['name'],
+            'organizer_id': people[0],
+            'attendees': '[]',
+            'created_at': DAY_ZERO
+        })
+        attendees.extend({'meeting_id': meeting_id, 'attendee': person} for person in people[1:])
+    db.session.execute(db.insert(Meeting), meetings)
+    db.session.execute(db.insert(MeetingAttendee), attendees)
+    db.session.commit()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the availability engine')
+    parser.add_argument('--meetings', type=int, default=50000)
+    parser.add_argument('--attendees', type=int, default=200)
+    parser.add_argument('--runs', type=int, default=50)
+    args = parser.parse_args()
+
+    with app.app_context():
+        print(f"Seeding {args.meetings} meetings...")
+        seed(args.meetings)
+
+    people = random.Random(36).sample(PEOPLE, args.attendees)
+    query = {
+        'duration': 30,
+        'attendees': ','.join(people[1:]),
+        'from': '2026-06-01',
+        'to': '2026-06-05',
+        'needsRoom': 'false',
+        'limit': 50
+    }
+    token = jwt.encode({'user_id': people[0], 'exp': datetime.utcnow() + timedelta(hours=1)},
+                       app.config['SECRET_KEY'], algorithm='HS256')
+    headers = {'Authorization': f'Bearer {token}'}
+    client = app.test_client()
+
+    def timed(label: str, action, runs: int) -> None:
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            action()
+            samples.append((time.perf_counter() - start) * 1000)
+        print(f"{label:<45}{statistics.median(samples):>10.2f} ms (max {max(samples):.2f})")
+
+    def endpoint() -> None:
+        response = client.get('/api/availability', query_string=query, headers=headers)
+        assert response.status_code == 200
+
+    def engine_only() -> None:
+        with app.app_context():
+            availability_engine.find_slots(
+                people, 30, datetime(2026, 6, 1), datetime(2026, 6, 6),
+                datetime.strptime('09:00', '%H:%M').time(), datetime.strptime('17:00', '%H:%M').time(),
+                rooms=[room['name'] for room in MEETING_ROOMS], needs_room=False, limit=50
+            )
+
+    print(f"{args.attendees} attendees, 30 minute slots, Mon-Fri window\n")
+
+    def cold() -> None:
+        availability_engine.invalidate()
+        endpoint()
+
+    timed('GET /api/availability (cold bitmaps)', cold, max(1, args.runs // 5))
+    timed('GET /api/availability (warm bitmaps)', endpoint, args.runs)
+    timed('find_slots() (warm bitmaps)', engine_only, args.runs)
+
+if __name__ == '__main__':
+    main()
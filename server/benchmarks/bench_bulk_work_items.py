@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# Benchmark: reassigning work items with one PUT per item versus a single
+# POST /api/work-items/bulk call.
+#
+# Usage: python benchmarks/bench_bulk_work_items.py [--work-items 1000]
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Run against a throwaway database
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jwt
+from app import app, db, User, WorkItem
+
+def seed(work_item_count: int) -> None:
+    now = datetime.utcnow()
+    db.drop_all()
+    db.create_all()
+    db.session.execute(db.insert(User), [
+        {'id': user_id, 'name': user_id, 'email': f'{user_id}@example.com', 'password_hash': 'x'}
+        for user_id in ['lead', 'leaver', 'newcomer']
+    ])
+    db.session.execute(db.insert(WorkItem), [{
+        'title': f'Task {i}',
+        'status': 'todo',
+        'priority': 'medium',
+        'assigned_to': 'leaver',
+        'created_by': 'lead',
+        'tags': '[]',
+        'created_at': now,
+        'updated_at': now
+    } for i in range(work_item_count)])
+    db.session.commit()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark bulk work item updates')
+    parser.add_argument('--work-items', type=int, default=1000)
+    args = parser.parse_args()
+
+    token = jwt.encode({'user_id': 'lead', 'exp': datetime.utcnow() + timedelta(hours=1)},
+                       app.config['SECRET_KEY'], algorithm='HS256')
+    headers = {'Authorization': f'Bearer {token}'}
+    client = app.test_client()
+    ids = list(range(1, args.work_items + 1))
+
+    def run(label: str, target: str, action) -> None:
+        with app.app_context():
+            seed(args.work_items)
+        start = time.perf_counter()
+        action()
+        elapsed = time.perf_counter() - start
+        with app.app_context():
+            moved = WorkItem.query.filter_by(assigned_to=target).count()
+        assert moved == args.work_items, f'{label}: only {moved} items updated'
+        print(f"{label:<45}{elapsed * 1000:>12.1f} ms")
+
+    print(f"Reassigning {args.work_items} work items\n")
+
+    def one_put_per_item() -> None:
+        for item_id in ids:
+            response = client.put(f'/api/work-items/{item_id}', json={'assignedTo': 'newcomer'}, headers=headers)
+            assert response.status_code == 200
+
+    def bulk_uniform() -> None:
+        response = client.post('/api/work-items/bulk', json={
+            'patches': [{'id': item_id, 'assignedTo': 'newcomer'} for item_id in ids]
+        }, headers=headers)
+        assert response.status_code == 200
+
+    def bulk_mixed() -> None:
+        # Worst case: every patch differs, so nothing can share an UPDATE
+        response = client.post('/api/work-items/bulk', json={
+            'patches': [{'id': item_id, 'assignedTo': 'newcomer', 'title': f'Task {item_id} (moved)'} for item_id in ids]
+        }, headers=headers)
+        assert response.status_code == 200
+
+    run('PUT /api/work-items/<id> x N', 'newcomer', one_put_per_item)
+    run('POST /api/work-items/bulk (uniform patches)', 'newcomer', bulk_uniform)
+    run('POST /api/work-items/bulk (distinct patches)', 'newcomer', bulk_mixed)
+
+if __name__ == '__main__':
+    main()
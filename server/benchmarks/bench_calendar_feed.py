@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# Benchmark: per-user iCalendar feeds built from scratch, rebuilt after one
+# meeting changes, served from cache and answered with 304 Not Modified.
+#
+# Usage: python benchmarks/bench_calendar_feed.py [--meetings 20000] [--runs 50]
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Run against a throwaway database
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jwt
+from app import app, db, User, Meeting, MeetingAttendee, calendar_feeds
+
+PEOPLE = [f'user-{i}' for i in range(100)]
+DAY_ZERO = datetime(2026, 1, 1)
+FEED_SECRET = 'benchmark-feed-secret'
+
+def seed(meeting_count: int) -> None:
+    rng = random.Random(37)
+    db.drop_all()
+    db.create_all()
+    db.session.execute(db.insert(User), [
+        {'id': user_id, 'name': user_id, 'email': f'{user_id}@example.com', 'password_hash': 'x',
+         'calendar_feed_secret': FEED_SECRET}
+        for user_id in PEOPLE
+    ])
+    meetings = []
+    attendees = []
+    for meeting_id in range(1, meeting_count + 1):
+        starts_at = DAY_ZERO + timedelta(days=rng.randrange(365), minutes=rng.randrange(8 * 60, 17 * 60, 15))
+        people = rng.sample(PEOPLE, 5)
+        meetings.append({
+            'id': meeting_id,
+            'title': f'Meeting {meeting_id}',
+            'starts_at': starts_at,
+            'ends_at': starts_at + timedelta(minutes=rng.choice([30, 60, 90])),
+            'room': 'Room A',
+            'organizer_id': people[0],
+            'attendees': '["' + '", "'.join(people[1:]) + '"]',
+            'notes': 'Agenda to follow',
+            'created_at': DAY_ZERO
+        })
+        attendees.extend({'meeting_id': meeting_id, 'attendee': person} for person in people[1:])
+    db.session.execute(db.insert(Meeting), meetings)
+    db.session.execute(db.insert(MeetingAttendee), attendees)
+    db.session.commit()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the calendar feed')
+    parser.add_argument('--meetings', type=int, default=20000)
+    parser.add_argument('--runs', type=int, default=50)
+    args = parser.parse_args()
+
+    with app.app_context():
+        print(f"Seeding {args.meetings} meetings...")
+        seed(args.meetings)
+        owned = db.session.query(MeetingAttendee.meeting_id).filter_by(attendee=PEOPLE[0]).first()[0]
+
+    path = '/api/calendar/' + jwt.encode({'user_id': PEOPLE[0], 'scope': 'calendar', 'secret': FEED_SECRET},
+                                        app.config['SECRET_KEY'], algorithm='HS256') + '.ics'
+    client = app.test_client()
+    response = client.get(path)
+    etag = response.headers['ETag']
+    print(f"Feed for {PEOPLE[0]}: {response.get_data(as_text=True).count('BEGIN:VEVENT')} events, "
+          f"{len(response.get_data()) // 1024} KiB\n")
+
+    def timed(label: str, action, runs: int) -> None:
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            action()
+            samples.append((time.perf_counter() - start) * 1000)
+        print(f"{label:<45}{statistics.median(samples):>10.2f} ms (max {max(samples):.2f})")
+
+    def cold() -> None:
+        calendar_feeds.invalidate()
+        assert client.get(path).status_code == 200
+
+    def one_meeting_changed() -> None:
+        # Drops one event and every feed listing it, as a commit would
+        calendar_feeds.invalidate({owned})
+        assert client.get(path).status_code == 200
+
+    def cached() -> None:
+        assert client.get(path).status_code == 200
+
+    def not_modified() -> None:
+        assert client.get(path, headers={'If-None-Match': etag}).status_code == 304
+
+    timed('GET feed (cold)', cold, max(1, args.runs // 5))
+    timed('GET feed (one meeting changed)', one_meeting_changed, args.runs)
+    timed('GET feed (cached)', cached, args.runs)
+    timed('GET feed, If-None-Match (304)', not_modified, args.runs)
+
+if __name__ == '__main__':
+    main()
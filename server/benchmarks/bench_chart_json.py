@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# Benchmark: serving a large ChartData series via to_dict() + jsonify (decode
+# and re-encode) versus the pre-serialized chart JSON cache.
+#
+# Usage: python benchmarks/bench_chart_json.py [--size-mb 1] [--repeat 20]
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Run against a throwaway database
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import jwt
+from flask import jsonify
+from app import app, db, User, ChartData, chart_json_cache
+
+def build_series(size_mb: float) -> list:
+    """Build a line-chart series whose JSON encoding is roughly `size_mb`."""
+    series = []
+    start = datetime(2024, 1, 1)
+    size = 0
+    i = 0
+    while size < size_mb * 1024 * 1024:
+        point = {'date': (start + timedelta(minutes=i)).isoformat(), 'value': i % 997, 'target': 500}
+        series.append(point)
+        size += len(json.dumps(point)) + 1
+        i += 1
+    return series
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark chart JSON serialization')
+    parser.add_argument('--size-mb', type=float, default=1.0)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        db.session.add(User(id='bench-user', name='Bench', email='bench@example.com', password_hash='x'))
+        chart = ChartData(chart_type='bench', title='Large series', data=json.dumps(build_series(args.size_mb)))
+        db.session.add(chart)
+        db.session.commit()
+        print(f"Chart payload: {len(chart.data) / 1024 / 1024:.2f} MiB, {len(json.loads(chart.data))} points")
+
+    token = jwt.encode({'user_id': 'bench-user', 'exp': datetime.utcnow() + timedelta(hours=1)},
+                       app.config['SECRET_KEY'], algorithm='HS256')
+    headers = {'Authorization': f'Bearer {token}'}
+    client = app.test_client()
+
+    # Previous path: load the row, json.loads the blob, jsonify re-encodes it
+    decode_encode = []
+    with app.test_request_context():
+        for _ in range(args.repeat):
+            db.session.expire_all()
+            start = time.perf_counter()
+            charts = ChartData.query.filter_by(chart_type='bench').all()
+            jsonify([chart.to_dict() for chart in charts]).get_data()
+            decode_encode.append(time.perf_counter() - start)
+
+    # New path through the endpoint, cold and warm cache
+    cold = []
+    for _ in range(args.repeat):
+        chart_json_cache._entries.clear()
+        chart_json_cache._size = 0
+        start = time.perf_counter()
+        response = client.get('/api/chart-data?type=bench', headers=headers)
+        cold.append(time.perf_counter() - start)
+        assert response.status_code == 200
+    warm = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        response = client.get('/api/chart-data?type=bench', headers=headers)
+        warm.append(time.perf_counter() - start)
+        assert response.status_code == 200
+
+    print(f"\n{'Path':<40}{'median ms':>12}")
+    print(f"{'to_dict + jsonify (decode/encode)':<40}{statistics.median(decode_encode) * 1000:>12.2f}")
+    print(f"{'GET /api/chart-data, cold cache':<40}{statistics.median(cold) * 1000:>12.2f}")
+    print(f"{'GET /api/chart-data, warm cache':<40}{statistics.median(warm) * 1000:>12.2f}")
+
+if __name__ == '__main__':
+    main()
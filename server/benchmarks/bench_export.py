@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# Benchmark: memory and throughput of a large eye gaze export. Seeds a
+# throwaway database with --rows samples, then runs export.py as a separate
+# process, once with a filter that matches nothing (the cost of loading the
+# app) and once over the whole table, sampling its memory from /proc.
+# Anonymous memory (Python objects) is checked against --budget-mb and
+# should barely move from the baseline. File-backed RSS is the database
+# memory-mapped by SQLite, which the OS can drop at will and which is
+# capped by SQLITE_MMAP_BYTES, so it is reported separately.
+#
+# Usage: python benchmarks/bench_export.py [--rows 10000000] [--format ndjson|csv] [--budget-mb 200]
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run against a throwaway database, shared with the export processes
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+os.environ['LOG_LEVEL'] = 'WARNING'
+sys.path.insert(0, SERVER_DIR)
+
+def memory_mib(pid: int) -> tuple:
+    """Current (anonymous, file-backed) resident memory of a process, in MiB."""
+    values = {}
+    with open(f'/proc/{pid}/status') as status:
+        for line in status:
+            key, _, value = line.partition(':')
+            if key in ('RssAnon', 'RssFile'):
+                values[key] = int(value.split()[0]) / 1024
+    return values.get('RssAnon', 0.0), values.get('RssFile', 0.0)
+
+def run_export(arguments: list) -> tuple:
+    """Run export.py to /dev/null; return (seconds, peak anonymous MiB, peak file-backed MiB)."""
+    start = time.perf_counter()
+    peak_anon = peak_file = 0.0
+    with open(os.devnull, 'w') as devnull:
+        process = subprocess.Popen([sys.executable, 'export.py', 'eye-gaze', *arguments],
+                                   cwd=SERVER_DIR, stdout=devnull, stderr=subprocess.DEVNULL)
+        while process.poll() is None:
+            try:
+                anon, file_backed = memory_mib(process.pid)
+            except (FileNotFoundError, ProcessLookupError):
+                break
+            peak_anon, peak_file = max(peak_anon, anon), max(peak_file, file_backed)
+            time.sleep(0.1)
+    if process.wait():
+        raise RuntimeError(f'export.py failed with status {process.returncode}')
+    return time.perf_counter() - start, peak_anon, peak_file
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark memory of a large eye gaze export')
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    parser.add_argument('--format', choices=['ndjson', 'csv'], default='ndjson')
+    parser.add_argument('--budget-mb', type=float, default=200.0, help='peak anonymous memory allowed for the full export')
+    args = parser.parse_args()
+
+    from app import app
+    from seed import seed_database
+    start = time.perf_counter()
+    with app.app_context():
+        seed_database(users=50, messages=0, work_items=0, meetings=0, gaze_samples=args.rows, files=0)
+    print(f"Seeded {args.rows} eye gaze samples in {time.perf_counter() - start:.0f}s\n")
+
+    print(f"{'Export':<22}{'rows':>12}{'seconds':>9}{'rows/s':>10}{'anon MiB':>10}{'file MiB':>10}")
+    runs = [('baseline (no rows)', 0, ['--user', 'nobody']), ('full table', args.rows, [])]
+    peak = 0.0
+    for label, rows, extra in runs:
+        seconds, anon, file_backed = run_export(['--format', args.format, *extra])
+        peak = max(peak, anon)
+        rate = f'{rows / seconds:>10.0f}' if rows else f"{'-':>10}"
+        print(f"{label:<22}{rows:>12}{seconds:>9.1f}{rate}{anon:>10.1f}{file_backed:>10.1f}")
+    verdict = 'within' if peak <= args.budget_mb else 'OVER'
+    print(f"\nPeak anonymous memory {peak:.1f} MiB, {verdict} the {args.budget_mb:.0f} MiB budget")
+    if peak > args.budget_mb:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
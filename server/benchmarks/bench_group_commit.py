@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# Benchmark: group commit for high-frequency inserts. Many threads post eye
+# gaze samples to one process, first with a commit per request and then with
+# GROUP_COMMIT enabled at several window sizes, each on a fresh database.
+# Reports write throughput, request latency and the average batch size, i.e.
+# the throughput gained for the latency added by waiting for the window.
+#
+# Usage: python benchmarks/bench_group_commit.py [--writers 32] [--duration 10]
+#                                                [--windows 1,5,20] [--synchronous FULL]
+
+import argparse
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def configure(database: str, window: float, synchronous: str) -> None:
+    # Runs in each spawned process before the app is imported
+    os.environ['DATABASE_URL'] = 'sqlite:///' + database
+    os.environ['GROUP_COMMIT'] = 'true' if window else 'false'
+    os.environ['GROUP_COMMIT_WINDOW_MS'] = str(window)
+    os.environ['SQLITE_SYNCHRONOUS'] = synchronous
+    os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+    os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+    os.environ['LOG_LEVEL'] = 'CRITICAL'
+    sys.path.insert(0, SERVER_DIR)
+
+def measure(database: str, window: float, synchronous: str, writers: int, duration: float,
+            results: multiprocessing.Queue) -> None:
+    configure(database, window, synchronous)
+    import jwt
+    from app import app, User, GROUP_COMMIT_ROWS
+    from seed import seed_database
+
+    with app.app_context():
+        seed_database(users=writers, messages=0, work_items=0, meetings=0, gaze_samples=0, files=0)
+        user_ids = [user.id for user in User.query.all()]
+    lock = threading.Lock()
+    latencies: list = []
+    failures = [0]
+    deadline = time.monotonic() + duration
+
+    def write(i: int) -> None:
+        client = app.test_client()
+        token = jwt.encode({'user_id': user_ids[i % len(user_ids)], 'exp': datetime.utcnow() + timedelta(hours=1)},
+                           app.config['SECRET_KEY'], algorithm='HS256')
+        auth = {'Authorization': f'Bearer {token}'}
+        local, failed, n = [], 0, 0
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            response = client.post('/api/eye-gaze', json={
+                'isLookingAtScreen': n % 3 != 0, 'confidence': 0.9, 'sessionId': f'bench-{i}'
+            }, headers=auth)
+            local.append(time.perf_counter() - started)
+            failed += response.status_code != 201
+            n += 1
+        with lock:
+            latencies.extend(local)
+            failures[0] += failed
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batches = GROUP_COMMIT_ROWS._values.get(())
+    average_batch = batches[1] / sum(batches[0]) if batches else 1.0
+    results.put((latencies, failures[0], average_batch))
+
+def run(window: float, args: argparse.Namespace) -> dict:
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    database = os.path.join(tempfile.mkdtemp(), 'bench.db')
+    process = context.Process(target=measure, args=(database, window, args.synchronous, args.writers,
+                                                     args.duration, results))
+    process.start()
+    latencies, failures, average_batch = results.get()
+    process.join()
+    latencies.sort()
+    return {
+        'writes': len(latencies) - failures,
+        'failures': failures,
+        'batch': average_batch,
+        'p50': statistics.median(latencies) * 1000 if latencies else 0.0,
+        'p99': latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark group commit for eye gaze inserts')
+    parser.add_argument('--writers', type=int, default=32, help='concurrent writer threads')
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--windows', default='1,5,20', help='GROUP_COMMIT_WINDOW_MS values to try')
+    parser.add_argument('--synchronous', default='FULL', help='SQLITE_SYNCHRONOUS (FULL syncs every commit)')
+    args = parser.parse_args()
+
+    print(f"{args.writers} writers, {args.duration:.0f} s per mode, synchronous={args.synchronous}\n")
+    print(f"{'Mode':<14}{'writes/s':>10}{'failed':>8}{'rows/commit':>13}{'p50 ms':>9}{'p99 ms':>9}")
+    modes = [('per request', 0.0)] + [(f'group {w} ms', float(w)) for w in args.windows.split(',')]
+    for label, window in modes:
+        result = run(window, args)
+        print(f"{label:<14}{result['writes'] / args.duration:>10.0f}{result['failures']:>8}{result['batch']:>13.1f}"
+              f"{result['p50']:>9.1f}{result['p99']:>9.1f}")
+
+if __name__ == '__main__':
+    main()
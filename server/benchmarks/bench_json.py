@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# Benchmark: JSON serialization of 10k-row API responses. Compares the
+# standard library encoder (FAST_JSON=false) with orjson, for encoding
+# alone and for a full GET /api/work-items, and compares peak memory of a
+# buffered jsonify response with the streamed array the list endpoints send.
+#
+# Usage: python benchmarks/bench_json.py [--rows 10000] [--repeat 5]
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run against a throwaway database
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+os.environ['LOG_LEVEL'] = 'WARNING'
+sys.path.insert(0, SERVER_DIR)
+
+import jwt
+from flask import jsonify
+
+from app import app, iter_by_id, iter_json_array, work_item_load_options, User, WorkItem, EyeGazeData
+from seed import seed_database
+
+def timed(func, repeat: int) -> float:
+    """Median wall time of `func` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+def peak_kib(func) -> float:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark JSON serialization of large responses')
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if not app.json.fast:
+        print('orjson is not installed; only the standard library encoder can be measured')
+        return
+
+    with app.app_context():
+        seed_database(users=50, messages=0, work_items=args.rows, meetings=0, gaze_samples=args.rows, files=0)
+        user_id = User.query.first().id
+        work_items = [item.to_dict() for item in WorkItem.query.options(*work_item_load_options()).all()]
+        gaze = [sample.to_dict() for sample in EyeGazeData.query.all()]
+    token = jwt.encode({'user_id': user_id, 'exp': datetime.utcnow() + timedelta(hours=1)},
+                       app.config['SECRET_KEY'], algorithm='HS256')
+    headers = {'Authorization': f'Bearer {token}'}
+    client = app.test_client()
+
+    print(f"{args.rows} rows, median of {args.repeat} runs\n")
+    print(f"{'Case':<34}{'stdlib ms':>11}{'orjson ms':>11}{'speedup':>9}")
+    cases = [
+        ('encode work items', lambda: app.json.dumps(work_items)),
+        ('encode eye gaze samples', lambda: app.json.dumps(gaze)),
+        ('GET /api/work-items (end to end)', lambda: client.get('/api/work-items', headers=headers).get_data())
+    ]
+    for label, func in cases:
+        results = []
+        for fast in (False, True):
+            app.json.fast = fast
+            func()
+            results.append(timed(func, args.repeat))
+        print(f"{label:<34}{results[0]:>11.1f}{results[1]:>11.1f}{results[0] / results[1]:>8.1f}x")
+
+    def buffered() -> None:
+        with app.test_request_context():
+            with app.app_context():
+                rows = [item.to_dict() for item in WorkItem.query.options(*work_item_load_options()).all()]
+                jsonify(rows).get_data()
+
+    def streamed() -> None:
+        with app.test_request_context():
+            with app.app_context():
+                query = WorkItem.query.options(*work_item_load_options())
+                for _ in iter_json_array(item.to_dict() for item in iter_by_id(query, WorkItem.id)):
+                    pass
+
+    print(f"\nPeak Python memory for {args.rows} work items (orjson)")
+    print(f"{'buffered jsonify':<34}{peak_kib(buffered):>10.0f} KiB")
+    print(f"{'streamed array':<34}{peak_kib(streamed):>10.0f} KiB")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# Benchmark: list endpoints with debug logging written synchronously on the
+# request thread (as the old print() calls did), through the background
+# queue writer, and with debug logging switched off.
+#
+# Usage: python benchmarks/bench_logging.py [--rows 200] [--runs 100] [--sink-delay-ms 2]
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Run against a throwaway database
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jwt
+from app import app, db, User, Meeting, WorkItem, JsonLogFormatter, configure_logging
+
+class SlowStream:
+    """A sink that blocks on every write, like a full pipe or a slow terminal."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    def write(self, text: str) -> None:
+        time.sleep(self.delay)
+
+    def flush(self) -> None:
+        pass
+
+def seed(rows: int) -> None:
+    now = datetime.utcnow()
+    db.drop_all()
+    db.create_all()
+    db.session.execute(db.insert(User), [{'id': 'lead', 'name': 'lead', 'email': 'lead@example.com', 'password_hash': 'x'}])
+    db.session.execute(db.insert(WorkItem), [{
+        'title': f'Task {i}', 'status': 'todo', 'priority': 'medium', 'assigned_to': 'lead',
+        'created_by': 'lead', 'tags': '[]', 'created_at': now, 'updated_at': now
+    } for i in range(rows)])
+    db.session.execute(db.insert(Meeting), [{
+        'title': f'Meeting {i}', 'starts_at': now + timedelta(hours=i), 'ends_at': now + timedelta(hours=i, minutes=30),
+        'room': 'Room A', 'organizer_id': 'lead', 'attendees': '[]', 'created_at': now
+    } for i in range(rows)])
+    db.session.commit()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark request logging overhead')
+    parser.add_argument('--rows', type=int, default=200)
+    parser.add_argument('--runs', type=int, default=100)
+    parser.add_argument('--sink-delay-ms', type=float, default=2.0)
+    args = parser.parse_args()
+
+    with app.app_context():
+        seed(args.rows)
+
+    token = jwt.encode({'user_id': 'lead', 'exp': datetime.utcnow() + timedelta(hours=1)},
+                       app.config['SECRET_KEY'], algorithm='HS256')
+    headers = {'Authorization': f'Bearer {token}'}
+    client = app.test_client()
+    sink = SlowStream(args.sink_delay_ms / 1000)
+
+    def reset() -> None:
+        for handler in list(app.logger.handlers):
+            app.logger.removeHandler(handler)
+
+    def synchronous(level: int) -> None:
+        reset()
+        handler = logging.StreamHandler(sink)
+        handler.setFormatter(JsonLogFormatter())
+        app.logger.addHandler(handler)
+        app.logger.setLevel(level)
+
+    def queued(level: int) -> None:
+        reset()
+        configure_logging(app, sink)
+        app.logger.setLevel(level)
+
+    modes = [
+        ('synchronous, DEBUG', lambda: synchronous(logging.DEBUG)),
+        ('queued, DEBUG', lambda: queued(logging.DEBUG)),
+        ('queued, INFO (debug off)', lambda: queued(logging.INFO))
+    ]
+    endpoints = [
+        ('GET /api/meetings', '/api/meetings'),
+        ('GET /api/work-items?page=1', '/api/work-items?page=1')
+    ]
+
+    print(f"{args.rows} rows, sink blocks {args.sink_delay_ms} ms per line\n")
+    for mode, configure in modes:
+        configure()
+        for label, url in endpoints:
+            samples = []
+            for _ in range(args.runs):
+                start = time.perf_counter()
+                response = client.get(url, headers=headers)
+                samples.append((time.perf_counter() - start) * 1000)
+                assert response.status_code == 200
+            print(f"{label + ' [' + mode + ']':<60}{statistics.median(samples):>8.2f} ms "
+                  f"(p95 {statistics.quantiles(samples, n=20)[-1]:.2f})")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# Benchmark: booking conflict checks and date-range listing against a large
+# meeting table, versus loading every meeting and checking overlaps in Python.
+#
+# Usage: python benchmarks/bench_meeting_conflicts.py [--meetings 50000] [--checks 200]
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Run against a throwaway database
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jwt
+from app import app, db, User, Meeting, MeetingAttendee
+
+ROOMS = [f'Room {i}' for i in range(20)]
+PEOPLE = [f'user-{i}' for i in range(200)]
+DAY_ZERO = datetime(2026, 1, 1)
+
+def seed(meeting_count: int) -> None:
+    rng = random.Random(34)
+    db.drop_all()
+    db.create_all()
+    db.session.execute(db.insert(User), [
+        {'id': user_id, 'name': user_id, 'email': f'{user_id}@example.com', 'password_hash': 'x'}
+        for user_id in PEOPLE
+    ])
+    meetings = []
+    attendees = []
+    for meeting_id in range(1, meeting_count + 1):
+        starts_at = DAY_ZERO + timedelta(days=rng.randrange(365), minutes=rng.randrange(8 * 60, 17 * 60, 15))
+        people = rng.sample(PEOPLE, 4)
+        meetings.append({
+            'id': meeting_id,
+            'title': f'Meeting {meeting_id}',
+            'starts_at': starts_at,
+            'ends_at': starts_at + timedelta(minutes=rng.choice([30, 60, 90])),
+            'room': rng.choice(ROOMS),
+            'organizer_id': people[0],
+            'attendees': '["' + '", "'.join(people[1:]) + '"]',
+            'created_at': DAY_ZERO
+        })
+        attendees.extend({'meeting_id': meeting_id, 'attendee': person} for person in people[1:])
+    db.session.execute(db.insert(Meeting), meetings)
+    db.session.execute(db.insert(MeetingAttendee), attendees)
+    db.session.commit()
+
+def python_scan(slots: list) -> int:
+    # What a client had to do before: fetch everything, compare in memory
+    found = 0
+    for starts_at, ends_at, room, people in slots:
+        for meeting in Meeting.query.all():
+            shared = {meeting.organizer_id, *meeting.attendees_list} & set(people)
+            if meeting.starts_at < ends_at and meeting.ends_at > starts_at and (meeting.room == room or shared):
+                found += 1
+    return found
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark meeting conflict detection')
+    parser.add_argument('--meetings', type=int, default=50000)
+    parser.add_argument('--checks', type=int, default=200)
+    args = parser.parse_args()
+
+    with app.app_context():
+        print(f"Seeding {args.meetings} meetings...")
+        seed(args.meetings)
+
+    rng = random.Random(35)
+    slots = []
+    for _ in range(args.checks):
+        starts_at = DAY_ZERO + timedelta(days=rng.randrange(365), hours=rng.randrange(8, 17))
+        slots.append((starts_at, starts_at + timedelta(hours=1), rng.choice(ROOMS), rng.sample(PEOPLE, 5)))
+
+    token = jwt.encode({'user_id': PEOPLE[0], 'exp': datetime.utcnow() + timedelta(hours=1)},
+                       app.config['SECRET_KEY'], algorithm='HS256')
+    headers = {'Authorization': f'Bearer {token}'}
+    client = app.test_client()
+
+    start = time.perf_counter()
+    for starts_at, ends_at, room, people in slots:
+        response = client.get('/api/meetings/conflicts', query_string={
+            'date': starts_at.date().isoformat(),
+            'startTime': starts_at.strftime('%H:%M'),
+            'endTime': ends_at.strftime('%H:%M'),
+            'room': room,
+            'attendees': ','.join(people)
+        }, headers=headers)
+        assert response.status_code == 200
+    per_check = (time.perf_counter() - start) * 1000 / len(slots)
+    print(f"{'GET /api/meetings/conflicts':<45}{per_check:>10.2f} ms/check")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        response = client.get('/api/meetings', query_string={'from': '2026-06-01', 'to': '2026-06-07'}, headers=headers)
+        # The list is streamed; time until the whole body has been produced
+        response.get_data()
+        week_ms = (time.perf_counter() - start) * 1000
+    print(f"{'GET /api/meetings (one week)':<45}{week_ms:>10.2f} ms ({len(response.get_json())} meetings)")
+
+    with app.app_context():
+        sample = slots[:max(1, min(5, len(slots)))]
+        start = time.perf_counter()
+        python_scan(sample)
+        scan_ms = (time.perf_counter() - start) * 1000 / len(sample)
+    print(f"{'Load all + Python overlap check':<45}{scan_ms:>10.2f} ms/check")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# Benchmark: request latency with metrics collection on and off, to keep the
+# instrumentation overhead visible. Runs alternate between the two modes so
+# drift affects both equally.
+#
+# Usage: python benchmarks/bench_metrics.py [--rows 200] [--runs 500]
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Run against a throwaway database
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jwt
+from app import app, db, User, Meeting, WorkItem
+
+def seed(rows: int) -> None:
+    now = datetime.utcnow()
+    db.drop_all()
+    db.create_all()
+    db.session.execute(db.insert(User), [{'id': 'lead', 'name': 'lead', 'email': 'lead@example.com', 'password_hash': 'x'}])
+    db.session.execute(db.insert(WorkItem), [{
+        'title': f'Task {i}', 'status': 'todo', 'priority': 'medium', 'assigned_to': 'lead',
+        'created_by': 'lead', 'tags': '[]', 'created_at': now, 'updated_at': now
+    } for i in range(rows)])
+    db.session.execute(db.insert(Meeting), [{
+        'title': f'Meeting {i}', 'starts_at': now + timedelta(hours=i), 'ends_at': now + timedelta(hours=i, minutes=30),
+        'room': 'Room A', 'organizer_id': 'lead', 'attendees': '[]', 'created_at': now
+    } for i in range(rows)])
+    db.session.commit()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark metrics collection overhead')
+    parser.add_argument('--rows', type=int, default=200)
+    parser.add_argument('--runs', type=int, default=500)
+    args = parser.parse_args()
+
+    with app.app_context():
+        seed(args.rows)
+
+    token = jwt.encode({'user_id': 'lead', 'exp': datetime.utcnow() + timedelta(hours=1)},
+                       app.config['SECRET_KEY'], algorithm='HS256')
+    headers = {'Authorization': f'Bearer {token}'}
+    client = app.test_client()
+    endpoints = [
+        ('GET /api/meetings/1', '/api/meetings/1'),
+        ('GET /api/work-items?page=1', '/api/work-items?page=1'),
+        ('GET /api/meetings', '/api/meetings')
+    ]
+
+    print(f"{args.rows} rows, {args.runs} requests per mode\n")
+    print(f"{'':<35}{'off':>10}{'on':>10}{'overhead':>10}")
+    for label, url in endpoints:
+        samples = {True: [], False: []}
+        for run in range(args.runs * 2):
+            enabled = run % 2 == 0
+            app.config['METRICS_ENABLED'] = enabled
+            start = time.perf_counter()
+            response = client.get(url, headers=headers)
+            samples[enabled].append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200
+        off = statistics.median(samples[False])
+        on = statistics.median(samples[True])
+        print(f"{label:<35}{off:>8.3f}ms{on:>8.3f}ms{(on - off) / off * 100:>9.1f}%")
+
+    app.config['METRICS_ENABLED'] = True
+    start = time.perf_counter()
+    body = client.get('/metrics').get_data()
+    print(f"\nGET /metrics: {(time.perf_counter() - start) * 1000:.2f} ms, {len(body)} bytes")
+
+if __name__ == '__main__':
+    main()
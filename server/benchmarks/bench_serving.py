@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# Benchmark: throughput and latency of the same read-heavy request mix served
+# by the development server (`python app.py`: debugger on, one process) and
+# by the production entry point (gunicorn with gunicorn.conf.py, or waitress),
+# on the same machine and database.
+#
+# Load comes from separate client processes holding keep-alive connections,
+# so the load generator does not share a GIL with the dev server.
+#
+# Usage:
+#   python benchmarks/bench_serving.py [--servers dev,gunicorn,waitress] [--duration 10]
+#                                      [--clients 4] [--connections 8] [--rows 20000]
+
+import argparse
+import importlib.util
+import multiprocessing
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run against a throwaway database, shared with the server processes
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+sys.path.insert(0, SERVER_DIR)
+
+import jwt
+import requests
+
+PATHS = [
+    '/api/messages',
+    '/api/work-items?page=1&perPage=50',
+    '/api/users',
+    '/api/analytics',
+    '/api/eye-gaze?limit=100'
+]
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def server_command(name: str, port: int, args: argparse.Namespace) -> list:
+    if name == 'dev':
+        # What `python app.py` runs, minus the reloader's extra process
+        return [sys.executable, '-c',
+                f"from app import app; app.run(debug=True, use_reloader=False, host='127.0.0.1', port={port})"]
+    if name == 'gunicorn':
+        command = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--bind', f'127.0.0.1:{port}']
+        if args.workers:
+            command += ['--workers', str(args.workers)]
+        return command + ['wsgi:application']
+    if name == 'waitress':
+        return [sys.executable, '-m', 'waitress', f'--listen=127.0.0.1:{port}', '--threads=8', 'wsgi:application']
+    raise ValueError(f'Unknown server {name}')
+
+def wait_until_ready(base_url: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'Server exited with status {process.returncode}')
+        try:
+            requests.get(base_url + '/api/users', timeout=1)
+            return
+        except requests.ConnectionError:
+            time.sleep(0.1)
+    raise RuntimeError('Server did not start in time')
+
+def client(base_url: str, headers: dict, connections: int, duration: float, results: multiprocessing.Queue) -> None:
+    """One load-generating process: `connections` threads, each on its own keep-alive session."""
+    samples: list = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def run(offset: int) -> None:
+        session = requests.Session()
+        session.headers.update(headers)
+        local, failed, i = [], 0, offset
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                response = session.get(base_url + PATHS[i % len(PATHS)], timeout=30)
+                if response.status_code != 200:
+                    failed += 1
+            except requests.RequestException:
+                failed += 1
+            local.append(time.perf_counter() - start)
+            i += 1
+        with lock:
+            samples.extend(local)
+            errors[0] += failed
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    results.put((samples, errors[0]))
+
+def measure(name: str, args: argparse.Namespace, headers: dict) -> dict:
+    port = free_port()
+    base_url = f'http://127.0.0.1:{port}'
+    process = subprocess.Popen(server_command(name, port, args), cwd=SERVER_DIR,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_until_ready(base_url, process)
+        # Warm caches and connection pools before measuring
+        session = requests.Session()
+        for path in PATHS * 5:
+            session.get(base_url + path, headers=headers, timeout=30)
+
+        results: multiprocessing.Queue = multiprocessing.Queue()
+        clients = [multiprocessing.Process(target=client, args=(base_url, headers, args.connections, args.duration, results))
+                   for _ in range(args.clients)]
+        started = time.perf_counter()
+        for load in clients:
+            load.start()
+        samples, errors = [], 0
+        for _ in clients:
+            chunk, failed = results.get()
+            samples.extend(chunk)
+            errors += failed
+        for load in clients:
+            load.join()
+        elapsed = time.perf_counter() - started
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+    samples.sort()
+    def percentile(p: float) -> float:
+        return samples[min(len(samples) - 1, int(len(samples) * p))] * 1000
+    return {
+        'requests': len(samples),
+        'errors': errors,
+        'throughput': len(samples) / elapsed,
+        'p50': statistics.median(samples) * 1000,
+        'p95': percentile(0.95),
+        'p99': percentile(0.99)
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare the dev server with the production server')
+    parser.add_argument('--servers', default='dev,gunicorn')
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds of load per server')
+    parser.add_argument('--clients', type=int, default=4, help='load-generating processes')
+    parser.add_argument('--connections', type=int, default=8, help='keep-alive connections per client process')
+    parser.add_argument('--rows', type=int, default=20000, help='messages, work items and gaze samples to seed')
+    parser.add_argument('--workers', type=int, help='override gunicorn worker count')
+    args = parser.parse_args()
+
+    from app import app, User
+    from seed import seed_database
+    with app.app_context():
+        print(f"Seeding {args.rows} rows per table...")
+        seed_database(users=50, messages=args.rows, work_items=args.rows, gaze_samples=args.rows)
+        user_id = User.query.filter_by(email='test@example.com').one().id
+    token = jwt.encode({'user_id': user_id, 'exp': datetime.utcnow() + timedelta(hours=1)},
+                       app.config['SECRET_KEY'], algorithm='HS256')
+    headers = {'Authorization': f'Bearer {token}'}
+
+    print(f"{args.clients} client processes x {args.connections} connections, {args.duration:.0f} s per server, "
+          f"{multiprocessing.cpu_count()} CPUs\n")
+    print(f"{'Server':<12}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    baseline = None
+    for name in args.servers.split(','):
+        if name != 'dev' and importlib.util.find_spec(name) is None:
+            print(f"{name:<12}  not installed (pip install {name}), skipped")
+            continue
+        result = measure(name, args, headers)
+        baseline = baseline or result['throughput']
+        print(f"{name:<12}{result['throughput']:>10.0f}{result['p50']:>10.1f}{result['p95']:>10.1f}"
+              f"{result['p99']:>10.1f}{result['errors']:>8}   x{result['throughput'] / baseline:.2f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# Benchmark: concurrent writers on SQLite, as several worker processes see it.
+# Each process posts eye gaze samples and chat messages from a few threads
+# while another thread keeps listing messages. Runs once with SQLite's
+# defaults (SQLITE_TUNING=false: rollback journal, synchronous=FULL, the
+# sqlite3 module's 5 s lock timeout) and once with the tuned pragmas, each
+# on a fresh database, and reports write throughput and how many requests
+# failed with "database is locked".
+#
+# Usage: python benchmarks/bench_sqlite_writes.py [--processes 4] [--writers 4] [--duration 10]
+
+import argparse
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def configure(database: str, tuned: bool) -> None:
+    # Runs in each spawned process before the app is imported
+    os.environ['DATABASE_URL'] = 'sqlite:///' + database
+    os.environ['SQLITE_TUNING'] = 'true' if tuned else 'false'
+    os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+    os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+    os.environ['LOG_LEVEL'] = 'CRITICAL'
+    sys.path.insert(0, SERVER_DIR)
+
+def seed(database: str, tuned: bool) -> None:
+    configure(database, tuned)
+    from app import app
+    from seed import seed_database
+    with app.app_context():
+        seed_database(users=20, messages=20000, work_items=100, gaze_samples=20000)
+
+def worker(database: str, tuned: bool, writers: int, duration: float, results: multiprocessing.Queue) -> None:
+    configure(database, tuned)
+    import jwt
+    from app import app, User
+
+    with app.app_context():
+        user_ids = [user.id for user in User.query.limit(writers).all()]
+    lock = threading.Lock()
+    counts = {'writes': 0, 'locked': 0, 'errors': 0, 'reads': 0}
+    latencies: list = []
+    deadline = time.monotonic() + duration
+
+    def headers(user_id: str) -> dict:
+        token = jwt.encode({'user_id': user_id, 'exp': datetime.utcnow() + timedelta(hours=1)},
+                           app.config['SECRET_KEY'], algorithm='HS256')
+        return {'Authorization': f'Bearer {token}'}
+
+    def write(i: int) -> None:
+        client = app.test_client()
+        auth = headers(user_ids[i % len(user_ids)])
+        local, done = [], {'writes': 0, 'locked': 0, 'errors': 0}
+        n = 0
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            if i % 2:
+                response = client.post('/api/messages', json={'content': f'Load message {n}', 'priority': 'normal'}, headers=auth)
+            else:
+                response = client.post('/api/eye-gaze', json={
+                    'isLookingAtScreen': n % 3 != 0, 'confidence': 0.9, 'sessionId': f'bench-{os.getpid()}-{i}'
+                }, headers=auth)
+            local.append(time.perf_counter() - started)
+            if response.status_code in (200, 201):
+                done['writes'] += 1
+            elif 'locked' in response.get_data(as_text=True):
+                done['locked'] += 1
+            else:
+                done['errors'] += 1
+            n += 1
+        with lock:
+            latencies.extend(local)
+            for key, value in done.items():
+                counts[key] += value
+
+    def read() -> None:
+        client = app.test_client()
+        auth = headers(user_ids[0])
+        while time.monotonic() < deadline:
+            response = client.get('/api/messages', headers=auth)
+            response.get_data()
+            with lock:
+                if response.status_code == 200:
+                    counts['reads'] += 1
+                elif 'locked' in response.get_data(as_text=True):
+                    counts['locked'] += 1
+                else:
+                    counts['errors'] += 1
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(writers)]
+    threads.append(threading.Thread(target=read))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    results.put((counts, latencies))
+
+def run(tuned: bool, args: argparse.Namespace) -> dict:
+    context = multiprocessing.get_context('spawn')
+    database = os.path.join(tempfile.mkdtemp(), 'bench.db')
+    seeder = context.Process(target=seed, args=(database, tuned))
+    seeder.start()
+    seeder.join()
+
+    results = context.Queue()
+    processes = [context.Process(target=worker, args=(database, tuned, args.writers, args.duration, results))
+                 for _ in range(args.processes)]
+    for process in processes:
+        process.start()
+    totals = {'writes': 0, 'locked': 0, 'errors': 0, 'reads': 0}
+    latencies: list = []
+    for _ in processes:
+        counts, samples = results.get()
+        latencies.extend(samples)
+        for key, value in counts.items():
+            totals[key] += value
+    for process in processes:
+        process.join()
+    latencies.sort()
+    totals['p50'] = statistics.median(latencies) * 1000 if latencies else 0.0
+    totals['p99'] = latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0
+    return totals
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark concurrent SQLite writes')
+    parser.add_argument('--processes', type=int, default=4, help='worker processes')
+    parser.add_argument('--writers', type=int, default=4, help='writer threads per process')
+    parser.add_argument('--duration', type=float, default=10.0)
+    args = parser.parse_args()
+
+    print(f"{args.processes} processes x ({args.writers} writers + 1 reader), {args.duration:.0f} s\n")
+    print(f"{'Mode':<10}{'writes/s':>10}{'reads/s':>10}{'locked':>8}{'errors':>8}{'p50 ms':>9}{'p99 ms':>9}")
+    for label, tuned in (('default', False), ('tuned', True)):
+        result = run(tuned, args)
+        print(f"{label:<10}{result['writes'] / args.duration:>10.0f}{result['reads'] / args.duration:>10.0f}"
+              f"{result['locked']:>8}{result['errors']:>8}{result['p50']:>9.1f}{result['p99']:>9.1f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# Query-count check and latency benchmark for the work item list endpoint.
+#
+# Serializing a page must issue a constant number of SQL statements no matter
+# how many items or attachments it holds; the script exits non-zero otherwise.
+# tests/test_work_item_queries.py runs the same check under pytest.
+#
+# Usage: python benchmarks/bench_work_items.py [--work-items 5000] [--skip-full-list]
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Run against a throwaway database
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jwt
+from sqlalchemy import event
+from app import app, db, User, WorkItem, WorkItemTag, FileAttachment
+
+class QueryCounter:
+    """Counts statements sent to the database while active."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args) -> None:
+        self.count += 1
+
+    def __enter__(self) -> 'QueryCounter':
+        event.listen(db.engine, 'before_cursor_execute', self)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(db.engine, 'before_cursor_execute', self)
+
+def seed(work_item_count: int) -> str:
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    user_ids = [f'user-{i}' for i in range(50)]
+
+    db.drop_all()
+    db.create_all()
+    db.session.execute(db.insert(User), [{
+        'id': user_id, 'name': f'User {i}', 'email': f'user{i}@example.com', 'password_hash': 'x'
+    } for i, user_id in enumerate(user_ids)])
+    db.session.execute(db.insert(WorkItem), [{
+        'title': f'Task {i}',
+        'description': 'Synthetic work item',
+        'status': rng.choice(['todo', 'in-progress', 'review', 'done']),
+        'priority': rng.choice(['low', 'medium', 'high']),
+        'assigned_to': rng.choice(user_ids + [None]),
+        'created_by': rng.choice(user_ids),
+        'tags': '["bench"]',
+        'due_date': now + timedelta(days=rng.randint(-30, 90)) if rng.random() < 0.7 else None,
+        'created_at': now,
+        'updated_at': now
+    } for i in range(work_item_count)])
+    # Core inserts bypass the ORM tag sync, so fill the tag index directly
+    db.session.execute(db.insert(WorkItemTag), [{
+        'work_item_id': i + 1, 'tag': 'bench'
+    } for i in range(0, work_item_count, 7)])
+    # Attachments on every tenth item, with a sizeable payload that must not be loaded
+    db.session.execute(db.insert(FileAttachment), [{
+        'filename': f'file-{i}.txt',
+        'file_type': 'text/plain',
+        'file_size': 64 * 1024,
+        'data': 'A' * 64 * 1024,
+        'work_item_id': i + 1,
+        'uploader_id': rng.choice(user_ids),
+        'uploaded_at': now
+    } for i in range(0, work_item_count, 10)])
+    db.session.commit()
+    return user_ids[0]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the work item list endpoint')
+    parser.add_argument('--work-items', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--skip-full-list', action='store_true', help='Skip the unpaginated request')
+    args = parser.parse_args()
+
+    with app.app_context():
+        user_id = seed(args.work_items)
+
+    token = jwt.encode({'user_id': user_id, 'exp': datetime.utcnow() + timedelta(hours=1)},
+                       app.config['SECRET_KEY'], algorithm='HS256')
+    headers = {'Authorization': f'Bearer {token}'}
+    client = app.test_client()
+
+    urls = [
+        '/api/work-items?page=1&perPage=10',
+        '/api/work-items?page=1&perPage=100',
+        '/api/work-items?page=1&perPage=500',
+        '/api/work-items?page=3&perPage=500&status=todo,review',
+        '/api/work-items?page=1&perPage=500&fields=id,title,status',
+        '/api/work-items?counts=status',
+        '/api/work-items?status=todo&limit=50',
+        '/api/work-items?status=todo&limit=50&sort=-dueDate',
+        '/api/work-items?tag=bench&limit=50',
+        '/api/work-items'
+    ]
+
+    print(f"{'Request':<60}{'queries':>8}{'median ms':>12}{'KiB':>10}")
+    query_counts = {}
+    if args.skip_full_list:
+        urls.remove('/api/work-items')
+
+    with app.app_context():
+        for url in urls:
+            timings = []
+            for _ in range(args.repeat):
+                with QueryCounter() as counter:
+                    start = time.perf_counter()
+                    response = client.get(url, headers=headers)
+                    timings.append(time.perf_counter() - start)
+                assert response.status_code == 200, response.data[:200]
+            query_counts[url] = counter.count
+            print(f"{url:<60}{counter.count:>8}{statistics.median(timings) * 1000:>12.1f}{len(response.data) / 1024:>10.1f}")
+
+    # Pages of 10, 100 and 500 items must cost the same number of queries
+    paged = [query_counts[url] for url in urls[:3]]
+    if len(set(paged)) != 1:
+        print(f"\nFAIL: query count grows with page size: {paged}")
+        sys.exit(1)
+    print(f"\nOK: {paged[0]} queries per page regardless of page size")
+
+if __name__ == '__main__':
+    main()
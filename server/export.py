@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# Export messages, work items or eye gaze samples as NDJSON or CSV, streaming
+# rows in batches so memory stays flat however large the table is. Unlike
+# GET /api/export/<dataset>, every user's rows are included.
+#
+# Usage: python export.py {messages,work-items,eye-gaze} [--format ndjson|csv]
+#                         [--from 2026-01-01] [--to 2026-01-31] [--user ID]
+#                         [--session ID] [--output FILE]
+
+import argparse
+import sys
+import time
+
+from app import app, EXPORTS, EXPORT_FORMATS, export_filters, iter_export
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Export a table as NDJSON or CSV')
+    parser.add_argument('dataset', choices=sorted(EXPORTS))
+    parser.add_argument('--format', choices=sorted(EXPORT_FORMATS), default='ndjson')
+    parser.add_argument('--from', dest='from_', metavar='DATE', help='first day to include (ISO date)')
+    parser.add_argument('--to', metavar='DATE', help='last day to include (ISO date)')
+    parser.add_argument('--user', help='user ID (sender, assignee or creator, or sample owner)')
+    parser.add_argument('--session', help='eye gaze session ID')
+    parser.add_argument('--output', '-o', help='file to write (default: stdout)')
+    args = parser.parse_args()
+
+    try:
+        filters = export_filters({'from': args.from_, 'to': args.to, 'user': args.user, 'sessionId': args.session})
+    except ValueError as e:
+        parser.error(f'Invalid date format: {e}')
+    if args.session and EXPORTS[args.dataset].session is None:
+        parser.error(f'{args.dataset} has no sessions to filter by')
+
+    start = time.perf_counter()
+    written = 0
+    output = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    try:
+        with app.app_context():
+            for chunk in iter_export(args.dataset, args.format, **filters):
+                output.write(chunk)
+                written += len(chunk)
+    finally:
+        if args.output:
+            output.close()
+    print(f"Exported {args.dataset} ({written / 1024 / 1024:.1f} MiB) in {time.perf_counter() - start:.1f}s",
+          file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
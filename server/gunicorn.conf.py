@@ -0,0 +1,53 @@
+# Gunicorn settings for production: gunicorn -c gunicorn.conf.py wsgi:application
+#
+# Every setting can be overridden from the environment (or on the command
+# line, which wins over this file).
+#
+# Reloading:
+#   kill -HUP <master>   re-reads this file and gracefully replaces the
+#                        workers; with preload_app the application code is
+#                        NOT re-imported, because workers fork from the
+#                        master's copy.
+#   kill -USR2 <master>  starts a new master with fresh code next to the old
+#                        one; then `kill -WINCH <old master>` to drain its
+#                        workers and `kill -QUIT <old master>` to retire it.
+#   kill -TERM <master>  graceful shutdown, waiting up to graceful_timeout.
+
+import multiprocessing
+import os
+
+bind = os.environ.get('BIND', '127.0.0.1:5000')
+
+# Import the app once in the master and fork workers from it: faster starts
+# and shared memory for the imported code. Connection pools and the log
+# writer thread are reset in each worker (see reset_after_fork in app.py).
+preload_app = True
+
+# Requests mostly wait on SQLite or outbound AI/translation calls, so each
+# process runs a few threads; processes add CPU parallelism past the GIL
+workers = int(os.environ.get('WEB_CONCURRENCY', max(2, multiprocessing.cpu_count())))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Keep client connections open between requests. Behind a proxy, keep this
+# longer than the proxy's upstream idle timeout so the proxy closes first
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+
+# Summaries and translations can take several seconds
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+
+# Recycle workers now and then so in-process caches and fragmentation stay
+# bounded; the jitter keeps them from all restarting at once
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 5000))
+max_requests_jitter = max_requests // 10
+
+# Worker heartbeats go to tmpfs where available (Docker's /tmp may be disk)
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+# Access logs are off by default (request timings are in /metrics); set
+# GUNICORN_ACCESS_LOG=- to write them to stdout. Gunicorn's own logs go to stderr
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG') or None
+errorlog = '-'
+loglevel = os.environ.get('LOG_LEVEL', 'info').lower()
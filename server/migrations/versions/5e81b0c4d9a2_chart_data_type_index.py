@@ -0,0 +1,26 @@
+"""Index chart_data.chart_type
+
+Revision ID: 5e81b0c4d9a2
+Revises: a3c9d2e7f041
+Create Date: 2026-10-18 10:41:07.902146
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e81b0c4d9a2'
+down_revision = 'a3c9d2e7f041'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('chart_data', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_chart_data_chart_type'), ['chart_type'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('chart_data', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_chart_data_chart_type'))
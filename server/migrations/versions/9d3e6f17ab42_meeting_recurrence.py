@@ -0,0 +1,52 @@
+"""Add meeting recurrence rules and meeting_exception table
+
+Revision ID: 9d3e6f17ab42
+Revises: e4b7a9c21d58
+Create Date: 2026-10-18 15:02:44.906215
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d3e6f17ab42'
+down_revision = 'e4b7a9c21d58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('meeting', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('recurrence', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('recurrence_ends_at', sa.DateTime(), nullable=True))
+        batch_op.create_index('ix_meeting_recurrence_ends_at', ['recurrence_ends_at'], unique=False)
+
+    op.create_table('meeting_exception',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('meeting_id', sa.Integer(), nullable=False),
+        sa.Column('original_start', sa.DateTime(), nullable=False),
+        sa.Column('cancelled', sa.Boolean(), nullable=False),
+        sa.Column('starts_at', sa.DateTime(), nullable=True),
+        sa.Column('ends_at', sa.DateTime(), nullable=True),
+        sa.Column('title', sa.String(length=100), nullable=True),
+        sa.Column('room', sa.String(length=50), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(['meeting_id'], ['meeting.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('meeting_id', 'original_start', name='uq_meeting_exception_occurrence')
+    )
+    with op.batch_alter_table('meeting_exception', schema=None) as batch_op:
+        batch_op.create_index('ix_meeting_exception_starts_at', ['starts_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('meeting_exception', schema=None) as batch_op:
+        batch_op.drop_index('ix_meeting_exception_starts_at')
+
+    op.drop_table('meeting_exception')
+
+    with op.batch_alter_table('meeting', schema=None) as batch_op:
+        batch_op.drop_index('ix_meeting_recurrence_ends_at')
+        batch_op.drop_column('recurrence_ends_at')
+        batch_op.drop_column('recurrence')
@@ -0,0 +1,57 @@
+"""Add eye gaze session rollup table
+
+Revision ID: a3c9d2e7f041
+Revises: 62b9f3e1280c
+Create Date: 2026-10-18 09:12:44.518203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c9d2e7f041'
+down_revision = '62b9f3e1280c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('eye_gaze_session',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.String(length=50), nullable=False),
+        sa.Column('session_id', sa.String(length=50), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=False),
+        sa.Column('ended_at', sa.DateTime(), nullable=False),
+        sa.Column('sample_count', sa.Integer(), nullable=False),
+        sa.Column('looking_count', sa.Integer(), nullable=False),
+        sa.Column('confidence_total', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'session_id', name='uq_eye_gaze_session_user_session')
+    )
+    with op.batch_alter_table('eye_gaze_session', schema=None) as batch_op:
+        batch_op.create_index('ix_eye_gaze_session_user_started', ['user_id', 'started_at'], unique=False)
+
+    with op.batch_alter_table('eye_gaze_data', schema=None) as batch_op:
+        batch_op.create_index('ix_eye_gaze_data_user_session_timestamp', ['user_id', 'session_id', 'timestamp'], unique=False)
+
+    # Backfill rollups from the samples already recorded
+    op.execute("""
+        INSERT INTO eye_gaze_session
+            (user_id, session_id, started_at, ended_at, sample_count, looking_count, confidence_total)
+        SELECT user_id, session_id, MIN(timestamp), MAX(timestamp), COUNT(*),
+               SUM(CASE WHEN is_looking_at_screen THEN 1 ELSE 0 END), SUM(confidence)
+        FROM eye_gaze_data
+        GROUP BY user_id, session_id
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('eye_gaze_data', schema=None) as batch_op:
+        batch_op.drop_index('ix_eye_gaze_data_user_session_timestamp')
+
+    with op.batch_alter_table('eye_gaze_session', schema=None) as batch_op:
+        batch_op.drop_index('ix_eye_gaze_session_user_started')
+
+    op.drop_table('eye_gaze_session')
@@ -0,0 +1,28 @@
+"""Add table_version table for ETags shared across workers
+
+Revision ID: b6e1c4f9d273
+Revises: f2d8b5c1a7e3
+Create Date: 2026-10-19 11:20:37.150926
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6e1c4f9d273'
+down_revision = 'f2d8b5c1a7e3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('table_version',
+        sa.Column('table_name', sa.String(length=64), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('table_name')
+    )
+
+
+def downgrade():
+    op.drop_table('table_version')
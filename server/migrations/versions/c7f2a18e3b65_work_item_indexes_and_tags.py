@@ -0,0 +1,77 @@
+"""Add work item list indexes, attachment FK indexes and work_item_tag table
+
+Revision ID: c7f2a18e3b65
+Revises: 5e81b0c4d9a2
+Create Date: 2026-10-18 13:05:51.274410
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7f2a18e3b65'
+down_revision = '5e81b0c4d9a2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('work_item_tag',
+        sa.Column('work_item_id', sa.Integer(), nullable=False),
+        sa.Column('tag', sa.String(length=50), nullable=False),
+        sa.ForeignKeyConstraint(['work_item_id'], ['work_item.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('work_item_id', 'tag')
+    )
+    with op.batch_alter_table('work_item_tag', schema=None) as batch_op:
+        batch_op.create_index('ix_work_item_tag_tag_work_item', ['tag', 'work_item_id'], unique=False)
+
+    with op.batch_alter_table('work_item', schema=None) as batch_op:
+        batch_op.create_index('ix_work_item_status_id', ['status', 'id'], unique=False)
+        batch_op.create_index('ix_work_item_priority_id', ['priority', 'id'], unique=False)
+        batch_op.create_index('ix_work_item_assigned_to_id', ['assigned_to', 'id'], unique=False)
+        batch_op.create_index('ix_work_item_due_date_id', ['due_date', 'id'], unique=False)
+        batch_op.create_index('ix_work_item_created_at_id', ['created_at', 'id'], unique=False)
+        batch_op.create_index('ix_work_item_updated_at_id', ['updated_at', 'id'], unique=False)
+
+    # Attachment lookups by parent, used when eager-loading list pages
+    with op.batch_alter_table('file_attachment', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_file_attachment_message_id'), ['message_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_file_attachment_work_item_id'), ['work_item_id'], unique=False)
+
+    # Backfill tag rows from the JSON tags column
+    connection = op.get_bind()
+    rows = []
+    for work_item_id, tags in connection.execute(sa.text('SELECT id, tags FROM work_item')):
+        try:
+            parsed = json.loads(tags) if tags else []
+        except (TypeError, ValueError):
+            parsed = []
+        for tag in dict.fromkeys(str(tag)[:50] for tag in parsed):
+            rows.append({'work_item_id': work_item_id, 'tag': tag})
+    if rows:
+        connection.execute(
+            sa.text('INSERT INTO work_item_tag (work_item_id, tag) VALUES (:work_item_id, :tag)'),
+            rows
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('file_attachment', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_file_attachment_work_item_id'))
+        batch_op.drop_index(batch_op.f('ix_file_attachment_message_id'))
+
+    with op.batch_alter_table('work_item', schema=None) as batch_op:
+        batch_op.drop_index('ix_work_item_updated_at_id')
+        batch_op.drop_index('ix_work_item_created_at_id')
+        batch_op.drop_index('ix_work_item_due_date_id')
+        batch_op.drop_index('ix_work_item_assigned_to_id')
+        batch_op.drop_index('ix_work_item_priority_id')
+        batch_op.drop_index('ix_work_item_status_id')
+
+    with op.batch_alter_table('work_item_tag', schema=None) as batch_op:
+        batch_op.drop_index('ix_work_item_tag_tag_work_item')
+
+    op.drop_table('work_item_tag')
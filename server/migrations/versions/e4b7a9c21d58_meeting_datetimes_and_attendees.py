@@ -0,0 +1,143 @@
+"""Replace meeting date/time strings with indexed datetimes, add meeting_attendee table
+
+Revision ID: e4b7a9c21d58
+Revises: c7f2a18e3b65
+Create Date: 2026-10-18 14:21:07.518342
+
+"""
+import json
+from datetime import datetime, timedelta
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b7a9c21d58'
+down_revision = 'c7f2a18e3b65'
+branch_labels = None
+depends_on = None
+
+
+def _parse_slot(date, start_time, end_time, created_at):
+    """Best-effort parse of the legacy strings; unparseable rows fall back to created_at."""
+    try:
+        day = datetime.strptime(str(date)[:10], '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        day = created_at.date() if isinstance(created_at, datetime) else datetime.utcnow().date()
+    try:
+        starts_at = datetime.combine(day, datetime.strptime(str(start_time)[:5], '%H:%M').time())
+    except (TypeError, ValueError):
+        starts_at = datetime.combine(day, datetime.min.time())
+    try:
+        ends_at = datetime.combine(day, datetime.strptime(str(end_time)[:5], '%H:%M').time())
+    except (TypeError, ValueError):
+        ends_at = starts_at + timedelta(hours=1)
+    if ends_at <= starts_at:
+        ends_at = starts_at + timedelta(hours=1)
+    return starts_at, ends_at
+
+
+def upgrade():
+    with op.batch_alter_table('meeting', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('starts_at', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('ends_at', sa.DateTime(), nullable=True))
+
+    op.create_table('meeting_attendee',
+        sa.Column('meeting_id', sa.Integer(), nullable=False),
+        sa.Column('attendee', sa.String(length=100), nullable=False),
+        sa.ForeignKeyConstraint(['meeting_id'], ['meeting.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('meeting_id', 'attendee')
+    )
+    with op.batch_alter_table('meeting_attendee', schema=None) as batch_op:
+        batch_op.create_index('ix_meeting_attendee_attendee_meeting', ['attendee', 'meeting_id'], unique=False)
+
+    # Backfill datetimes and attendee rows from the legacy columns
+    connection = op.get_bind()
+    meeting_table = sa.table('meeting',
+        sa.column('id', sa.Integer()),
+        sa.column('starts_at', sa.DateTime()),
+        sa.column('ends_at', sa.DateTime())
+    )
+    slots = []
+    attendees = []
+    result = connection.execute(sa.text(
+        'SELECT id, date, start_time, end_time, attendees, created_at FROM meeting'
+    ))
+    for meeting_id, date, start_time, end_time, attendee_json, created_at in result:
+        if isinstance(created_at, str):
+            try:
+                created_at = datetime.fromisoformat(created_at)
+            except ValueError:
+                created_at = None
+        starts_at, ends_at = _parse_slot(date, start_time, end_time, created_at)
+        slots.append({'meeting_id': meeting_id, 'starts_at': starts_at, 'ends_at': ends_at})
+        try:
+            parsed = json.loads(attendee_json) if attendee_json else []
+        except (TypeError, ValueError):
+            parsed = []
+        for attendee in dict.fromkeys(str(attendee)[:100] for attendee in parsed):
+            attendees.append({'meeting_id': meeting_id, 'attendee': attendee})
+    if slots:
+        connection.execute(
+            meeting_table.update().where(meeting_table.c.id == sa.bindparam('meeting_id')).values(
+                starts_at=sa.bindparam('starts_at'), ends_at=sa.bindparam('ends_at')
+            ),
+            slots
+        )
+    if attendees:
+        connection.execute(
+            sa.text('INSERT INTO meeting_attendee (meeting_id, attendee) VALUES (:meeting_id, :attendee)'),
+            attendees
+        )
+
+    with op.batch_alter_table('meeting', schema=None) as batch_op:
+        batch_op.alter_column('starts_at', existing_type=sa.DateTime(), nullable=False)
+        batch_op.alter_column('ends_at', existing_type=sa.DateTime(), nullable=False)
+        batch_op.drop_column('date')
+        batch_op.drop_column('start_time')
+        batch_op.drop_column('end_time')
+        batch_op.create_index('ix_meeting_starts_at', ['starts_at'], unique=False)
+        batch_op.create_index('ix_meeting_room_starts_at', ['room', 'starts_at'], unique=False)
+        batch_op.create_index('ix_meeting_organizer_starts_at', ['organizer_id', 'starts_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('meeting', schema=None) as batch_op:
+        batch_op.drop_index('ix_meeting_organizer_starts_at')
+        batch_op.drop_index('ix_meeting_room_starts_at')
+        batch_op.drop_index('ix_meeting_starts_at')
+        batch_op.add_column(sa.Column('date', sa.String(length=50), nullable=True))
+        batch_op.add_column(sa.Column('start_time', sa.String(length=20), nullable=True))
+        batch_op.add_column(sa.Column('end_time', sa.String(length=20), nullable=True))
+
+    connection = op.get_bind()
+    rows = []
+    for meeting_id, starts_at, ends_at in connection.execute(sa.text('SELECT id, starts_at, ends_at FROM meeting')):
+        if isinstance(starts_at, str):
+            starts_at = datetime.fromisoformat(starts_at)
+        if isinstance(ends_at, str):
+            ends_at = datetime.fromisoformat(ends_at)
+        rows.append({
+            'meeting_id': meeting_id,
+            'date': starts_at.date().isoformat(),
+            'start_time': starts_at.strftime('%H:%M'),
+            'end_time': ends_at.strftime('%H:%M')
+        })
+    if rows:
+        connection.execute(
+            sa.text('UPDATE meeting SET date = :date, start_time = :start_time, end_time = :end_time WHERE id = :meeting_id'),
+            rows
+        )
+
+    with op.batch_alter_table('meeting', schema=None) as batch_op:
+        batch_op.alter_column('date', existing_type=sa.String(length=50), nullable=False)
+        batch_op.alter_column('start_time', existing_type=sa.String(length=20), nullable=False)
+        batch_op.alter_column('end_time', existing_type=sa.String(length=20), nullable=False)
+        batch_op.drop_column('ends_at')
+        batch_op.drop_column('starts_at')
+
+    with op.batch_alter_table('meeting_attendee', schema=None) as batch_op:
+        batch_op.drop_index('ix_meeting_attendee_attendee_meeting')
+
+    op.drop_table('meeting_attendee')
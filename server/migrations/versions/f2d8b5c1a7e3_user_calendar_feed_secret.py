@@ -0,0 +1,28 @@
+"""Add per-user calendar feed secret
+
+Revision ID: f2d8b5c1a7e3
+Revises: 9d3e6f17ab42
+Create Date: 2026-10-19 09:40:12.804417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2d8b5c1a7e3'
+down_revision = '9d3e6f17ab42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Left NULL: a secret is created the next time the user asks for their
+    # feed URL, and feed URLs issued before this revision stop working
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('calendar_feed_secret', sa.String(length=64), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.drop_column('calendar_feed_secret')
@@ -0,0 +1,382 @@
+#!/usr/bin/env python
+# Seed the database with deterministic synthetic data (drops existing tables).
+# seed_database() is also what init_db.py, /api/dev/reset-db and the
+# benchmarks use.
+#
+# Usage: python seed.py [--seed 42] [--rows 1000000] [--users 200] [--messages N]
+#                       [--work-items N] [--meetings N] [--gaze-samples N] [--files N]
+#                       [--days 30] [--anchor 2026-01-05|today]
+#
+# --rows sets messages, work items and gaze samples together. The same seed
+# and anchor always produce the same data; the anchor defaults to SEED_ANCHOR
+# rather than today, so runs on different days match too. Every password is
+# "password123".
+
+import argparse
+import base64
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Any, Callable, Dict, List, Optional
+
+from app import (
+    app, db, User, Message, WorkItem, WorkItemTag, Meeting, MeetingAttendee, EyeGazeData, EyeGazeSession,
+    FileAttachment, ChartData, MEETING_ROOMS, SERIES_OPEN_END
+)
+
+SEED_PASSWORD = 'password123'
+# bcrypt hash of SEED_PASSWORD, so seeding never pays for hashing per user
+SEED_PASSWORD_HASH = '$2b$12$m.o1O9hiAB9LGs6K3NLk6.kbPJBAXnkQK9062B9rIPG4gTpBOcZlW'
+SEED_CHUNK_SIZE = 10000
+# Fixed default date the data is relative to, so a seed always gives the same rows
+SEED_ANCHOR = datetime(2025, 1, 1)
+
+SEED_FIRST_NAMES = ['Alex', 'Sam', 'Priya', 'Jordan', 'Mei', 'Omar', 'Lena', 'Diego', 'Aisha', 'Tom',
+                    'Yuki', 'Noah', 'Fatima', 'Ivan', 'Chloe', 'Ravi', 'Sara', 'Ben', 'Zoe', 'Kofi']
+SEED_LAST_NAMES = ['Smith', 'Patel', 'Garcia', 'Chen', 'Okafor', 'Müller', 'Rossi', 'Kim', 'Nguyen', 'Silva']
+SEED_MESSAGES = {
+    'positive': ['Great work on the {tag} release, thanks everyone!', 'The {tag} fix is done and looks good.',
+                 'Really happy with the progress on {tag}.', 'Thanks for the helpful review of {tag}!',
+                 'Excellent demo today, the {tag} changes are impressive.'],
+    'neutral': ['Can someone review the {tag} PR?', 'Moving the {tag} sync to Thursday.',
+                'Updated the {tag} ticket with notes from the call.', 'Who owns the {tag} follow-up?',
+                'Pushed the {tag} branch for testing.', 'Reminder: {tag} planning at 2pm.'],
+    'negative': ['The {tag} build is broken again.', 'Hit a bug in {tag}, this is frustrating.',
+                 'We missed the {tag} deadline, the delay is a problem.', '{tag} tests fail on main.',
+                 'Slow responses from {tag} are causing issues.']
+}
+SEED_SENTIMENT_WEIGHTS = {'positive': 35, 'neutral': 45, 'negative': 20}
+SEED_MESSAGE_TAGS = ['frontend', 'backend', 'bug', 'release', 'design', 'api', 'database', 'infra',
+                     'docs', 'testing', 'security', 'mobile', 'analytics', 'onboarding', 'billing']
+SEED_MESSAGE_PRIORITIES = {'normal': 80, 'important': 10, 'urgent': 5, 'low': 5}
+SEED_WORK_ITEM_TITLES = ['Fix {tag} regression', 'Implement {tag} endpoint', 'Review {tag} design',
+                         'Write {tag} docs', 'Investigate {tag} latency', 'Refactor {tag} module']
+SEED_WORK_ITEM_STATUSES = {'todo': 30, 'in-progress': 25, 'review': 15, 'done': 30}
+SEED_WORK_ITEM_PRIORITIES = {'low': 30, 'medium': 50, 'high': 20}
+SEED_MEETING_TITLES = ['Design review', '1:1', 'Sprint retro', 'Customer call', 'Roadmap sync',
+                       'Incident review', 'Hiring panel', 'Architecture deep dive']
+
+# Cumulative weights are built once per distribution; choices() would redo it on every call
+_seed_cumulative: Dict[int, Any] = {}
+
+def seed_weighted(rng: random.Random, weights: Dict[str, int]) -> Any:
+    cached = _seed_cumulative.get(id(weights))
+    if cached is None:
+        cached = _seed_cumulative[id(weights)] = (list(weights), list(accumulate(weights.values())))
+    values, cumulative = cached
+    return rng.choices(values, cum_weights=cumulative)[0]
+
+SEED_TAG_COUNTS = {0: 40, 1: 35, 2: 20, 3: 5}
+SEED_TAG_RANKS = list(accumulate(1 / rank for rank in range(1, len(SEED_MESSAGE_TAGS) + 1)))
+
+def seed_tags(rng: random.Random) -> List[str]:
+    # Zipf-like popularity: a few tags dominate, most are rare
+    count = seed_weighted(rng, SEED_TAG_COUNTS)
+    return list(dict.fromkeys(rng.choices(SEED_MESSAGE_TAGS, cum_weights=SEED_TAG_RANKS, k=count)))
+
+def seed_time(rng: random.Random, anchor: datetime, days: int) -> datetime:
+    # Mostly office hours on weekdays
+    day = anchor - timedelta(days=rng.randrange(days))
+    while day.weekday() >= 5 and rng.random() < 0.9:
+        day -= timedelta(days=1)
+    return day + timedelta(hours=min(max(rng.gauss(13, 2.5), 7), 20), seconds=rng.randrange(3600))
+
+def bulk_insert_rows(table: Any, rows: Any, chunk_size: int = SEED_CHUNK_SIZE,
+                     after_chunk: Optional[Callable[[], None]] = None) -> int:
+    """
+    Insert an iterable of row dicts through the DBAPI's executemany, in chunks.
+
+    Skips SQLAlchemy's per-row parameter handling, which dominates at
+    millions of rows; values still pass through each column type's bind
+    processor, so stored formats (e.g. SQLite datetimes) match ORM writes.
+    Every row must have the same keys, including columns with defaults.
+    `after_chunk` runs once each chunk has been executed, e.g. to insert
+    child rows that reference it.
+
+    Returns:
+        The number of rows inserted.
+    """
+    connection = db.session.connection()
+    written = 0
+    chunk: List[Any] = []
+    statement = None
+    for row in rows:
+        if statement is None:
+            compiled = table.insert().compile(dialect=connection.dialect, column_keys=list(row))
+            statement = compiled.string
+            keys = compiled.positiontup if compiled.positional else list(row)
+            dialect = connection.dialect
+            processors = [(key, table.c[key].type.dialect_impl(dialect).bind_processor(dialect)) for key in keys]
+        values = [processor(row[key]) if processor else row[key] for key, processor in processors]
+        chunk.append(tuple(values) if compiled.positional else dict(zip(keys, values)))
+        if len(chunk) == chunk_size:
+            connection.exec_driver_sql(statement, chunk)
+            written += len(chunk)
+            chunk = []
+            if after_chunk is not None:
+                after_chunk()
+    if chunk:
+        connection.exec_driver_sql(statement, chunk)
+        written += len(chunk)
+    if after_chunk is not None:
+        after_chunk()
+    return written
+
+def seed_database(seed: int = 42, users: int = 10, messages: int = 200, work_items: int = 50,
+                  meetings: int = 40, gaze_samples: int = 5000, files: int = 10, days: int = 30,
+                  anchor: Optional[datetime] = None) -> Dict[str, int]:
+    """
+    Drop and recreate all tables, then fill them with synthetic data.
+
+    Output depends only on `seed` and `anchor` (default: SEED_ANCHOR),
+    which dates are relative to. Rows are generated in chunks and
+    written with bulk Core inserts in one transaction, so large datasets
+    need neither an ORM object nor a bcrypt hash per row. The first two
+    users are the demo accounts test@example.com and user2@example.com;
+    every password is SEED_PASSWORD.
+
+    Returns:
+        The number of rows written per table.
+    """
+    rng = random.Random(seed)
+    anchor = anchor or SEED_ANCHOR
+    counts: Dict[str, int] = {}
+
+    def insert(model: Any, rows: Any, after_chunk: Optional[Callable[[], None]] = None) -> None:
+        table = model.__table__
+        counts[table.name] = counts.get(table.name, 0) + bulk_insert_rows(table, rows, after_chunk=after_chunk)
+
+    db.drop_all()
+    db.create_all()
+
+    # Users
+    people = [('Test User', 'test@example.com'), ('Another User', 'user2@example.com')]
+    for i in range(max(users - 2, 0)):
+        first, last = rng.choice(SEED_FIRST_NAMES), rng.choice(SEED_LAST_NAMES)
+        people.append((f'{first} {last}', f'{first}.{last}{i}@example.com'.lower()))
+    people = people[:max(users, 2)]
+    user_ids = [str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in people]
+    names = dict(zip(user_ids, (name for name, _ in people)))
+    insert(User, ({
+        'id': user_id, 'name': name, 'email': email, 'password_hash': SEED_PASSWORD_HASH,
+        'is_online': i == 0, 'avatar': None
+    } for i, (user_id, (name, email)) in enumerate(zip(user_ids, people))))
+
+    # Messages, ordered by time so IDs follow timestamps like real traffic
+    def message_rows() -> Any:
+        stamps = sorted(seed_time(rng, anchor, days) for _ in range(messages))
+        for message_id, timestamp in enumerate(stamps, start=1):
+            sentiment = seed_weighted(rng, SEED_SENTIMENT_WEIGHTS)
+            tags = seed_tags(rng)
+            sender = rng.choice(user_ids)
+            content = rng.choice(SEED_MESSAGES[sentiment]).format(tag=tags[0] if tags else 'project')
+            mentions = []
+            if len(user_ids) > 1 and rng.random() < 0.15:
+                wanted = 1 if rng.random() < 0.8 else 2
+                picked = rng.sample(user_ids, k=min(wanted + 1, len(user_ids)))
+                mentions = [user_id for user_id in picked if user_id != sender][:wanted]
+                content = ' '.join(f'@{names[user_id]}' for user_id in mentions) + ' ' + content
+            private = rng.random() < 0.08
+            readers = rng.sample(user_ids, k=rng.randrange(min(5, len(user_ids))))
+            yield {
+                'id': message_id,
+                'sender_id': sender,
+                'recipient_id': rng.choice(user_ids) if private else None,
+                'content': content,
+                'timestamp': timestamp,
+                'is_private': private,
+                'priority': seed_weighted(rng, SEED_MESSAGE_PRIORITIES),
+                'tags': json.dumps(tags),
+                'mentions': json.dumps(mentions),
+                'search_keywords': '[]',
+                'read_by': json.dumps(list(dict.fromkeys([sender] + readers))),
+                'sentiment': sentiment
+            }
+    insert(Message, message_rows())
+
+    # Work items and their tag index rows
+    work_item_tags: List[Dict[str, Any]] = []
+    def work_item_rows() -> Any:
+        for work_item_id in range(1, work_items + 1):
+            tags = seed_tags(rng) or ['backlog']
+            created_at = seed_time(rng, anchor, days * 3)
+            work_item_tags.extend({'work_item_id': work_item_id, 'tag': tag} for tag in tags)
+            yield {
+                'id': work_item_id,
+                'title': rng.choice(SEED_WORK_ITEM_TITLES).format(tag=tags[0]),
+                'description': f'Synthetic work item {work_item_id}',
+                'status': seed_weighted(rng, SEED_WORK_ITEM_STATUSES),
+                'priority': seed_weighted(rng, SEED_WORK_ITEM_PRIORITIES),
+                'assigned_to': rng.choice(user_ids) if rng.random() < 0.85 else None,
+                'created_by': rng.choice(user_ids),
+                'due_date': anchor + timedelta(days=rng.randint(-10, 30)) if rng.random() < 0.7 else None,
+                'tags': json.dumps(tags),
+                'created_at': created_at,
+                'updated_at': created_at + timedelta(hours=rng.randrange(0, 24 * 7))
+            }
+    # Tags are written after each chunk of work items they refer to, so a
+    # million work items' tags never pile up and foreign keys always resolve
+    def insert_work_item_tags() -> None:
+        insert(WorkItemTag, work_item_tags)
+        work_item_tags.clear()
+    insert(WorkItem, work_item_rows(), after_chunk=insert_work_item_tags)
+
+    # Meetings: the demo standup series and planning session, then one-offs
+    # around the anchor in 15 minute steps
+    attendee_rows: List[Dict[str, Any]] = []
+    def meeting_rows() -> Any:
+        demo = [
+            ('Team Standup', anchor + timedelta(hours=9), 30, 'Room A', 'FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR',
+             'Daily standup meeting to discuss progress and blockers.'),
+            ('Sprint Planning', anchor + timedelta(days=1, hours=14), 120, 'Room C', None,
+             'Planning for the next sprint cycle.')
+        ]
+        for meeting_id in range(1, meetings + 1):
+            if meeting_id <= len(demo):
+                title, starts_at, minutes, room, recurrence, notes = demo[meeting_id - 1]
+                organizer, attendees = user_ids[0], user_ids[:2]
+            else:
+                title, recurrence, notes = rng.choice(SEED_MEETING_TITLES), None, ''
+                starts_at = anchor + timedelta(days=rng.randint(-days // 2, days // 2),
+                                               minutes=rng.randrange(8 * 60, 17 * 60, 15))
+                minutes = rng.choice([15, 30, 30, 60, 60, 90])
+                room = rng.choice(MEETING_ROOMS)['name']
+                organizer = rng.choice(user_ids)
+                attendees = rng.sample(user_ids, k=min(rng.randint(1, 5), len(user_ids)))
+            attendee_rows.extend({'meeting_id': meeting_id, 'attendee': attendee} for attendee in attendees)
+            yield {
+                'id': meeting_id,
+                'title': title,
+                'starts_at': starts_at,
+                'ends_at': starts_at + timedelta(minutes=minutes),
+                'room': room,
+                'organizer_id': organizer,
+                'attendees': json.dumps(attendees),
+                'notes': notes,
+                'created_at': anchor - timedelta(days=days),
+                'recurrence': recurrence,
+                'recurrence_ends_at': SERIES_OPEN_END if recurrence else None
+            }
+    def insert_attendees() -> None:
+        insert(MeetingAttendee, attendee_rows)
+        attendee_rows.clear()
+    insert(Meeting, meeting_rows(), after_chunk=insert_attendees)
+
+    # Eye gaze: per-user sessions sampled once a second, where attention
+    # persists (a Markov chain) and confidence drops while looking away
+    sessions: List[Dict[str, Any]] = []
+    def gaze_rows() -> Any:
+        remaining = gaze_samples
+        while remaining > 0:
+            user_id = rng.choice(user_ids)
+            length = min(remaining, rng.randint(300, 1800))
+            started_at = seed_time(rng, anchor, days)
+            session = {
+                'user_id': user_id,
+                'session_id': f'session-{uuid.UUID(int=rng.getrandbits(128), version=4).hex[:12]}',
+                'started_at': started_at,
+                'ended_at': started_at + timedelta(seconds=length - 1),
+                'sample_count': length,
+                'looking_count': 0,
+                'confidence_total': 0.0
+            }
+            looking = True
+            for second in range(length):
+                looking = rng.random() < (0.97 if looking else 0.15)
+                confidence = round(min(max(rng.gauss(0.85 if looking else 0.6, 0.08), 0.0), 1.0), 2)
+                session['looking_count'] += looking
+                session['confidence_total'] += confidence
+                yield {
+                    'user_id': user_id,
+                    'is_looking_at_screen': looking,
+                    'confidence': confidence,
+                    'timestamp': started_at + timedelta(seconds=second),
+                    'session_id': session['session_id']
+                }
+            sessions.append(session)
+            remaining -= length
+    insert(EyeGazeData, gaze_rows())
+    insert(EyeGazeSession, sessions)
+
+    # Small text attachments on recent messages and work items
+    def file_rows() -> Any:
+        for file_id in range(1, files + 1):
+            body = f'Synthetic attachment {file_id}\n'.encode()
+            on_message = bool(messages) and (not work_items or file_id % 2 == 1)
+            yield {
+                'id': file_id,
+                'filename': f'notes-{file_id}.txt',
+                'file_type': 'text/plain',
+                'file_size': len(body),
+                'data': 'data:text/plain;base64,' + base64.b64encode(body).decode(),
+                'message_id': rng.randint(1, messages) if on_message else None,
+                'work_item_id': None if on_message or not work_items else rng.randint(1, work_items),
+                'uploader_id': rng.choice(user_ids),
+                'uploaded_at': anchor - timedelta(days=rng.randrange(days))
+            }
+    insert(FileAttachment, file_rows())
+
+    insert(ChartData, [{
+        'chart_type': 'bar',
+        'title': 'Sample Task Status',
+        'data': json.dumps([
+            {'name': 'Todo', 'value': 5},
+            {'name': 'In Progress', 'value': 3},
+            {'name': 'Review', 'value': 2},
+            {'name': 'Done', 'value': 7}
+        ]),
+        'created_at': anchor,
+        'updated_at': anchor
+    }])
+
+    # Core inserts bypass the ORM events, and every table was recreated,
+    # so mark everything changed for the caches
+    tables = set(db.metadata.tables)
+    db.session.info.setdefault('changed_tables', set()).update(tables)
+    db.session.info.setdefault('mutated_tables', set()).update(tables)
+    db.session.info['meeting_days'] = None
+    db.session.info['feed_changes'] = None
+    db.session.commit()
+    return counts
+
+def parse_anchor(value: str) -> datetime:
+    if value == 'today':
+        return datetime.combine(datetime.utcnow().date(), datetime.min.time())
+    return datetime.fromisoformat(value)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Seed the database with synthetic data')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--rows', type=int, help='messages, work items and gaze samples each')
+    parser.add_argument('--users', type=int, default=10)
+    parser.add_argument('--messages', type=int, default=200)
+    parser.add_argument('--work-items', type=int, default=50)
+    parser.add_argument('--meetings', type=int, default=40)
+    parser.add_argument('--gaze-samples', type=int, default=5000)
+    parser.add_argument('--files', type=int, default=10)
+    parser.add_argument('--days', type=int, default=30, help='how far back timestamps spread')
+    parser.add_argument('--anchor', type=parse_anchor,
+                        help=f'date the data is relative to, or "today" (default: {SEED_ANCHOR.date()})')
+    args = parser.parse_args()
+
+    if args.rows is not None:
+        args.messages = args.work_items = args.gaze_samples = args.rows
+
+    start = time.perf_counter()
+    with app.app_context():
+        counts = seed_database(
+            seed=args.seed, users=args.users, messages=args.messages, work_items=args.work_items,
+            meetings=args.meetings, gaze_samples=args.gaze_samples, files=args.files, days=args.days,
+            anchor=args.anchor
+        )
+    elapsed = time.perf_counter() - start
+
+    for table, count in counts.items():
+        print(f"{table:<20}{count:>10}")
+    print(f"Seeded {sum(counts.values())} rows in {elapsed:.1f} s")
+
+if __name__ == '__main__':
+    main()
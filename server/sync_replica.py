@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# Copy the primary SQLite database to read replica files, for trying out
+# DATABASE_REPLICA_URLS locally. Uses SQLite's online backup API, so the app
+# can keep writing to the primary while a copy is taken. Production
+# databases should rely on their own replication instead.
+#
+# Usage: python sync_replica.py REPLICA.db [REPLICA.db ...] [--interval 5]
+#
+# The primary is DATABASE_URL (default: app.db next to app.py). --interval
+# repeats the copy every N seconds, which simulates replication lag.
+
+import argparse
+import os
+import sqlite3
+import time
+
+def primary_path() -> str:
+    url = os.environ.get('DATABASE_URL', 'sqlite:///' + os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.db'))
+    if not url.startswith('sqlite:///'):
+        raise SystemExit(f'DATABASE_URL is not a SQLite file: {url}')
+    return url[len('sqlite:///'):]
+
+def copy_database(source: str, target: str) -> None:
+    src = sqlite3.connect(source)
+    dst = sqlite3.connect(target)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Copy the primary SQLite database to replica files')
+    parser.add_argument('replicas', nargs='+', help='replica database files')
+    parser.add_argument('--interval', type=float, help='repeat every N seconds until interrupted')
+    args = parser.parse_args()
+
+    source = primary_path()
+    while True:
+        start = time.perf_counter()
+        for replica in args.replicas:
+            copy_database(source, replica)
+        print(f"Copied {source} to {len(args.replicas)} replica(s) in {time.perf_counter() - start:.2f}s")
+        if args.interval is None:
+            break
+        try:
+            time.sleep(args.interval)
+        except KeyboardInterrupt:
+            break
+
+if __name__ == '__main__':
+    main()
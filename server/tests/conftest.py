@@ -0,0 +1,49 @@
+import os
+import sys
+import tempfile
+
+# app.py reads its configuration at import time; point it at a throwaway database
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'test.db')
+os.environ.setdefault('SECRET_KEY', 'test-secret')
+os.environ.setdefault('GEMINI_API_KEY', 'test')
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from datetime import datetime, timedelta
+
+import jwt
+import pytest
+
+from app import app, db, User
+
+@pytest.fixture
+def database() -> None:
+    """Empty tables, inside an application context."""
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        yield
+        db.session.remove()
+
+@pytest.fixture
+def users(database: None) -> list:
+    """IDs of two users, alice and bob."""
+    db.session.add_all([
+        User(id='alice', name='Alice', email='alice@example.com', password_hash='x'),
+        User(id='bob', name='Bob', email='bob@example.com', password_hash='x')
+    ])
+    db.session.commit()
+    return ['alice', 'bob']
+
+@pytest.fixture
+def client(database: None) -> object:
+    return app.test_client()
+
+@pytest.fixture
+def auth() -> object:
+    """Build the Authorization header for a user ID."""
+    def headers(user_id: str) -> dict:
+        token = jwt.encode({'user_id': user_id, 'exp': datetime.utcnow() + timedelta(hours=1)},
+                           app.config['SECRET_KEY'], algorithm='HS256')
+        return {'Authorization': f'Bearer {token}'}
+    return headers
@@ -0,0 +1,70 @@
+import pytest
+
+from app import db, WorkItem, WorkItemTag
+
+@pytest.fixture
+def items(users) -> list:
+    """IDs of three items alice may edit (creator or assignee) and one she may not."""
+    rows = [
+        WorkItem(title='Mine', created_by='alice'),
+        WorkItem(title='Mine too', created_by='alice', tags='["old"]'),
+        WorkItem(title='Assigned to me', created_by='bob', assigned_to='alice'),
+        WorkItem(title='Not mine', created_by='bob')
+    ]
+    db.session.add_all(rows)
+    db.session.commit()
+    return [row.id for row in rows]
+
+def bulk(client, headers: dict, patches: list, atomic: bool = False) -> object:
+    return client.post('/api/work-items/bulk', headers=headers, json={'patches': patches, 'atomic': atomic})
+
+def statuses() -> dict:
+    db.session.expire_all()
+    return {item.id: item.status for item in WorkItem.query}
+
+def test_partial_failure_applies_only_valid_patches(client, items, auth) -> None:
+    mine, mine_too, assigned, not_mine = items
+    response = bulk(client, auth('alice'), [
+        {'id': mine, 'status': 'done'},
+        {'id': not_mine, 'status': 'done'},
+        {'id': 999, 'status': 'done'},
+        {'id': mine_too, 'status': ['done']},
+        {'id': assigned, 'assignedTo': 'nobody'}
+    ])
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['updated'] == 1
+    assert [(result['id'], result['status']) for result in body['results']] == [
+        (mine, 'updated'), (not_mine, 'forbidden'), (999, 'not_found'), (mine_too, 'invalid'), (assigned, 'invalid')
+    ]
+    assert statuses() == {mine: 'done', mine_too: 'todo', assigned: 'todo', not_mine: 'todo'}
+
+def test_atomic_conflict_writes_nothing(client, items, auth) -> None:
+    mine, mine_too, assigned, not_mine = items
+    response = bulk(client, auth('alice'), [{'id': mine, 'status': 'done'}, {'id': not_mine, 'status': 'done'}],
+                    atomic=True)
+    assert response.status_code == 409
+    assert [result['status'] for result in response.get_json()['results']] == ['skipped', 'forbidden']
+    assert set(statuses().values()) == {'todo'}
+
+def test_identical_changes_and_tags_are_applied_to_each_item(client, items, auth) -> None:
+    mine, mine_too, assigned, not_mine = items
+    response = bulk(client, auth('alice'), [
+        {'id': item_id, 'priority': 'high', 'tags': ['x', 'y']} for item_id in (mine, mine_too, assigned)
+    ])
+    assert response.get_json()['updated'] == 3
+    db.session.expire_all()
+    assert {item.id: item.priority for item in WorkItem.query} == {
+        mine: 'high', mine_too: 'high', assigned: 'high', not_mine: 'medium'
+    }
+    tags = sorted((row.work_item_id, row.tag) for row in WorkItemTag.query)
+    assert tags == sorted((item_id, tag) for item_id in (mine, mine_too, assigned) for tag in ('x', 'y'))
+
+@pytest.mark.parametrize('patches', [
+    [{'status': 'done'}],
+    [{'id': '1', 'status': 'done'}],
+    [{'id': 1, 'status': 'done'}, {'id': 1, 'priority': 'low'}]
+])
+def test_malformed_requests_are_rejected(client, items, auth, patches: list) -> None:
+    assert bulk(client, auth('alice'), patches).status_code == 400
+    assert set(statuses().values()) == {'todo'}
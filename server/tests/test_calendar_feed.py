@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import event
+
+from app import db, User, calendar_feeds
+
+@pytest.fixture
+def feed_path(client, users, auth) -> str:
+    """Path of alice's calendar feed, with nothing cached yet."""
+    calendar_feeds.invalidate()
+    url = client.get('/api/meetings/feed-url', headers=auth('alice')).get_json()['url']
+    return url[url.index('/api/calendar/'):]
+
+def poll(client, path: str) -> tuple:
+    """Status of one feed request and the SQL it sent."""
+    statements = []
+    def record(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+    db.session.remove()
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        status = client.get(path).status_code
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+    return status, statements
+
+def test_cached_feed_is_served_without_queries(client, feed_path) -> None:
+    status, statements = poll(client, feed_path)
+    assert status == 200 and statements
+    assert poll(client, feed_path) == (200, [])
+
+def test_rotation_revokes_the_old_url(client, feed_path, auth) -> None:
+    assert poll(client, feed_path)[0] == 200
+    url = client.post('/api/meetings/feed-url/rotate', headers=auth('alice')).get_json()['url']
+    assert poll(client, feed_path)[0] == 401
+    assert poll(client, url[url.index('/api/calendar/'):])[0] == 200
+
+def test_feed_cached_for_a_rotated_secret_is_rebuilt(client, feed_path, auth) -> None:
+    assert poll(client, feed_path)[0] == 200
+    # Rotate the way another process would, leaving this process's cache alone
+    with db.engine.begin() as connection:
+        connection.execute(User.__table__.update().where(User.id == 'alice').values(calendar_feed_secret='rotated'))
+    url = client.get('/api/meetings/feed-url', headers=auth('alice')).get_json()['url']
+    assert poll(client, url[url.index('/api/calendar/'):])[0] == 200
+    assert poll(client, feed_path)[0] == 401
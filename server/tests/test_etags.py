@@ -0,0 +1,39 @@
+import threading
+
+from app import app, db, WorkItem, table_versions
+
+def get(client, path: str, headers: dict) -> object:
+    # Read the body so a streamed response releases its request context
+    response = client.get(path, headers=headers)
+    response.get_data()
+    return response
+
+def test_write_changes_etag_and_unchanged_list_is_not_modified(client, users, auth) -> None:
+    headers = auth('alice')
+    etag = get(client, '/api/work-items', headers).headers['ETag']
+    assert get(client, '/api/work-items', {**headers, 'If-None-Match': etag}).status_code == 304
+
+    assert client.post('/api/work-items', json={'title': 'New'}, headers=headers).status_code == 201
+    response = get(client, '/api/work-items', {**headers, 'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+def test_write_unseen_by_this_process_still_changes_etag(client, users, auth) -> None:
+    headers = auth('alice')
+    etag = get(client, '/api/work-items', headers).headers['ETag']
+
+    # Another worker's write: committed elsewhere, this process's counters untouched
+    before = dict(table_versions)
+    def other_worker() -> None:
+        with app.app_context():
+            db.session.add(WorkItem(title='From another worker', created_by='bob'))
+            db.session.commit()
+    thread = threading.Thread(target=other_worker)
+    thread.start()
+    thread.join()
+    table_versions.clear()
+    table_versions.update(before)
+
+    response = get(client, '/api/work-items', {**headers, 'If-None-Match': etag})
+    assert response.status_code == 200
+    assert [item['title'] for item in response.get_json()] == ['From another worker']
@@ -0,0 +1,92 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+import app as appmod
+from app import app, db, Message
+
+@pytest.fixture
+def messages(users) -> None:
+    """Five messages; alice can read all but bob's private note to himself."""
+    db.session.add_all([
+        Message(sender_id='bob', content='hello', tags='["intro"]', timestamp=datetime(2026, 1, 1, 9)),
+        Message(sender_id='alice', recipient_id='bob', content='private, to bob', is_private=True,
+                timestamp=datetime(2026, 1, 2, 9)),
+        Message(sender_id='bob', recipient_id='bob', content='private, bob only', is_private=True,
+                timestamp=datetime(2026, 1, 2, 10)),
+        Message(sender_id='bob', content='with "quotes", and commas\nand a newline', timestamp=datetime(2026, 1, 3, 9)),
+        Message(sender_id='alice', content='last', timestamp=datetime(2026, 1, 4, 23, 59))
+    ])
+    db.session.commit()
+
+def export(client, headers: dict, dataset: str = 'messages', **params) -> tuple:
+    response = client.get(f'/api/export/{dataset}', headers=headers, query_string=params)
+    return response, response.get_data(as_text=True)
+
+def test_ndjson_is_one_object_per_line(client, messages, auth) -> None:
+    response, body = export(client, auth('alice'))
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    assert body.endswith('\n')
+    records = [json.loads(line) for line in body.splitlines()]
+    assert [record['content'] for record in records] == [
+        'hello', 'private, to bob', 'with "quotes", and commas\nand a newline', 'last'
+    ]
+    assert records[0]['tags'] == ['intro']
+
+def test_ndjson_framing_holds_across_batches(client, messages, auth, monkeypatch) -> None:
+    monkeypatch.setattr(appmod, 'EXPORT_BATCH_SIZE', 2)
+    _, body = export(client, auth('bob'))
+    assert [json.loads(line)['id'] for line in body.splitlines()] == [1, 2, 3, 4, 5]
+
+def test_csv_has_one_header_row(client, messages, auth, monkeypatch) -> None:
+    monkeypatch.setattr(appmod, 'EXPORT_BATCH_SIZE', 2)
+    response, body = export(client, auth('alice'), format='csv')
+    assert response.mimetype == 'text/csv'
+    rows = list(csv.reader(io.StringIO(body)))
+    assert rows[0] == list(appmod.EXPORTS['messages'].columns)
+    assert [row[3] for row in rows[1:]] == ['hello', 'private, to bob', 'with "quotes", and commas\nand a newline', 'last']
+    assert rows[1][4] == '2026-01-01T09:00:00'
+
+def test_csv_with_no_rows_is_just_the_header(client, messages, auth) -> None:
+    _, body = export(client, auth('alice'), format='csv', user='nobody')
+    assert list(csv.reader(io.StringIO(body))) == [list(appmod.EXPORTS['messages'].columns)]
+
+def test_filters(client, messages, auth) -> None:
+    _, body = export(client, auth('alice'), **{'from': '2026-01-02', 'to': '2026-01-04', 'user': 'alice'})
+    assert [json.loads(line)['content'] for line in body.splitlines()] == ['private, to bob', 'last']
+
+@pytest.mark.parametrize('path, params, status', [
+    ('/api/export/nope', {}, 404),
+    ('/api/export/messages', {'format': 'xml'}, 400),
+    ('/api/export/messages', {'from': 'yesterday'}, 400),
+    ('/api/export/messages', {'sessionId': 'abc'}, 400)
+])
+def test_bad_requests_fail_before_streaming(client, users, auth, path: str, params: dict, status: int) -> None:
+    assert client.get(path, headers=auth('alice'), query_string=params).status_code == status
+
+def test_error_mid_stream_is_logged_and_raised(client, messages, auth, monkeypatch) -> None:
+    logged = []
+    monkeypatch.setattr(appmod, 'EXPORT_BATCH_SIZE', 2)
+    monkeypatch.setattr(app.logger, 'exception', logged.append)
+    calls = []
+
+    def fail_on_second_batch(value):
+        # Two JSON columns for each of the two rows in the first batch
+        calls.append(value)
+        if len(calls) > 4:
+            raise RuntimeError('column decode failed')
+        return []
+
+    monkeypatch.setattr(appmod, 'json_column_to_list', fail_on_second_batch)
+    response = client.get('/api/export/messages', headers=auth('alice'))
+    assert response.status_code == 200
+    chunks = response.response
+    assert [json.loads(line)['id'] for line in next(chunks).splitlines()] == [1, 2]
+    with pytest.raises(RuntimeError, match='column decode failed'):
+        for _ in chunks:
+            pass
+    assert logged == ['Error exporting messages: column decode failed']
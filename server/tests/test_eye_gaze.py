@@ -0,0 +1,32 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from app import app, db, EyeGazeData, EyeGazeSession
+
+def test_samples_roll_up_into_their_session(client, users, auth) -> None:
+    headers = auth('alice')
+    for looking, confidence in [(True, 0.9), (False, 0.5), (True, 0.7)]:
+        response = client.post('/api/eye-gaze', headers=headers,
+                               json={'isLookingAtScreen': looking, 'confidence': confidence, 'sessionId': 's1'})
+        assert response.status_code == 201
+
+    session = EyeGazeSession.query.filter_by(user_id='alice', session_id='s1').one()
+    assert (session.sample_count, session.looking_count) == (3, 2)
+    assert round(session.confidence_total, 6) == 2.1
+    timestamps = [sample.timestamp for sample in EyeGazeData.query.order_by(EyeGazeData.id)]
+    assert (session.started_at, session.ended_at) == (timestamps[0], timestamps[-1])
+
+def test_concurrent_first_samples_create_one_session(client, users, auth) -> None:
+    headers = auth('alice')
+    db.session.remove()
+
+    def post(i: int) -> int:
+        with app.test_client() as thread_client:
+            return thread_client.post('/api/eye-gaze', headers=headers,
+                                      json={'isLookingAtScreen': True, 'confidence': 0.8, 'sessionId': 'race'}).status_code
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        statuses = list(pool.map(post, range(32)))
+
+    assert statuses == [201] * 32
+    session = EyeGazeSession.query.filter_by(user_id='alice', session_id='race').one()
+    assert session.sample_count == EyeGazeData.query.filter_by(session_id='race').count() == 32
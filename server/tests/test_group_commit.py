@@ -0,0 +1,86 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+
+import app as appmod
+from app import app, db, User, WorkItem, GroupCommitWriter
+
+@pytest.fixture
+def writer(users) -> GroupCommitWriter:
+    """A writer whose window is long enough that each test's writes land in one batch."""
+    writer = GroupCommitWriter(window=0.5, max_rows=4)
+    yield writer
+    writer.stop()
+
+@pytest.fixture
+def commits(database) -> list:
+    """Appended to on every COMMIT the engine sends."""
+    seen = []
+    listener = lambda connection: seen.append(connection)
+    event.listen(db.engine, 'commit', listener)
+    yield seen
+    event.remove(db.engine, 'commit', listener)
+
+def add_item(title: str):
+    def write() -> str:
+        db.session.add(WorkItem(title=title, created_by='alice'))
+        db.session.flush()
+        return title
+    return write
+
+def add_user(user_id: str):
+    def write() -> str:
+        db.session.add(User(id=user_id, name=user_id, email=f'{user_id}@example.com', password_hash='x'))
+        db.session.flush()
+        return user_id
+    return write
+
+def titles() -> list:
+    db.session.expire_all()
+    return sorted(item.title for item in WorkItem.query)
+
+def test_full_batch_commits_once(writer, commits) -> None:
+    futures = [writer.submit(add_item(f'item {n}')) for n in range(4)]
+    assert [future.result(timeout=5) for future in futures] == [f'item {n}' for n in range(4)]
+    assert len(commits) == 1
+    assert titles() == [f'item {n}' for n in range(4)]
+
+def test_failed_write_only_fails_its_own_caller(writer, commits) -> None:
+    futures = [writer.submit(write) for write in (add_item('first'), add_user('alice'), add_item('second'))]
+    assert futures[0].result(timeout=5) == 'first'
+    with pytest.raises(IntegrityError):
+        futures[1].result(timeout=5)
+    assert futures[2].result(timeout=5) == 'second'
+    assert titles() == ['first', 'second']
+
+def test_every_failing_caller_gets_its_own_error(writer) -> None:
+    def fail(n: int):
+        def write() -> None:
+            raise ValueError(f'write {n}')
+        return write
+
+    futures = [writer.submit(fail(n)) for n in range(4)]
+    for n, future in enumerate(futures):
+        with pytest.raises(ValueError, match=f'^write {n}$'):
+            future.result(timeout=5)
+
+def test_commit_write_batches_concurrent_requests(users, commits, monkeypatch) -> None:
+    monkeypatch.setitem(app.config, 'GROUP_COMMIT', True)
+    monkeypatch.setitem(app.config, 'GROUP_COMMIT_WINDOW_MS', 2000)
+    monkeypatch.setitem(app.config, 'GROUP_COMMIT_MAX_ROWS', 8)
+    monkeypatch.setattr(appmod, 'group_writer', None)
+
+    def request(n: int) -> str:
+        with app.app_context():
+            return appmod.commit_write(add_item(f'item {n}'))
+
+    try:
+        with ThreadPoolExecutor(8) as pool:
+            assert sorted(pool.map(request, range(8))) == sorted(f'item {n}' for n in range(8))
+    finally:
+        appmod.group_writer.stop()
+    # The callers' own sessions only roll back; the writes share one commit
+    assert len(commits) == 1
+    assert len(titles()) == 8
@@ -0,0 +1,62 @@
+import pytest
+
+from app import Meeting
+
+DAY = '2026-01-05'
+
+def book(client, headers: dict, start: str, end: str, room: str = 'Atlas', date: str = DAY, **fields) -> object:
+    return client.post('/api/meetings', headers=headers, json={
+        'title': 'Sync', 'date': date, 'startTime': start, 'endTime': end, 'room': room, **fields
+    })
+
+def check(client, headers: dict, start: str, end: str, date: str = DAY, **params) -> list:
+    response = client.get('/api/meetings/conflicts', headers=headers, query_string={
+        'date': date, 'startTime': start, 'endTime': end, **params
+    })
+    assert response.status_code == 200
+    return response.get_json()['conflicts']
+
+@pytest.fixture
+def standup(client, users, auth) -> dict:
+    """Alice's 10:00-11:00 meeting in Atlas with carol attending."""
+    response = book(client, auth('alice'), '10:00', '11:00', attendees=['carol'])
+    assert response.status_code == 201
+    return response.get_json()
+
+@pytest.mark.parametrize('start, end', [('09:00', '10:00'), ('11:00', '12:00')])
+def test_back_to_back_bookings_do_not_conflict(client, standup, auth, start: str, end: str) -> None:
+    assert check(client, auth('bob'), start, end, room='Atlas') == []
+    assert book(client, auth('bob'), start, end).status_code == 201
+
+@pytest.mark.parametrize('start, end', [('09:00', '10:01'), ('10:59', '12:00'), ('10:15', '10:45'), ('09:00', '12:00')])
+def test_overlapping_room_booking_conflicts(client, standup, auth, start: str, end: str) -> None:
+    conflicts = check(client, auth('bob'), start, end, room='Atlas')
+    assert [(conflict['room'], conflict['people']) for conflict in conflicts] == [(True, [])]
+    response = book(client, auth('bob'), start, end)
+    assert response.status_code == 409
+    assert Meeting.query.count() == 1
+
+def test_people_conflict_in_another_room(client, standup, auth) -> None:
+    assert check(client, auth('bob'), '10:30', '11:30', room='Borealis') == []
+    conflicts = check(client, auth('bob'), '10:30', '11:30', room='Borealis', attendees='carol')
+    assert [(conflict['room'], conflict['people']) for conflict in conflicts] == [(False, ['carol'])]
+    # The organizer counts as a participant too
+    assert len(check(client, auth('alice'), '10:30', '11:30', room='Borealis')) == 1
+
+def test_force_books_despite_conflict(client, standup, auth) -> None:
+    assert book(client, auth('bob'), '10:00', '11:00').status_code == 409
+    assert book(client, auth('bob'), '10:00', '11:00', force=True).status_code == 201
+
+def test_later_series_occurrence_conflicts_with_one_off(client, users, auth) -> None:
+    # 2026-01-05 is a Monday; the third weekly occurrence falls on 2026-01-19
+    assert book(client, auth('alice'), '10:00', '11:00', date='2026-01-19').status_code == 201
+    response = book(client, auth('bob'), '10:30', '11:30', recurrence='FREQ=WEEKLY;BYDAY=MO;COUNT=4')
+    assert response.status_code == 409
+    assert [conflict['meeting']['date'] for conflict in response.get_json()['conflicts']] == ['2026-01-19']
+    assert book(client, auth('bob'), '10:30', '11:30', recurrence='FREQ=WEEKLY;BYDAY=MO;COUNT=2').status_code == 201
+
+def test_one_off_conflicts_with_existing_series_occurrence(client, users, auth) -> None:
+    assert book(client, auth('alice'), '10:00', '11:00', recurrence='FREQ=WEEKLY;BYDAY=MO').status_code == 201
+    conflicts = check(client, auth('bob'), '10:30', '11:30', date='2026-02-02', room='Atlas')
+    assert [conflict['meeting']['date'] for conflict in conflicts] == ['2026-02-02']
+    assert check(client, auth('bob'), '10:30', '11:30', date='2026-02-03', room='Atlas') == []
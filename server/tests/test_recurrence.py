@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import (
+    app, db, User, Meeting, MeetingException, RecurrenceRule, drop_orphaned_exceptions, expand_series,
+    set_meeting_recurrence
+)
+
+# 2026-01-05 is a Monday
+MONDAY = datetime(2026, 1, 5, 9, 0)
+WEDNESDAY = MONDAY + timedelta(days=2)
+
+def days(*offsets: int) -> list:
+    """Starts at 09:00 on the given days after MONDAY."""
+    return [MONDAY + timedelta(days=offset) for offset in offsets]
+
+def test_byday_starts_on_first_listed_day_after_dtstart() -> None:
+    rule = RecurrenceRule('FREQ=WEEKLY;BYDAY=MO,FR')
+    occurrences = rule.occurrences(WEDNESDAY)
+    assert [next(occurrences) for _ in range(4)] == days(4, 7, 11, 14)
+
+def test_byday_includes_dtstart_on_listed_day() -> None:
+    rule = RecurrenceRule('FREQ=WEEKLY;BYDAY=WE,FR;COUNT=3')
+    assert list(rule.occurrences(WEDNESDAY)) == days(2, 4, 9)
+
+def test_count_starts_counting_at_first_generated_occurrence() -> None:
+    rule = RecurrenceRule('FREQ=WEEKLY;BYDAY=MO,FR;COUNT=3')
+    assert list(rule.occurrences(WEDNESDAY)) == days(4, 7, 11)
+    assert rule.series_end(WEDNESDAY, timedelta(minutes=30)) == days(11)[0] + timedelta(minutes=30)
+
+@pytest.mark.parametrize('text', [
+    'FREQ=WEEKLY;BYDAY=MO,WE,FR;COUNT=20',
+    'FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,TH;COUNT=15',
+    'FREQ=DAILY;INTERVAL=3;COUNT=12',
+    'FREQ=MONTHLY;COUNT=8'
+])
+def test_window_matches_full_expansion(text: str) -> None:
+    rule = RecurrenceRule(text)
+    everything = list(rule.occurrences(WEDNESDAY))
+    assert len(everything) == rule.count
+    for after in everything[::3] + [everything[-1] + timedelta(hours=1)]:
+        before = after + timedelta(days=10)
+        assert list(rule.occurrences(WEDNESDAY, after, before)) == [
+            start for start in everything if after <= start < before
+        ]
+    assert rule.series_end(WEDNESDAY, timedelta(hours=1)) == everything[-1] + timedelta(hours=1)
+
+def test_until_date_includes_that_whole_day() -> None:
+    rule = RecurrenceRule('FREQ=DAILY;UNTIL=20260108')
+    assert list(rule.occurrences(MONDAY)) == days(0, 1, 2, 3)
+
+def test_until_datetime_is_inclusive() -> None:
+    rule = RecurrenceRule('FREQ=WEEKLY;BYDAY=MO,TH;UNTIL=20260115T090000Z')
+    assert list(rule.occurrences(MONDAY)) == days(0, 3, 7, 10)
+
+def test_monthly_skips_months_without_the_day() -> None:
+    first = datetime(2026, 1, 31, 9, 0)
+    rule = RecurrenceRule('FREQ=MONTHLY;COUNT=3')
+    assert list(rule.occurrences(first)) == [first, first.replace(month=3), first.replace(month=5)]
+
+def test_daily_byday_is_normalized_to_weekly() -> None:
+    assert str(RecurrenceRule('freq=daily;byday=fr,mo')) == 'FREQ=WEEKLY;BYDAY=MO,FR'
+
+@pytest.mark.parametrize('text', [
+    'FREQ=YEARLY',
+    'FREQ=WEEKLY;BYDAY=XX',
+    'FREQ=WEEKLY;COUNT=0',
+    'FREQ=MONTHLY;BYDAY=MO',
+    'FREQ=DAILY;INTERVAL=2;BYDAY=MO',
+    'FREQ=WEEKLY;BYMONTH=1',
+    'FREQ=WEEKLY;FREQ=DAILY'
+])
+def test_unsupported_rules_are_rejected(text: str) -> None:
+    with pytest.raises(ValueError):
+        RecurrenceRule(text)
+
+@pytest.fixture
+def series() -> Meeting:
+    """A half hour daily meeting on five days from MONDAY."""
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        db.session.add(User(id='organizer', name='Organizer', email='organizer@example.com', password_hash='x'))
+        meeting = Meeting(title='Standup', starts_at=MONDAY, ends_at=MONDAY + timedelta(minutes=30),
+                          room='Room A', organizer_id='organizer')
+        set_meeting_recurrence(meeting, 'FREQ=DAILY;COUNT=5')
+        db.session.add(meeting)
+        db.session.commit()
+        yield meeting
+        db.session.remove()
+
+def test_exceptions_cancel_and_move_occurrences(series: Meeting) -> None:
+    moved_to = days(2)[0] + timedelta(hours=6)
+    series.exceptions = [
+        MeetingException(original_start=days(1)[0], cancelled=True),
+        MeetingException(original_start=days(2)[0], starts_at=moved_to, ends_at=moved_to + timedelta(hours=1),
+                         title='Moved standup')
+    ]
+    db.session.commit()
+
+    occurrences = list(expand_series([series], MONDAY, MONDAY + timedelta(days=7)))
+    assert [occurrence.starts_at for occurrence in occurrences] == [days(0)[0], moved_to] + days(3, 4)
+    assert [occurrence.original_start for occurrence in occurrences] == days(0, 2, 3, 4)
+    assert [occurrence.title for occurrence in occurrences] == ['Standup', 'Moved standup', 'Standup', 'Standup']
+
+def test_exception_moved_into_window_is_included(series: Meeting) -> None:
+    moved_to = days(7)[0]
+    series.exceptions = [MeetingException(original_start=days(4)[0], starts_at=moved_to,
+                                          ends_at=moved_to + timedelta(minutes=30))]
+    db.session.commit()
+
+    occurrences = list(expand_series([series], days(7)[0], days(8)[0]))
+    assert [(occurrence.original_start, occurrence.starts_at) for occurrence in occurrences] == [(days(4)[0], moved_to)]
+
+def test_orphaned_exceptions_are_dropped_when_the_rule_changes(series: Meeting) -> None:
+    series.exceptions = [MeetingException(original_start=start, cancelled=True) for start in days(1, 4)]
+    set_meeting_recurrence(series, 'FREQ=DAILY;COUNT=3')
+    drop_orphaned_exceptions(series)
+    assert [exception.original_start for exception in series.exceptions] == days(1)
+
+    set_meeting_recurrence(series, None)
+    drop_orphaned_exceptions(series)
+    assert series.exceptions == []
@@ -0,0 +1,38 @@
+from datetime import timedelta
+
+import pytest
+
+from app import app, db, Message, WorkItemTag, MeetingAttendee
+from seed import SEED_ANCHOR, SEED_CHUNK_SIZE, seed_database
+
+@pytest.fixture
+def foreign_keys() -> None:
+    """Enforce foreign keys on new SQLite connections, as Postgres always does."""
+    pragmas = app.config['SQLITE_PRAGMAS']
+    with app.app_context():
+        pragmas['foreign_keys'] = 'ON'
+        db.engine.dispose()
+        yield
+        del pragmas['foreign_keys']
+        db.session.remove()
+        db.engine.dispose()
+
+def test_child_rows_past_a_chunk_satisfy_foreign_keys(foreign_keys: None) -> None:
+    counts = seed_database(users=20, messages=0, work_items=SEED_CHUNK_SIZE + 500, meetings=SEED_CHUNK_SIZE // 2,
+                           gaze_samples=0, files=0)
+    assert counts['work_item_tag'] == db.session.query(WorkItemTag).count() > SEED_CHUNK_SIZE
+    assert counts['meeting_attendee'] == db.session.query(MeetingAttendee).count() > SEED_CHUNK_SIZE
+
+def test_same_seed_gives_same_rows() -> None:
+    def snapshot() -> list:
+        seed_database(users=5, messages=50, work_items=20, meetings=10, gaze_samples=100, files=3)
+        return [db.session.execute(table.select().order_by(*table.primary_key.columns)).all()
+                for table in db.metadata.sorted_tables if table.name != 'table_version']
+
+    with app.app_context():
+        first = snapshot()
+        assert snapshot() == first
+        # Relative to the fixed anchor, not to the day the test runs
+        newest = db.session.query(db.func.max(Message.timestamp)).scalar()
+        assert SEED_ANCHOR - timedelta(days=30) < newest < SEED_ANCHOR + timedelta(days=1)
+        db.session.remove()
@@ -0,0 +1,47 @@
+import re
+
+import pytest
+from sqlalchemy import event
+
+from app import db, FileAttachment, WorkItem
+
+ATTACHMENT_DATA = re.compile(r'file_attachment\.data\b')
+
+@pytest.fixture
+def work_items(users) -> None:
+    """60 work items spread over both users, most with attachments."""
+    for i in range(60):
+        item = WorkItem(title=f'Task {i}', created_by=users[i % 2], assigned_to=users[(i + 1) % 2] if i % 3 else None)
+        item.attachments = [
+            FileAttachment(filename=f'{i}-{n}.txt', file_type='text/plain', file_size=4,
+                           data='data:text/plain;base64,dGVzdA==', uploader_id=users[0])
+            for n in range(i % 4)
+        ]
+        db.session.add(item)
+    db.session.commit()
+
+def list_statements(client, headers: dict, per_page: int) -> list:
+    """SQL sent while serving one page of work items."""
+    statements = []
+    def record(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+    db.session.remove()
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        response = client.get(f'/api/work-items?page=1&perPage={per_page}', headers=headers)
+        assert response.status_code == 200
+        assert len(response.get_json()) == per_page
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+    return statements
+
+def test_page_size_does_not_change_query_count(client, work_items, auth) -> None:
+    headers = auth('alice')
+    small = list_statements(client, headers, 5)
+    large = list_statements(client, headers, 50)
+    assert len(small) == len(large) <= 8
+
+def test_attachment_data_is_never_selected(client, work_items, auth) -> None:
+    statements = list_statements(client, auth('alice'), 50)
+    assert any('file_attachment' in statement for statement in statements)
+    assert not [statement for statement in statements if ATTACHMENT_DATA.search(statement)]
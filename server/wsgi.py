@@ -0,0 +1,11 @@
+# Production entry point. The debugger and reloader of `python app.py` are
+# never enabled here.
+#
+# Usage:
+#   gunicorn -c gunicorn.conf.py wsgi:application                 (Linux/macOS)
+#   waitress-serve --listen=127.0.0.1:5000 --threads=8 wsgi:application   (Windows)
+
+from app import app as application
+
+# Some tools look for `app` by default
+app = application
@@ -444,52 +444,25 @@ export default function Dashboard() {
     setIsLoading(true);
     setError(null);
     try {
-      // Fetch chart data for different chart types
-      const [tasksRes, performanceRes, workItemsRes, teamRes, activitiesRes, projectsRes] = await Promise.all([
-        chartDataService.getAll('tasks'),
-        chartDataService.getAll('performance'),
-        chartDataService.getAll('work_items'),
-        chartDataService.getAll('team'),
-        chartDataService.getAll('activities'),
-        chartDataService.getAll('projects')
+      // Fetch all dashboard chart types in a single request
+      const { data: charts } = await chartDataService.getBatch([
+        'tasks', 'performance', 'work_items', 'team', 'activities', 'projects'
       ]);
 
-      // Process and set data
-      if (tasksRes.data && tasksRes.data.length > 0) {
-        setPendingTasksData(JSON.parse(tasksRes.data[0].data));
-      } else {
-        setPendingTasksData(pendingTasks); // Fallback to mock data
-      }
-
-      if (performanceRes.data && performanceRes.data.length > 0) {
-        setPerformanceData(JSON.parse(performanceRes.data[0].data));
-      } else {
-        setPerformanceData(performanceData); // Fallback to mock data
-      }
-
-      if (workItemsRes.data && workItemsRes.data.length > 0) {
-        setCompletedWorkItemsData(JSON.parse(workItemsRes.data[0].data));
-      } else {
-        setCompletedWorkItemsData(completedWorkItems); // Fallback to mock data
-      }
-
-      if (teamRes.data && teamRes.data.length > 0) {
-        setTeamMembersData(JSON.parse(teamRes.data[0].data));
-      } else {
-        setTeamMembersData(teamMembers); // Fallback to mock data
-      }
-
-      if (activitiesRes.data && activitiesRes.data.length > 0) {
-        setRecentActivitiesData(JSON.parse(activitiesRes.data[0].data));
-      } else {
-        setRecentActivitiesData(recentActivities); // Fallback to mock data
-      }
-
-      if (projectsRes.data && projectsRes.data.length > 0) {
-        setProjectSummariesData(JSON.parse(projectsRes.data[0].data));
-      } else {
-        setProjectSummariesData(projectSummaries); // Fallback to mock data
-      }
+      // Chart payloads may arrive already decoded or as JSON strings
+      const firstChartData = (type: string) => {
+        const chart = charts[type] && charts[type][0];
+        if (!chart) return null;
+        return typeof chart.data === 'string' ? JSON.parse(chart.data) : chart.data;
+      };
+
+      // Process and set data, falling back to mock data for missing types
+      setPendingTasksData(firstChartData('tasks') ?? pendingTasks);
+      setPerformanceData(firstChartData('performance') ?? performanceData);
+      setCompletedWorkItemsData(firstChartData('work_items') ?? completedWorkItems);
+      setTeamMembersData(firstChartData('team') ?? teamMembers);
+      setRecentActivitiesData(firstChartData('activities') ?? recentActivities);
+      setProjectSummariesData(firstChartData('projects') ?? projectSummaries);
 
     } catch (err: any) {
       console.error('Failed to fetch dashboard data:', err);
@@ -48,9 +48,9 @@ import {
 } from '@mui/icons-material';
 import Calendar from './Calendar';
 import RoomSelector from './RoomSelector';
-import { Meeting, User } from './types';
+import { Meeting, Room, User } from './types';
 import { useAuth } from './contexts/AuthContext';
-import api, { meetingsService, usersApi } from './services/api';
+import api, { meetingsService, roomsService, usersApi } from './services/api';
 
 interface MeetingSchedulerProps {
   onMeetingScheduled?: (meeting: Meeting) => void;
@@ -72,6 +72,7 @@ export default function MeetingScheduler({ onMeetingScheduled, onClose }: Meetin
   });
   const [meetings, setMeetings] = useState<Meeting[]>([]);
   const [selectedRoom, setSelectedRoom] = useState<string>('');
+  const [rooms, setRooms] = useState<Room[] | null>(null);
   const [showSuccess, setShowSuccess] = useState(false);
   const [openDialog, setOpenDialog] = useState(false);
   const [loading, setLoading] = useState(false);
@@ -136,6 +137,14 @@ export default function MeetingScheduler({ onMeetingScheduled, onClose }: Meetin
       attendees: attendeesList
     }));
     
+    // Load room availability for the chosen slot
+    setRooms(null);
+    if (newMeeting.date && newMeeting.startTime && newMeeting.endTime) {
+      roomsService.list({ date: newMeeting.date, startTime: newMeeting.startTime, endTime: newMeeting.endTime })
+        .then(response => setRooms(response.data))
+        .catch(err => console.error('Failed to fetch room availability:', err));
+    }
+
     // Move to next step
     handleNext();
     
@@ -405,7 +414,9 @@ export default function MeetingScheduler({ onMeetingScheduled, onClose }: Meetin
       case 0:
         return <ManualMeetingForm />;
       case 1:
-        return <RoomSelector onRoomSelected={handleRoomSelected} />;
+        return rooms
+          ? <RoomSelector key="live" onRoomSelected={handleRoomSelected} initialRooms={rooms} />
+          : <RoomSelector key="default" onRoomSelected={handleRoomSelected} />;
       case 2:
         return (
           <Box sx={{ p: 2 }}>
@@ -47,8 +47,8 @@ import {
   Save as SaveIcon,
   Message as MessageIcon
 } from '@mui/icons-material';
-import { ChartData } from './types';
-import { chartDataService, messagesService, workItemsService, meetingsService } from './services/api'; // Removed 'api', added workItemsService, meetingsService
+import { ChartData, AnalyticsSummary } from './types';
+import { chartDataService, messagesService, analyticsService } from './services/api';
 import { useAuth } from './contexts/AuthContext';
 import { SelectChangeEvent } from "@mui/material";
 
@@ -71,9 +71,7 @@ export default function ProjectAnalytics() {
   const [selectedChartType, setSelectedChartType] = useState<string>('all');
   const [openDialog, setOpenDialog] = useState(false);
   const [editingChart, setEditingChart] = useState<Partial<ChartData> | null>(null);
-  const [workItems, setWorkItems] = useState<any[]>([]);
-  const [meetings, setMeetings] = useState<any[]>([]);
-  const [messages, setMessages] = useState<any[]>([]);
+  const [analytics, setAnalytics] = useState<AnalyticsSummary | null>(null);
   const [tabValue, setTabValue] = useState(0);
   const { user } = useAuth();
   const [teamSentiment, setTeamSentiment] = useState<any>(null);
@@ -170,27 +168,12 @@ export default function ProjectAnalytics() {
 
   const fetchRelatedData = useCallback(async () => {
     try {
-      // Use service wrappers for consistency
-      const [workItemsRes, meetingsRes, messagesRes] = await Promise.all([
-        workItemsService.getAll(),
-        meetingsService.getAll(),
-        messagesService.getAll()
-      ]);
-      
-      console.log('API Responses:', {
-        workItems: workItemsRes.data,
-        meetings: meetingsRes.data,
-        messages: messagesRes.data
-      });
-      
-      setWorkItems(Array.isArray(workItemsRes.data) ? workItemsRes.data : []);
-      setMeetings(Array.isArray(meetingsRes.data) ? meetingsRes.data : []);
-      setMessages(Array.isArray(messagesRes.data) ? messagesRes.data : []);
+      // Aggregates are computed server-side; only the counts come back
+      const response = await analyticsService.get();
+      setAnalytics(response.data);
     } catch (err: any) {
-      console.error('Failed to fetch related data:', err);
-      setWorkItems([]);
-      setMeetings([]);
-      setMessages([]);
+      console.error('Failed to fetch analytics:', err);
+      setAnalytics(null);
     }
   }, []);
 
@@ -291,7 +274,7 @@ export default function ProjectAnalytics() {
 
   // Generate work status chart data with explicit return type
   const generateWorkStatusData = (): ChartPoint[] => {
-    if (!workItems || !Array.isArray(workItems) || workItems.length === 0) {
+    if (!analytics || analytics.workStatus.length === 0) {
       // Return mock data if no work items available
       return [
         { name: 'Todo', value: 14 },
@@ -301,20 +284,15 @@ export default function ProjectAnalytics() {
       ];
     }
 
-    const statusCounts = workItems.reduce((acc: Record<string, number>, item) => {
-      acc[item.status] = (acc[item.status] || 0) + 1;
-      return acc;
-    }, {});
-    
-    return Object.entries(statusCounts).map(([status, count]) => ({
-      name: status.replace('-', ' '),
-      value: count
+    return analytics.workStatus.map(({ name, value }) => ({
+      name: name.replace('-', ' '),
+      value
     }));
   };
 
   // Generate work priority chart data with explicit return type
   const generateWorkPriorityData = (): ChartPoint[] => {
-    if (!workItems || !Array.isArray(workItems) || workItems.length === 0) {
+    if (!analytics || analytics.workPriority.length === 0) {
       // Return mock data if no work items available
       return [
         { name: 'High', value: 8 },
@@ -323,20 +301,12 @@ export default function ProjectAnalytics() {
       ];
     }
 
-    const priorityCounts = workItems.reduce((acc: Record<string, number>, item) => {
-      acc[item.priority] = (acc[item.priority] || 0) + 1;
-      return acc;
-    }, {});
-    
-    return Object.entries(priorityCounts).map(([priority, count]) => ({
-      name: priority,
-      value: count
-    }));
+    return analytics.workPriority;
   };
 
   // Generate meeting trend data by date with explicit return type
   const generateMeetingTrendData = (): ChartPoint[] => {
-    if (!meetings || !Array.isArray(meetings) || meetings.length === 0) {
+    if (!analytics || analytics.meetingTrend.length === 0) {
       // Return mock data if no meetings available
       const today = new Date();
       return [
@@ -350,24 +320,13 @@ export default function ProjectAnalytics() {
       ];
     }
 
-    // Create a map of dates and count meetings on each date
-    const meetingsByDate = meetings.reduce((acc: Record<string, number>, meeting) => {
-      acc[meeting.date] = (acc[meeting.date] || 0) + 1;
-      return acc;
-    }, {});
-    
-    // Sort dates and create the trend data
-    return Object.entries(meetingsByDate)
-      .sort(([dateA], [dateB]) => new Date(dateA).getTime() - new Date(dateB).getTime())
-      .map(([date, count]) => ({
-        date,
-        meetings: count
-      }));
+    // Already sorted by date on the server
+    return analytics.meetingTrend;
   };
 
   // Generate message sentiment data with explicit return type
   const generateMessageSentimentData = (): ChartPoint[] => {
-    if (!messages || !Array.isArray(messages) || messages.length === 0) {
+    if (!analytics || analytics.messageSentiment.length === 0) {
       // Return mock data if no messages available
       return [
         { name: 'Positive', value: 35 },
@@ -376,17 +335,7 @@ export default function ProjectAnalytics() {
       ];
     }
 
-    const sentimentCounts = messages.reduce((acc: Record<string, number>, message) => {
-      if (message.sentiment) {
-        acc[message.sentiment] = (acc[message.sentiment] || 0) + 1;
-      }
-      return acc;
-    }, {});
-    
-    return Object.entries(sentimentCounts).map(([sentiment, count]) => ({
-      name: sentiment,
-      value: count
-    }));
+    return analytics.messageSentiment;
   };
 
   // Generate predefined chart data based on the selected tab
@@ -82,8 +82,12 @@ function TabPanel(props: TabPanelProps) {
   );
 }
 
+const WORK_ITEM_STATUSES: WorkItemStatus[] = ['todo', 'in-progress', 'review', 'done'];
+
 export default function WorkTracker() {
   const [workItems, setWorkItems] = useState<WorkItem[]>([]);
+  const [statusCounts, setStatusCounts] = useState<Record<string, number>>({});
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [users, setUsers] = useState<User[]>([]);
   const [openDialog, setOpenDialog] = useState(false);
   const [editingItem, setEditingItem] = useState<Partial<WorkItem> | null>(null);
@@ -93,21 +97,44 @@ export default function WorkTracker() {
   const [tagInput, setTagInput] = useState('');
   const { user } = useAuth();
   const [tabValue, setTabValue] = useState(0);
+  const activeStatus = WORK_ITEM_STATUSES[tabValue];
   const [workItemAttachments, setWorkItemAttachments] = useState<FileAttachment[]>([]);
   const [attachmentsOpen, setAttachmentsOpen] = useState(false);
 
+  // Load per-status totals and the first page of the active column only
   const fetchWorkItems = useCallback(async () => {
     setLoading(true);
     setError('');
     try {
-      const response = await workItemsService.getAll();
-      setWorkItems(response.data);
+      const [countsRes, itemsRes] = await Promise.all([
+        workItemsService.counts('status'),
+        workItemsService.list({ status: activeStatus })
+      ]);
+      setStatusCounts(countsRes.data.counts);
+      setWorkItems(itemsRes.data);
+      setNextCursor(itemsRes.headers['x-next-cursor'] || null);
     } catch (err: any) {
       setError(err.message || 'Failed to fetch work items');
     } finally {
       setLoading(false);
     }
-  }, []);
+  }, [activeStatus]);
+
+  const fetchMoreWorkItems = async () => {
+    if (!nextCursor) return;
+    setLoading(true);
+    try {
+      const response = await workItemsService.list({ status: activeStatus, cursor: nextCursor });
+      setWorkItems(prev => [...prev, ...response.data]);
+      setNextCursor(response.headers['x-next-cursor'] || null);
+    } catch (err: any) {
+      setError(err.message || 'Failed to fetch work items');
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  const totalWorkItems = Object.values(statusCounts).reduce((sum, count) => sum + count, 0);
 
   const fetchUsers = useCallback(async () => {
     try {
@@ -332,21 +359,13 @@ export default function WorkTracker() {
     }
   };
 
-  // Group work items by status
-  const groupedWorkItems = workItems.reduce((acc, item) => {
-    if (!acc[item.status]) {
-      acc[item.status] = [];
-    }
-    acc[item.status].push(item);
-    return acc;
-  }, {} as Record<string, WorkItem[]>);
-
   const handleTabChange = (event: React.SyntheticEvent, newValue: number) => {
     setTabValue(newValue);
   };
   
+  // Only the active status column is loaded, already filtered on the server
   const filterItemsByStatus = (status: string) => {
-    return workItems.filter(item => item.status === status);
+    return status === activeStatus ? workItems : [];
   };
 
   const handleSelectChange = (e: SelectChangeEvent) => {
@@ -420,25 +439,25 @@ export default function WorkTracker() {
           </Alert>
         )}
 
-        {loading && !workItems.length ? (
+        {loading && !totalWorkItems ? (
           <Box sx={{ display: 'flex', justifyContent: 'center', p: 3 }}>
             <CircularProgress />
           </Box>
-        ) : workItems.length === 0 ? (
+        ) : totalWorkItems === 0 ? (
           <Alert severity="info">No work items found. Click "Add Work Item" to create one.</Alert>
         ) : (
           <Tabs value={tabValue} onChange={handleTabChange}>
-            {(['todo', 'in-progress', 'review', 'done'] as WorkItemStatus[]).map((status, index) => (
-              <Tab key={index} label={status.replace('-', ' ')} />
+            {WORK_ITEM_STATUSES.map((status, index) => (
+              <Tab key={index} label={`${status.replace('-', ' ')} (${statusCounts[status] || 0})`} />
             ))}
           </Tabs>
         )}
       </Paper>
 
       {/* Tab panels for work items by status */}
-      {!loading && workItems.length > 0 && (
+      {totalWorkItems > 0 && (
         <Box sx={{ mt: 2 }}>
-          {(['todo', 'in-progress', 'review', 'done'] as WorkItemStatus[]).map((status, index) => (
+          {WORK_ITEM_STATUSES.map((status, index) => (
             <TabPanel key={index} value={tabValue} index={index}>
               <Grid container spacing={2}>
                 {filterItemsByStatus(status).map((item) => (
@@ -550,13 +569,20 @@ export default function WorkTracker() {
                     </Card>
                   </Grid>
                 ))}
-                {filterItemsByStatus(status).length === 0 && (
+                {!loading && filterItemsByStatus(status).length === 0 && (
                   <Grid item xs={12}>
                     <Alert severity="info">
                       No work items in this status. Click "Add Work Item" to create one.
                     </Alert>
                   </Grid>
                 )}
+                {nextCursor && status === activeStatus && (
+                  <Grid item xs={12} sx={{ display: 'flex', justifyContent: 'center' }}>
+                    <Button onClick={fetchMoreWorkItems} disabled={loading}>
+                      Load more
+                    </Button>
+                  </Grid>
+                )}
               </Grid>
             </TabPanel>
           ))}
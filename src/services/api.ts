@@ -1,5 +1,5 @@
 import axios, { AxiosResponse } from 'axios'; // Import AxiosResponse
-import { User, Message, FileAttachment, Meeting, WorkItem, ChartData, TeamSentimentAnalysis } from '../types'; // Import necessary types, including TeamSentimentAnalysis
+import { User, Message, FileAttachment, Meeting, MeetingConflict, Room, AvailabilityResult, WorkItem, ChartData, TeamSentimentAnalysis, AnalyticsSummary } from '../types'; // Import necessary types, including TeamSentimentAnalysis
 
 // Define base URL without /api
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:5000'; 
@@ -125,18 +125,61 @@ export const usersApi = {
 // API services - Add /api prefix and improve type safety
 export const meetingsService = {
   getAll: (): Promise<AxiosResponse<Meeting[]>> => api.get('/api/meetings'),
+  getRange: (from: string, to: string, params: { room?: string; attendee?: string } = {}): Promise<AxiosResponse<Meeting[]>> =>
+    api.get('/api/meetings', { params: { from, to, ...params } }),
+  checkConflicts: (slot: { date: string; startTime: string; endTime: string; room?: string; attendees?: string[]; excludeId?: number }): Promise<AxiosResponse<{ conflicts: MeetingConflict[] }>> =>
+    api.get('/api/meetings/conflicts', { params: { ...slot, attendees: slot.attendees?.join(',') } }),
   getById: (id: number): Promise<AxiosResponse<Meeting>> => api.get(`/api/meetings/${id}`),
   create: (meeting: Partial<Meeting>): Promise<AxiosResponse<Meeting>> => api.post('/api/meetings', meeting),
   update: (id: number, meeting: Partial<Meeting>): Promise<AxiosResponse<Meeting>> => api.put(`/api/meetings/${id}`, meeting),
-  delete: (id: number): Promise<AxiosResponse<{ message: string }>> => api.delete(`/api/meetings/${id}`)
+  delete: (id: number): Promise<AxiosResponse<{ message: string }>> => api.delete(`/api/meetings/${id}`),
+  updateOccurrence: (id: number, occurrenceStart: string, changes: Partial<Meeting> & { cancelled?: boolean }): Promise<AxiosResponse<Meeting>> =>
+    api.put(`/api/meetings/${id}/occurrences/${encodeURIComponent(occurrenceStart)}`, changes),
+  cancelOccurrence: (id: number, occurrenceStart: string): Promise<AxiosResponse<{ message: string }>> =>
+    api.delete(`/api/meetings/${id}/occurrences/${encodeURIComponent(occurrenceStart)}`),
+  getFeedUrl: (): Promise<AxiosResponse<{ url: string }>> =>
+    api.get('/api/meetings/feed-url'),
+  rotateFeedUrl: (): Promise<AxiosResponse<{ url: string }>> =>
+    api.post('/api/meetings/feed-url/rotate')
 };
 
+export const roomsService = {
+  list: (slot?: { date: string; startTime: string; endTime: string }): Promise<AxiosResponse<Room[]>> =>
+    api.get('/api/rooms', { params: slot }),
+  findAvailability: (query: { duration: number; attendees?: string[]; from?: string; to?: string; dayStart?: string; dayEnd?: string; step?: number; rooms?: string[]; needsRoom?: boolean; limit?: number }): Promise<AxiosResponse<AvailabilityResult>> =>
+    api.get('/api/availability', { params: { ...query, attendees: query.attendees?.join(','), rooms: query.rooms?.join(',') } })
+};
+
+// Server-side filters, sort and keyset cursor for work item lists
+export interface WorkItemQuery {
+  status?: string;
+  priority?: string;
+  assignee?: string;
+  tag?: string;
+  dueFrom?: string;
+  dueTo?: string;
+  sort?: string; // 'id' | 'createdAt' | 'updatedAt' | 'dueDate', '-' prefix for descending
+  cursor?: string;
+  limit?: number;
+}
+
 export const workItemsService = {
   getAll: (): Promise<AxiosResponse<WorkItem[]>> => api.get('/api/work-items'),
+  // One page of matching items; the next cursor comes back in the X-Next-Cursor header
+  list: (query: WorkItemQuery): Promise<AxiosResponse<WorkItem[]>> =>
+    api.get('/api/work-items', { params: { limit: 50, ...query } }),
+  // Per-group totals without row payloads
+  counts: (groupBy: 'status' | 'priority' | 'assignee', query: WorkItemQuery = {}): Promise<AxiosResponse<{ counts: Record<string, number>; total: number }>> =>
+    api.get('/api/work-items', { params: { ...query, counts: groupBy } }),
   getById: (id: number): Promise<AxiosResponse<WorkItem>> => api.get(`/api/work-items/${id}`),
   create: (workItem: Partial<WorkItem>): Promise<AxiosResponse<WorkItem>> => api.post('/api/work-items', workItem),
   update: (id: number, workItem: Partial<WorkItem>): Promise<AxiosResponse<WorkItem>> => api.put(`/api/work-items/${id}`, workItem),
-  delete: (id: number): Promise<AxiosResponse<{ message: string }>> => api.delete(`/api/work-items/${id}`)
+  delete: (id: number): Promise<AxiosResponse<{ message: string }>> => api.delete(`/api/work-items/${id}`),
+  // Apply many patches in one transaction; each item reports updated/forbidden/not_found/invalid
+  bulkUpdate: (patches: ({ id: number } & Record<string, any>)[], atomic = false): Promise<AxiosResponse<{
+    updated: number;
+    results: { id: number; status: string; error?: string }[];
+  }>> => api.post('/api/work-items/bulk', { patches, atomic })
 };
 
 export const messagesService = {
@@ -150,12 +193,26 @@ export const messagesService = {
 
 export const chartDataService = {
   getAll: (type?: string): Promise<AxiosResponse<ChartData[]>> => api.get('/api/chart-data', { params: { type } }),
+  // Several chart types in one round-trip, keyed by chart type
+  getBatch: (types: string[]): Promise<AxiosResponse<Record<string, ChartData[]>>> => api.get('/api/chart-data/batch', { params: { types: types.join(',') } }),
   getById: (id: number): Promise<AxiosResponse<ChartData>> => api.get(`/api/chart-data/${id}`),
   create: (chartData: Partial<ChartData>): Promise<AxiosResponse<ChartData>> => api.post('/api/chart-data', chartData),
   update: (id: number, chartData: Partial<ChartData>): Promise<AxiosResponse<ChartData>> => api.put(`/api/chart-data/${id}`, chartData),
   delete: (id: number): Promise<AxiosResponse<{ message: string }>> => api.delete(`/api/chart-data/${id}`)
 };
 
+export const analyticsService = {
+  // Optional ISO date range (inclusive) and list of team member IDs
+  get: (filters: { from?: string; to?: string; team?: string[] } = {}): Promise<AxiosResponse<AnalyticsSummary>> =>
+    api.get('/api/analytics', {
+      params: {
+        from: filters.from,
+        to: filters.to,
+        team: filters.team && filters.team.length > 0 ? filters.team.join(',') : undefined
+      }
+    })
+};
+
 export const usersService = {
   // Assuming backend returns User[]
   getAll: (): Promise<AxiosResponse<User[]>> => api.get('/api/users'), 
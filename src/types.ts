@@ -64,13 +64,42 @@ export interface Meeting {
   date: string;
   startTime: string;
   endTime: string;
+  startsAt?: string;
+  endsAt?: string;
   room: string;
   organizer: User;
   attendees: string[];
   notes: string;
+  recurrence?: string | null;
+  occurrenceStart?: string;
   createdAt: string;
 }
 
+export interface MeetingConflict {
+  meeting: Meeting;
+  room: boolean;
+  people: string[];
+}
+
+export interface Room {
+  id: string;
+  name: string;
+  capacity: number;
+  equipment: string[];
+  isAvailable: boolean;
+  currentMeeting?: {
+    title: string;
+    startTime: string;
+    endTime: string;
+    attendees: string[];
+  };
+}
+
+export interface AvailabilityResult {
+  freeWindows: { start: string; end: string }[];
+  slots: { start: string; end: string; rooms: string[] }[];
+}
+
 // Work item interface
 export interface WorkItem {
   id: number;
@@ -93,10 +122,30 @@ export interface ChartData {
   chartType: string;
   title: string;
   data: any;
+  display?: string; // Suggested rendering for computed charts ('bar', 'pie', 'line')
+  computed?: boolean;
   createdAt: string;
   updatedAt: string;
 }
 
+// Server-side aggregates for the project analytics charts
+export interface AnalyticsSummary {
+  workStatus: { name: string; value: number }[];
+  workPriority: { name: string; value: number }[];
+  meetingTrend: { date: string; meetings: number }[];
+  messageSentiment: { name: string; value: number }[];
+  totals: {
+    workItems: number;
+    meetings: number;
+    messages: number;
+  };
+  filters: {
+    from: string | null;
+    to: string | null;
+    team: string[];
+  };
+}
+
 // File attachment interface
 export interface FileAttachment {
   id: number;